@@ -8,8 +8,14 @@ metadata extraction, and data processing.
 
 Exports:
     File: The main class for interacting with different file types in a unified way.
+    FileResult: The per-path outcome yielded by `File.process_many`.
+    MetadataCache: Base class for persistent metadata caches used by `File(cache=...)`.
+    SqliteMetadataCache: SQLite-backed metadata cache.
+    ContentSummaryCache: Content-hash keyed cache of parse summaries.
 """
 
 from .file import File
+from .batch import FileResult
+from .cache import MetadataCache, SqliteMetadataCache, ContentSummaryCache
 
-__all__ = ['File']
+__all__ = ['File', 'FileResult', 'MetadataCache', 'SqliteMetadataCache', 'ContentSummaryCache']
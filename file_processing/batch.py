@@ -0,0 +1,344 @@
+"""
+Batch processing helpers for running many `File` objects through a worker pool.
+
+The public entry point is `File.process_many`, which delegates to `process_many` (or to
+`process_unique` when deduplicating) in this module. Each path is processed independently;
+failures are captured on the returned `FileResult` instead of aborting the whole batch.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from hashlib import sha256
+from pathlib import Path
+from typing import Iterable, Iterator
+import copy
+import os
+import stat
+
+from file_processing.hashing import compute_digests
+
+EXECUTORS = {
+    'process': ProcessPoolExecutor,
+    'thread': ThreadPoolExecutor,
+}
+
+
+class FileResult:
+    """
+    Outcome of processing a single path as part of a batch.
+
+    Attributes:
+        path (str): The path that was processed.
+        file (File): The processed `File` object, or None if processing failed.
+        error (Exception): The exception raised while processing, or None on success.
+    """
+
+    def __init__(self, path: str, file=None, error: Exception = None) -> None:
+        self.path = path
+        self.file = file
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """bool: True if the path was processed without raising."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = 'ok' if self.ok else f'error={self.error!r}'
+        return f"FileResult({self.path!r}, {status})"
+
+
+def _process_path(path: str, file_kwargs: dict) -> FileResult:
+    """
+    Builds and processes a `File` for a single path inside a worker.
+
+    Args:
+        path (str): The path to process.
+        file_kwargs (dict): Keyword arguments forwarded to the `File` constructor.
+
+    Returns:
+        FileResult: The processed file, or the exception raised while processing it.
+    """
+    from file_processing.file import File
+
+    try:
+        return FileResult(path, file=File(path, **file_kwargs))
+    except Exception as e:
+        return FileResult(path, error=e)
+
+
+def _collect(path: str, future) -> FileResult:
+    """
+    Unwraps a finished future, turning transport failures (e.g. unpicklable results) into results.
+
+    Args:
+        path (str): The path the future was submitted for.
+        future (Future): The completed future.
+
+    Returns:
+        FileResult: The result produced by the worker or a result wrapping the raised exception.
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        return FileResult(path, error=e)
+
+
+def process_many(paths: Iterable[str], workers: int = None, executor: str = 'process',
+                 ordered: bool = False, max_pending: int = None, **file_kwargs) -> Iterator[FileResult]:
+    """
+    Processes many paths concurrently and streams back one `FileResult` per path.
+
+    Paths are submitted through a bounded window so arbitrarily long iterables (e.g. a directory
+    walk) can be consumed without materialising every pending task up front.
+
+    Args:
+        paths (Iterable[str]): Paths to process.
+        workers (int): Number of workers. Defaults to the executor's own default.
+        executor (str): 'process' for CPU-bound extraction or 'thread' for I/O-bound file types.
+        ordered (bool): If True, yield results in input order; otherwise in completion order.
+        max_pending (int): Maximum number of submitted but unconsumed tasks. Defaults to 4x workers.
+        **file_kwargs: Keyword arguments forwarded to every `File` constructor (e.g. `open_file`).
+
+    Yields:
+        FileResult: The outcome for each input path.
+
+    Raises:
+        ValueError: If an unsupported executor is requested.
+    """
+    with _open_pool(executor, workers) as pool:
+        yield from _submit_all(pool, paths, ordered, max_pending or 4 * (workers or os.cpu_count() or 1),
+                               file_kwargs)
+
+
+def _open_pool(executor: str, workers: int):
+    """
+    Creates the worker pool named by `executor`.
+
+    Args:
+        executor (str): 'process' or 'thread'.
+        workers (int): Number of workers. Defaults to the executor's own default.
+
+    Returns:
+        Executor: A new, unstarted executor.
+
+    Raises:
+        ValueError: If an unsupported executor is requested.
+    """
+    executor_class = EXECUTORS.get(executor)
+    if executor_class is None:
+        raise ValueError(f"Unsupported executor: {executor}. Expected one of {sorted(EXECUTORS)}")
+    return executor_class(max_workers=workers)
+
+
+def _submit_all(pool, paths: Iterable[str], ordered: bool, max_pending: int,
+                file_kwargs: dict) -> Iterator[FileResult]:
+    """
+    Submits paths to an open pool through a bounded window and yields their results.
+
+    Args:
+        pool (Executor): The pool to submit to.
+        paths (Iterable[str]): Paths to process.
+        ordered (bool): If True, yield results in input order; otherwise in completion order.
+        max_pending (int): Maximum number of submitted but unconsumed tasks.
+        file_kwargs (dict): Keyword arguments forwarded to every `File` constructor.
+
+    Yields:
+        FileResult: The outcome for each input path.
+    """
+    paths = iter(paths)
+
+    def submit(path):
+        path = str(path)
+        return path, pool.submit(_process_path, path, file_kwargs)
+
+    if ordered:
+        pending = deque()
+        for path in paths:
+            pending.append(submit(path))
+            if len(pending) >= max_pending:
+                yield _collect(*pending.popleft())
+        while pending:
+            yield _collect(*pending.popleft())
+        return
+
+    pending = {}
+    for path in paths:
+        path, future = submit(path)
+        pending[future] = path
+        if len(pending) >= max_pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield _collect(pending.pop(future), future)
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield _collect(pending.pop(future), future)
+
+
+def process_unique(paths: Iterable[str], workers: int = None, executor: str = 'process',
+                   ordered: bool = False, block_size: int = 65536, **file_kwargs) -> Iterator[FileResult]:
+    """
+    Processes many paths, parsing each distinct file content only once.
+
+    Candidate duplicates are found cheaply first: paths are grouped by extension and size, then by
+    a digest of their first and last `block_size` bytes, and finally confirmed with the full
+    content hash. Both digest passes and the processing of one representative per group run on
+    the same worker pool; the representative's metadata is then copied to every other path in the
+    group, which keeps its own stat-level attributes.
+
+    Args:
+        paths (Iterable[str]): Paths to process.
+        workers (int): Number of workers. Defaults to the executor's own default.
+        executor (str): 'process' for CPU-bound extraction or 'thread' for I/O-bound file types.
+        ordered (bool): If True, yield representatives in input order; otherwise in completion order.
+                        Duplicates are always yielded directly after their representative.
+        block_size (int): Number of bytes read from each end of a file for the partial digest.
+        **file_kwargs: Keyword arguments forwarded to every `File` constructor.
+
+    Yields:
+        FileResult: The outcome for each input path.
+
+    Raises:
+        ValueError: If an unsupported executor is requested.
+    """
+    from file_processing.file import File
+
+    with _open_pool(executor, workers) as pool:
+        groups = group_duplicates(paths, block_size, pool=pool)
+        duplicates = {group[0]: group[1:] for group in groups}
+
+        for result in _submit_all(pool, (group[0] for group in groups), ordered,
+                                  4 * (workers or os.cpu_count() or 1), file_kwargs):
+            yield result
+            for path in duplicates.pop(result.path, ()):
+                if not result.ok:
+                    yield FileResult(path, error=result.error)
+                    continue
+                try:
+                    if not result.file.is_processed:
+                        yield FileResult(path, file=File(path, **file_kwargs))
+                        continue
+                    duplicate = File(path, **dict(file_kwargs, lazy=True))
+                    duplicate._load_metadata(copy.deepcopy(result.file.metadata))
+                    yield FileResult(path, file=duplicate)
+                except Exception as e:
+                    yield FileResult(path, error=e)
+
+
+def group_duplicates(paths: Iterable[str], block_size: int = 65536, pool=None) -> list:
+    """
+    Groups paths whose files have byte-identical content and the same extension.
+
+    Args:
+        paths (Iterable[str]): Paths to group.
+        block_size (int): Number of bytes read from each end of a file for the partial digest.
+        pool (Executor): Optional worker pool used to compute the partial and full digests of
+                         every candidate in one batch per pass. Digests run serially if omitted.
+
+    Returns:
+        list: Lists of paths in first-seen order; the first path of each list is its representative.
+              Paths that are missing or not regular files form singleton groups.
+    """
+    candidates = {}
+    for path in paths:
+        path = str(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            candidates[('', path)] = [path]
+            continue
+        if not stat.S_ISREG(st.st_mode):
+            candidates[('', path)] = [path]
+            continue
+        candidates.setdefault((Path(path).suffix, st.st_size), []).append(path)
+
+    size_groups = list(candidates.values())
+    partial_groups = _split_groups(size_groups, pool, _partial_digest, lambda path: (path, block_size))
+    return _split_groups(partial_groups, pool, _full_digest, lambda path: (path,))
+
+
+def _split_groups(groups: list, pool, key_func, key_args) -> list:
+    """
+    Splits every multi-path group by a per-path key, computing all keys in one batch.
+
+    Args:
+        groups (list): Lists of paths; singleton groups are passed through untouched.
+        pool (Executor): Worker pool to compute keys with, or None to compute them serially.
+        key_func (callable): Module-level function computing the grouping key for a path.
+                             Keys of paths it raises for are treated as unique.
+        key_args (callable): Builds the positional arguments of `key_func` for a path.
+
+    Returns:
+        list: Lists of paths sharing a key, preserving first-seen order.
+    """
+    pending = [path for group in groups if len(group) > 1 for path in group]
+    args = [key_args(path) for path in pending]
+    if pool is None:
+        keys = [_safe_key(key_func, *a) for a in args]
+    else:
+        keys = list(pool.map(_safe_key, [key_func] * len(args), *zip(*args)))
+    keys = dict(zip(pending, keys))
+
+    result = []
+    for group in groups:
+        if len(group) == 1:
+            result.append(group)
+            continue
+        split = {}
+        for path in group:
+            key = keys[path]
+            split.setdefault(key if key is not None else ('unreadable', path), []).append(path)
+        result.extend(split.values())
+    return result
+
+
+def _safe_key(key_func, *args):
+    """
+    Calls `key_func`, returning None instead of raising so one unreadable file cannot fail a batch.
+
+    Args:
+        key_func (callable): The key function.
+        *args: Positional arguments for `key_func`.
+
+    Returns:
+        The key, or None if `key_func` raised.
+    """
+    try:
+        return key_func(*args)
+    except Exception:
+        return None
+
+
+def _partial_digest(path: str, block_size: int) -> bytes:
+    """
+    Digests the first and last `block_size` bytes of a file as a cheap duplicate pre-check.
+
+    Args:
+        path (str): Path of the file.
+        block_size (int): Number of bytes read from each end.
+
+    Returns:
+        bytes: SHA-256 digest of the sampled blocks.
+    """
+    hasher = sha256()
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        hasher.update(f.read(block_size))
+        if size > block_size:
+            f.seek(max(block_size, size - block_size))
+            hasher.update(f.read(block_size))
+    return hasher.digest()
+
+
+def _full_digest(path: str) -> str:
+    """
+    Computes the SHA-256 digest of a file's full content.
+
+    Args:
+        path (str): Path of the file.
+
+    Returns:
+        str: Hexadecimal SHA-256 digest.
+    """
+    return compute_digests(path)['sha256']
@@ -0,0 +1,327 @@
+"""
+Persistent caching of extracted metadata.
+
+A cache sits underneath `File.process()`: before a processor parses a file, the cache is asked for
+metadata stored under the file's stat signature (absolute path, size, modification time) and the
+processor's cache token (class name, `PROCESSOR_VERSION` and any output-changing options). On a hit
+the parse is skipped entirely, so re-crawling an unchanged tree costs roughly one stat per file.
+
+Processors whose parse dominates (e.g. Python ASTs) can additionally keep a summary keyed by the
+hash of the file's content. It survives checkouts and copies that change the stat signature, so an
+unchanged file costs a read and a hash lookup instead of a parse.
+
+Exports:
+    MetadataCache: Abstract base class for cache backends.
+    SqliteMetadataCache: Default backend storing entries in a local SQLite database.
+    ContentSummaryCache: Directory of JSON summaries keyed by content hash.
+"""
+
+from abc import ABC, abstractmethod
+from hashlib import blake2b
+from pathlib import Path
+import json
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from file_processing.errors import FileProcessingFailedError
+
+
+class MetadataCache(ABC):
+    """
+    Abstract base class for metadata cache backends.
+
+    Backends store opaque metadata dicts under keys built by `make_key`, and must support
+    explicit invalidation of a path as well as clearing every entry.
+    """
+
+    @staticmethod
+    def make_key(processor) -> tuple:
+        """
+        Builds the cache key for a processor's file.
+
+        Args:
+            processor (FileProcessorStrategy): The processor whose file is being looked up.
+
+        Returns:
+            tuple: (absolute path, size, modification time in ns, processor cache token).
+        """
+        st = processor.stat_result
+        return (str(processor.absolute_path), st.st_size, st.st_mtime_ns, processor.cache_token())
+
+    @abstractmethod
+    def get(self, processor) -> dict:
+        """
+        Looks up cached metadata for the processor's file.
+
+        Args:
+            processor (FileProcessorStrategy): The processor whose file is being looked up.
+
+        Returns:
+            dict: The cached metadata, or None on a miss.
+        """
+
+    @abstractmethod
+    def set(self, processor, metadata: dict) -> None:
+        """
+        Stores metadata extracted by the processor.
+
+        Args:
+            processor (FileProcessorStrategy): The processor that extracted the metadata.
+            metadata (dict): The extracted metadata.
+        """
+
+    @abstractmethod
+    def invalidate(self, path: str) -> int:
+        """
+        Removes every cached entry for a path, regardless of stat signature or processor.
+
+        Args:
+            path (str): The file path to invalidate.
+
+        Returns:
+            int: The number of entries removed.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes every cached entry."""
+
+
+class SqliteMetadataCache(MetadataCache):
+    """
+    Metadata cache backed by a local SQLite database.
+
+    Entries are pickled, so the database should only be shared between trusted processes.
+    Least recently used entries are evicted once `max_entries` or `max_bytes` is exceeded.
+    The connection is opened lazily and is not pickled, so a cache instance can be passed to
+    `File.process_many` workers; each process opens its own connection.
+
+    Attributes:
+        db_path (Path): Location of the SQLite database file.
+        max_entries (int): Maximum number of cached entries, or None for no limit.
+        max_bytes (int): Maximum total size of the pickled metadata, or None for no limit.
+    """
+
+    def __init__(self, db_path: str, max_entries: int = None, max_bytes: int = None) -> None:
+        """
+        Initializes the cache, creating the database on first use.
+
+        Args:
+            db_path (str): Location of the SQLite database file.
+            max_entries (int): Maximum number of cached entries, or None for no limit.
+            max_bytes (int): Maximum total size of the pickled metadata, or None for no limit.
+        """
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state['_connection'] = None
+        state['_lock'] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Returns the open connection, creating the database and schema if necessary.
+
+        Returns:
+            sqlite3.Connection: The connection for this process.
+
+        Raises:
+            FileProcessingFailedError: If the database cannot be opened.
+        """
+        if self._connection is None:
+            try:
+                connection = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS entries ("
+                    " key TEXT PRIMARY KEY, path TEXT NOT NULL, token TEXT NOT NULL, metadata BLOB NOT NULL,"
+                    " nbytes INTEGER NOT NULL, accessed REAL NOT NULL)"
+                )
+                connection.execute("CREATE INDEX IF NOT EXISTS entries_path ON entries (path)")
+                connection.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+                connection.commit()
+            except sqlite3.Error as e:
+                raise FileProcessingFailedError(f"Error opening metadata cache {self.db_path}: {e}")
+            self._connection = connection
+        return self._connection
+
+    def get(self, processor) -> dict:
+        key = repr(self.make_key(processor))
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute("SELECT metadata FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+            connection.commit()
+        return pickle.loads(row[0])
+
+    def set(self, processor, metadata: dict) -> None:
+        key = self.make_key(processor)
+        try:
+            blob = pickle.dumps(metadata, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logging.warning(f"Metadata for {processor.file_path} is not cacheable: {e}")
+            return
+
+        with self._lock:
+            connection = self._connect()
+            # Older signatures of the same file and processor can never be hit again
+            connection.execute("DELETE FROM entries WHERE path = ? AND token = ?", (key[0], key[3]))
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (key, path, token, metadata, nbytes, accessed)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (repr(key), key[0], key[3], blob, len(blob), time.time())
+            )
+            self._evict(connection)
+            connection.commit()
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """
+        Deletes least recently used entries until the configured limits are respected.
+
+        Args:
+            connection (sqlite3.Connection): The open connection.
+        """
+        if self.max_entries is None and self.max_bytes is None:
+            return
+        count, total = connection.execute("SELECT COUNT(*), COALESCE(SUM(nbytes), 0) FROM entries").fetchone()
+        excess_entries = max(0, count - self.max_entries) if self.max_entries is not None else 0
+        excess_bytes = max(0, total - self.max_bytes) if self.max_bytes is not None else 0
+        if not excess_entries and not excess_bytes:
+            return
+
+        doomed = []
+        for key, nbytes in connection.execute("SELECT key, nbytes FROM entries ORDER BY accessed"):
+            if excess_entries <= 0 and excess_bytes <= 0:
+                break
+            doomed.append((key,))
+            excess_entries -= 1
+            excess_bytes -= nbytes
+        connection.executemany("DELETE FROM entries WHERE key = ?", doomed)
+
+    def invalidate(self, path: str) -> int:
+        path = str(Path(path).resolve())
+        with self._lock:
+            connection = self._connect()
+            removed = connection.execute("DELETE FROM entries WHERE path = ?", (path,)).rowcount
+            connection.commit()
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            connection = self._connect()
+            connection.execute("DELETE FROM entries")
+            connection.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def close(self) -> None:
+        """Closes the database connection; it is reopened on next use."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class ContentSummaryCache:
+    """
+    On-disk cache of parse summaries keyed by the hash of the parsed content.
+
+    Each entry is a small JSON file under `directory/<token>/<2 hex digits>/<digest>.json`, written
+    to a temporary file and then renamed, so any number of processes can share the directory
+    without locking. Entries are never stale: a changed file has a different digest, and a changed
+    extraction logic has a different token. Unreadable or corrupted entries count as misses.
+
+    Attributes:
+        directory (Path): Root directory of the cache.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """
+        Initializes the cache; directories are created on the first write.
+
+        Args:
+            directory (str): Root directory of the cache.
+        """
+        self.directory = Path(directory)
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        """
+        Hashes file content into a cache key.
+
+        Args:
+            data (bytes): The raw content of the file.
+
+        Returns:
+            str: Hexadecimal BLAKE2b digest.
+        """
+        return blake2b(data, digest_size=20).hexdigest()
+
+    def _entry_path(self, token: str, digest: str) -> Path:
+        """
+        Returns the location of an entry.
+
+        Args:
+            token (str): Processor cache token, e.g. 'PyFileProcessor:2'.
+            digest (str): Content digest.
+
+        Returns:
+            Path: Path of the entry's JSON file.
+        """
+        return self.directory / token.replace(':', '-') / digest[:2] / f"{digest}.json"
+
+    def get(self, token: str, digest: str) -> dict:
+        """
+        Looks up the summary of some content.
+
+        Args:
+            token (str): Processor cache token.
+            digest (str): Content digest from `digest`.
+
+        Returns:
+            dict: The stored summary, or None on a miss.
+        """
+        try:
+            with open(self._entry_path(token, digest), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, token: str, digest: str, summary: dict) -> None:
+        """
+        Stores the summary of some content. Failures are logged and otherwise ignored.
+
+        Args:
+            token (str): Processor cache token.
+            digest (str): Content digest from `digest`.
+            summary (dict): JSON-serialisable summary.
+        """
+        path = self._entry_path(token, digest)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(summary, f)
+            os.replace(temp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logging.warning(f"Could not cache summary in {path}: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
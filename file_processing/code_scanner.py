@@ -0,0 +1,402 @@
+"""
+Single-pass scanner shared by the source-code processors (.cpp, .h, .js, .java, .go, .rb).
+
+The text is tokenised once, left to right: comments and string literals become single tokens, so
+keywords inside them are never counted, and no pattern can backtrack across the file. Constructs
+(functions, classes, includes, ...) are recognised from the last few significant tokens by a small
+per-language rule table, which keeps the scan linear in the size of the source even for minified
+or generated files.
+
+A rule is a short sequence of token matchers. When it ends with '(' and requires a body, the rule
+only counts once the matching ')' is followed by '{' (optionally after qualifiers such as `const`
+or a `throws` clause), which tells a definition apart from a call or a declaration.
+"""
+
+import re
+import string
+
+# Token kinds
+IDENT = 'ident'
+STRING = 'string'
+COMMENT = 'comment'
+DIRECTIVE = 'directive'
+PUNCT = 'punct'
+OTHER = 'other'
+SPACE = 'space'
+
+C_COMMENTS = (r'//[^\n]*', r'/\*.*?(?:\*/|\Z)')
+C_STRINGS = (r'"(?:[^"\\\n]|\\.)*"', r"'(?:[^'\\\n]|\\.)*'")
+
+# Keywords that read like names but start statements, so `else if (...) {` or `return foo(...)`
+# are not mistaken for definitions.
+C_STATEMENT_KEYWORDS = frozenset({
+    'if', 'else', 'for', 'while', 'do', 'switch', 'case', 'return', 'new', 'delete', 'throw',
+    'catch', 'sizeof', 'goto', 'typedef', 'using', 'namespace', 'operator', 'co_return',
+})
+
+# Tokens after which '/' starts a regular expression literal rather than a division (JavaScript)
+REGEX_PRECEDING_PUNCT = frozenset('(,=:[!&|?{};+-*%<>~^')
+REGEX_PRECEDING_KEYWORDS = frozenset({
+    'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void', 'throw', 'yield',
+    'await',
+})
+REGEX_FLAGS = frozenset(string.ascii_letters)
+
+
+class Rule:
+    """
+    A construct counted by the scanner.
+
+    Attributes:
+        key (str): Metadata key incremented on each match, e.g. 'num_functions'.
+        pattern (tuple): Matchers for consecutive significant tokens. Each is a token text (e.g.
+                         'class'), a token kind (IDENT, STRING), or a tuple of alternatives.
+        body (bool): The pattern ends with '(', and only counts if the matching ')' is followed by '{'.
+        line_start (bool): The first token of the pattern must start its line.
+        matchers (tuple): (token texts, token kinds) accepted at each position of the pattern.
+    """
+
+    __slots__ = ('key', 'pattern', 'body', 'line_start', 'matchers')
+
+    def __init__(self, key: str, pattern: tuple, body: bool = False, line_start: bool = False) -> None:
+        self.key = key
+        self.pattern = pattern
+        self.body = body
+        self.line_start = line_start
+        self.matchers = tuple(_compile_matcher(matcher) for matcher in pattern)
+
+
+class LanguageRules:
+    """
+    Lexical syntax and constructs of a language.
+
+    Attributes:
+        comments (tuple): Regular expressions of comment tokens.
+        strings (tuple): Regular expressions of string and character literal tokens.
+        rules (tuple): `Rule`s to count.
+        directives (bool): Lexes preprocessor directives ('#include', '#define', ...) at line starts.
+        regex_literals (bool): Lexes JavaScript regular expression literals as strings.
+        non_names (frozenset): Identifiers that IDENT matchers reject.
+        body_qualifiers (tuple): Matchers for the tokens allowed between ')' and '{' of a body rule.
+        count_comments (bool): Adds 'num_comments' to the counts.
+        pattern (re.Pattern): The compiled tokeniser.
+        rules_by_text (dict): Rules whose last matcher is a given token text.
+        rules_by_kind (dict): Rules whose last matcher is a given token kind.
+        qualifiers (tuple): (token texts, token kinds) compiled from `body_qualifiers`.
+    """
+
+    def __init__(self, comments: tuple = (), strings: tuple = (), rules: tuple = (),
+                 directives: bool = False, regex_literals: bool = False,
+                 non_names: frozenset = frozenset(), body_qualifiers: tuple = (),
+                 count_comments: bool = False) -> None:
+        self.comments = comments
+        self.strings = strings
+        self.rules = rules
+        self.directives = directives
+        self.regex_literals = regex_literals
+        self.non_names = non_names
+        self.body_qualifiers = body_qualifiers
+        self.count_comments = count_comments
+
+        alternatives = []
+        if comments:
+            alternatives.append(f"(?P<{COMMENT}>{'|'.join(comments)})")
+        if directives:
+            alternatives.append(fr'(?P<{DIRECTIVE}>\#[ \t]*[A-Za-z_]\w*)')
+        if strings:
+            alternatives.append(f"(?P<{STRING}>{'|'.join(strings)})")
+        alternatives += [fr'(?P<{IDENT}>[^\W\d]\w*)', fr'(?P<{OTHER}>\d\w*)', fr'(?P<{PUNCT}>\S)']
+        # Trailing whitespace is consumed as one skipped token; otherwise every alternative would
+        # fail after it and the search would restart from each following position.
+        self.pattern = re.compile(
+            r'\s*(?:' + '|'.join(alternatives) + fr')|(?P<{SPACE}>\s+)', re.DOTALL
+        )
+
+        # Index rules by their last matcher, so most tokens are dismissed with two lookups
+        self.rules_by_text = {}
+        self.rules_by_kind = {}
+        for rule in rules:
+            texts, kinds = rule.matchers[-1]
+            for text in texts:
+                self.rules_by_text.setdefault(text, []).append(rule)
+            for kind in kinds:
+                self.rules_by_kind.setdefault(kind, []).append(rule)
+        self.qualifiers = _compile_matcher(body_qualifiers)
+
+    def keys(self) -> list:
+        """
+        Lists the metadata keys produced by `scan`.
+
+        Returns:
+            list: Rule keys in declaration order, plus 'num_comments' if comments are counted.
+        """
+        keys = list(dict.fromkeys(rule.key for rule in self.rules))
+        return keys + ['num_comments'] if self.count_comments else keys
+
+
+def tokenize(text: str, language: LanguageRules):
+    """
+    Splits source text into tokens in a single left-to-right pass.
+
+    Args:
+        text (str): The source text.
+        language (LanguageRules): The language's lexical syntax.
+
+    Yields:
+        tuple: (kind, text, line_start) for each token; `line_start` is True for the first token
+               on its line. Directive texts are normalised, e.g. '# include' becomes '#include'.
+    """
+    pattern = language.pattern
+    line_start = True
+    previous = None
+    pos = 0
+    regex_barrier = 0   # No regex literal starts before this offset, where a failed scan stopped
+    while True:
+        for token in pattern.finditer(text, pos):
+            kind = token.lastgroup
+            if kind == SPACE:
+                continue
+            start = token.start(kind)
+            if not line_start and start > token.start():
+                line_start = text.find('\n', token.start(), start) != -1
+            value = token.group(kind)
+
+            if kind == DIRECTIVE:
+                if line_start:
+                    value = '#' + value[1:].lstrip()
+                else:
+                    kind = OTHER
+            elif (kind == PUNCT and value == '/' and language.regex_literals and start >= regex_barrier
+                    and _starts_regex(previous)):
+                end, matched = _scan_regex_literal(text, start)
+                if matched:
+                    yield STRING, text[start:end], line_start
+                    previous = (STRING, text[start:end])
+                    line_start = False
+                    pos = end
+                    break  # Resume tokenising after the literal
+                # The '/' is punctuation. Later '/'s up to where the scan stopped are not retried,
+                # which would make an unclosed '[' on a long line quadratic.
+                regex_barrier = end
+
+            yield kind, value, line_start
+            if kind != COMMENT:
+                previous = (kind, value)
+            line_start = False
+        else:
+            return
+
+
+def _scan_regex_literal(text: str, start: int) -> tuple:
+    """
+    Scans a JavaScript regular expression literal from the '/' at `start`, within its line.
+
+    Inside a '[...]' class a '/' does not end the literal, and a backslash escapes the next
+    character. Trailing flags are included.
+
+    Args:
+        text (str): The source text.
+        start (int): Offset of the opening '/'.
+
+    Returns:
+        tuple: (end, matched). `end` is the offset just past the literal if `matched`, otherwise the
+               offset of the newline (or end of text) where the scan gave up.
+    """
+    length = len(text)
+    in_class = False
+    pos = start + 1
+    while pos < length:
+        char = text[pos]
+        if char == '\n':
+            return pos, False
+        if char == '\\':
+            pos += 1
+            if pos < length and text[pos] == '\n':
+                return pos, False
+        elif char == '[':
+            in_class = True
+        elif char == ']':
+            in_class = False
+        elif char == '/' and not in_class and pos > start + 1:
+            pos += 1
+            while pos < length and text[pos] in REGEX_FLAGS:
+                pos += 1
+            return pos, True
+        pos += 1
+    return length, False
+
+
+def _starts_regex(previous: tuple) -> bool:
+    """
+    Checks whether a '/' following the given token starts a regular expression literal.
+
+    Args:
+        previous (tuple): (kind, text) of the previous significant token, or None.
+
+    Returns:
+        bool: True if the '/' is in operand position.
+    """
+    if previous is None:
+        return True
+    kind, value = previous
+    if kind == PUNCT:
+        return value in REGEX_PRECEDING_PUNCT
+    return kind == IDENT and value in REGEX_PRECEDING_KEYWORDS
+
+
+def scan(text: str, language: LanguageRules) -> dict:
+    """
+    Counts the constructs of a language in one pass over its tokens.
+
+    Args:
+        text (str): The source text.
+        language (LanguageRules): The language's syntax and rules.
+
+    Returns:
+        dict: Count for each key of `language.keys()`.
+    """
+    counts = dict.fromkeys(language.keys(), 0)
+    window = max((len(rule.pattern) for rule in language.rules), default=1)
+    rules_by_text = language.rules_by_text
+    rules_by_kind = language.rules_by_kind
+    non_names = language.non_names
+    qualifier_texts, qualifier_kinds = language.qualifiers
+
+    recent = []         # Last `window` significant tokens
+    candidates = []     # (rule key, paren depth) of body rules waiting for their ')'
+    awaiting = None     # Rule key of a closed head waiting for '{'
+    depth = 0
+
+    for kind, value, line_start in tokenize(text, language):
+        if kind == COMMENT:
+            if language.count_comments:
+                counts['num_comments'] += 1
+            continue
+
+        if awaiting is not None:
+            if kind == PUNCT and value == '{':
+                counts[awaiting] += 1
+                awaiting = None
+            elif not (value in qualifier_texts or kind in qualifier_kinds):
+                awaiting = None
+
+        # Strings never match token texts, and statement keywords never match IDENT
+        if kind == STRING:
+            value = None
+        elif kind == IDENT and value in non_names:
+            kind = None
+        recent.append((value, kind, line_start))
+        if len(recent) > window:
+            del recent[0]
+
+        rules = rules_by_kind.get(kind, ())
+        if value in rules_by_text:
+            rules = [*rules, *rules_by_text[value]]
+        for rule in rules:
+            matchers = rule.matchers
+            size = len(matchers)
+            if size > len(recent):
+                continue
+            tokens = recent[-size:]
+            if rule.line_start and not tokens[0][2]:
+                continue
+            for (texts, kinds), (token_text, token_kind, _) in zip(matchers, tokens):
+                if token_text not in texts and token_kind not in kinds:
+                    break
+            else:
+                if rule.body:
+                    candidates.append((rule.key, depth))
+                else:
+                    counts[rule.key] += 1
+
+        if kind == PUNCT:
+            if value == '(':
+                depth += 1
+            elif value == ')':
+                depth -= 1
+                if candidates and candidates[-1][1] == depth:
+                    awaiting = candidates.pop()[0]
+            elif value in '{};':
+                # Parameter lists don't contain these, so any open head was not a definition
+                candidates.clear()
+    return counts
+
+
+def _compile_matcher(matcher) -> tuple:
+    """
+    Splits a rule matcher into the token texts and token kinds it accepts.
+
+    Args:
+        matcher (str | tuple): Token text, token kind (IDENT, STRING), or tuple of alternatives.
+
+    Returns:
+        tuple: (frozenset of token texts, frozenset of token kinds).
+    """
+    alternatives = matcher if isinstance(matcher, tuple) else (matcher,)
+    texts = frozenset(m for m in alternatives if m not in (IDENT, STRING))
+    return texts, frozenset(alternatives) - texts
+
+
+C_FUNCTION = Rule('num_functions', (IDENT, IDENT, '('), body=True)
+C_CLASS = Rule('num_classes', ('class', IDENT))
+
+CPP = LanguageRules(
+    comments=C_COMMENTS, strings=C_STRINGS, directives=True,
+    rules=(C_FUNCTION, C_CLASS),
+    non_names=C_STATEMENT_KEYWORDS,
+    body_qualifiers=('const', 'override', 'final', 'noexcept', 'volatile'),
+    count_comments=True,
+)
+
+H = LanguageRules(
+    comments=C_COMMENTS, strings=C_STRINGS, directives=True,
+    rules=(
+        Rule('num_includes', ('#include', (STRING, '<'))),
+        Rule('num_macros', ('#define', IDENT)),
+        Rule('num_structs', ('struct', IDENT)),
+        C_CLASS,
+    ),
+    count_comments=True,
+)
+
+JS = LanguageRules(
+    comments=C_COMMENTS,
+    strings=C_STRINGS + (r'`(?:[^`\\]|\\.)*`',),
+    regex_literals=True,
+    rules=(
+        Rule('num_functions', ('function', IDENT, '('), body=True),
+        Rule('num_classes', ('class', IDENT)),
+    ),
+    count_comments=True,
+)
+
+JAVA = LanguageRules(
+    comments=C_COMMENTS,
+    strings=(r'""".*?"""',) + C_STRINGS,
+    rules=(
+        Rule('num_methods', (IDENT, IDENT, '('), body=True),
+        Rule('num_classes', (('class', 'interface', 'enum'), IDENT)),
+    ),
+    non_names=C_STATEMENT_KEYWORDS,
+    body_qualifiers=(IDENT, '.', ','),  # throws clauses
+)
+
+GO = LanguageRules(
+    comments=C_COMMENTS,
+    strings=C_STRINGS + (r'`[^`]*`',),
+    rules=(
+        Rule('num_functions', ('func', IDENT, '(')),
+        Rule('num_structs', ('type', IDENT, 'struct', '{')),
+        Rule('num_interfaces', ('type', IDENT, 'interface', '{')),
+    ),
+)
+
+RUBY = LanguageRules(
+    comments=(r'\#[^\n]*', r'(?m:^=begin\b.*?(?:^=end\b[^\n]*|\Z))'),
+    strings=C_STRINGS,
+    rules=(
+        Rule('num_methods', ('def', IDENT), line_start=True),
+        Rule('num_classes', ('class', IDENT), line_start=True),
+        Rule('num_modules', ('module', IDENT), line_start=True),
+    ),
+)
@@ -0,0 +1,190 @@
+"""
+Shared encoding detection for text-based processors.
+
+Detection runs from cheapest to most expensive and stops at the first answer:
+
+1. A byte order mark identifies UTF-8/16/32 outright.
+2. Pure ASCII and strictly valid UTF-8 content is recognised by C-speed validation.
+3. Anything else is fed to chardet's incremental `UniversalDetector` over a bounded sample,
+   stopping as soon as the detector is confident. The sample starts at the first non-ASCII byte,
+   since an ASCII prefix tells the detector nothing.
+
+The bytes are read once and decoded from the same buffer, so processors never open the file twice.
+As the detector only sees a sample, a byte outside it may not fit the guess; such content is
+decoded as Windows-1252 instead, or with replacement characters if even that fails.
+"""
+
+import codecs
+import re
+from chardet import UniversalDetector
+
+BOMS = (
+    (codecs.BOM_UTF32_LE, 'UTF-32'),
+    (codecs.BOM_UTF32_BE, 'UTF-32'),
+    (codecs.BOM_UTF8, 'UTF-8-SIG'),
+    (codecs.BOM_UTF16_LE, 'UTF-16'),
+    (codecs.BOM_UTF16_BE, 'UTF-16'),
+)
+
+DEFAULT_SAMPLE_SIZE = 1024 * 1024
+DETECTOR_CHUNK_SIZE = 64 * 1024
+FALLBACK_ENCODING = 'Windows-1252'
+MIN_CONFIDENCE = 0.1
+NON_ASCII_BYTE = re.compile(rb'[\x80-\xff]')
+
+
+def detect_encoding(raw: bytes, sample_size: int = DEFAULT_SAMPLE_SIZE) -> str:
+    """
+    Detects the encoding of a byte buffer.
+
+    Args:
+        raw (bytes): The content to inspect.
+        sample_size (int): Maximum number of bytes fed to chardet when the fast paths fail.
+
+    Returns:
+        str: The detected encoding name (chardet naming), or None if it could not be determined.
+    """
+    return _detect(raw, sample_size)[0]
+
+
+def decode_bytes(raw: bytes, sample_size: int = DEFAULT_SAMPLE_SIZE, errors: str = 'strict',
+                 default: str = None, translate_newlines: bool = False) -> tuple:
+    """
+    Detects the encoding of a byte buffer and decodes it.
+
+    Args:
+        raw (bytes): The content to decode.
+        sample_size (int): Maximum number of bytes fed to chardet when the fast paths fail.
+        errors (str): Error handler passed to `bytes.decode`.
+        default (str): Encoding used when detection fails. Defaults to UTF-8 for decoding while
+                       reporting the encoding as None, matching `chardet.detect`.
+        translate_newlines (bool): Convert '\\r\\n' and '\\r' to '\\n', like text-mode `open()`.
+
+    Returns:
+        tuple: (decoded text, encoding). If the content is not valid in the detected encoding, it
+               is decoded with `decode_fallback` and the encoding actually used is returned.
+    """
+    encoding, text = _detect(raw, sample_size)
+    encoding = encoding or default
+    if text is None:
+        try:
+            text = raw.decode(encoding or 'utf-8', errors)
+        except UnicodeDecodeError:
+            text, encoding = decode_fallback(raw, encoding)
+    if translate_newlines and '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text, encoding
+
+
+def read_text(file_path: str, sample_size: int = DEFAULT_SAMPLE_SIZE, errors: str = 'strict',
+              default: str = None, translate_newlines: bool = True) -> tuple:
+    """
+    Reads a file once, detects its encoding and decodes it.
+
+    Args:
+        file_path (str): Path of the file to read.
+        sample_size (int): Maximum number of bytes fed to chardet when the fast paths fail.
+        errors (str): Error handler passed to `bytes.decode`.
+        default (str): Encoding used (and reported) when detection fails.
+        translate_newlines (bool): Convert '\\r\\n' and '\\r' to '\\n', like text-mode `open()`.
+
+    Returns:
+        tuple: (decoded text, encoding used to decode it).
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    return decode_bytes(raw, sample_size, errors, default, translate_newlines)
+
+
+def detect_file_encoding(file_path: str, sample_size: int = DEFAULT_SAMPLE_SIZE) -> str:
+    """
+    Detects the encoding of a file from its first `sample_size` bytes, without reading the rest.
+
+    Intended for streaming readers. A sample that ends inside a multi-byte UTF-8 sequence is still
+    recognised as UTF-8, and an ASCII sample of a longer file is reported as UTF-8 since the unread
+    remainder may contain non-ASCII characters.
+
+    Args:
+        file_path (str): Path of the file to inspect.
+        sample_size (int): Number of bytes read from the start of the file.
+
+    Returns:
+        str: The detected encoding name, or None if it could not be determined.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read(sample_size + 1)
+    truncated = len(raw) > sample_size
+    encoding = _detect(raw[:sample_size], sample_size, final=not truncated)[0]
+    if truncated and encoding == 'ascii':
+        return 'utf-8'
+    return encoding
+
+
+def decode_fallback(raw: bytes, encoding: str = None) -> tuple:
+    """
+    Decodes content that is not valid in its detected encoding.
+
+    Windows-1252 is tried first, as a stray single-byte character is the usual culprit. Content it
+    can't decode either is decoded in the detected encoding with replacement characters.
+
+    Args:
+        raw (bytes): The content to decode.
+        encoding (str): The detected encoding, or None.
+
+    Returns:
+        tuple: (decoded text, encoding used).
+    """
+    try:
+        return raw.decode(FALLBACK_ENCODING), FALLBACK_ENCODING
+    except UnicodeDecodeError:
+        encoding = encoding or 'utf-8'
+        return raw.decode(encoding, 'replace'), encoding
+
+
+def _detect(raw: bytes, sample_size: int, final: bool = True) -> tuple:
+    """
+    Runs the detection cascade, returning the decoded text when a fast path already produced it.
+
+    Args:
+        raw (bytes): The content to inspect.
+        sample_size (int): Maximum number of bytes fed to chardet.
+        final (bool): False if `raw` is a prefix of a longer input and may end mid-character.
+
+    Returns:
+        tuple: (encoding or None, decoded text or None).
+    """
+    for bom, encoding in BOMS:
+        if raw.startswith(bom):
+            return encoding, None
+
+    if raw.isascii():
+        return 'ascii', raw.decode('ascii')
+
+    try:
+        return 'utf-8', codecs.getincrementaldecoder('utf-8')().decode(raw, final)
+    except UnicodeDecodeError:
+        pass
+
+    # An ASCII prefix carries no evidence, so sample from the first byte that does
+    offset = NON_ASCII_BYTE.search(raw).start()
+    end = min(len(raw), offset + sample_size)
+    detector = UniversalDetector()
+    for start in range(offset, end, DETECTOR_CHUNK_SIZE):
+        detector.feed(raw[start:min(start + DETECTOR_CHUNK_SIZE, end)])
+        if detector.done:
+            break
+    detector.close()
+    encoding = detector.result['encoding']
+    confidence = detector.result.get('confidence')
+    if encoding is not None and (encoding.lower() == 'ascii' or
+                                 (confidence is not None and confidence < MIN_CONFIDENCE)):
+        # The buffer has non-ASCII bytes, so ASCII can't be right; a near-random guess from a
+        # few stray bytes is no better than the most common single-byte encoding.
+        encoding = FALLBACK_ENCODING
+    return encoding, None
@@ -1,6 +1,10 @@
 from pathlib import Path
+import inspect
+import os
+import stat
 from file_processing import processors
 from file_processing.file_processor_strategy import FileProcessorStrategy
+from file_processing.cache import MetadataCache
 from file_processing.errors import (
     FileProcessingFailedError,
     TesseractNotFound,
@@ -25,6 +29,13 @@ class File:
     Methods:
         save(output_path): Saves the processed file to the specified output path.
         process(): Processes the file using the selected processor.
+        process_many(paths, workers, executor, ordered): Processes many paths in a worker pool.
+
+    Note:
+        When constructed with `lazy=True`, stat-level attributes (size, timestamps, permissions, ...)
+        are available immediately while `process()` is deferred until `metadata` is first accessed
+        or the file is saved.
+        The result is memoized, so the parse cost is paid at most once.
     """
 
     OCR_APPLICABLE_EXTENSIONS = {".pdf", ".jpeg", ".jpg", ".png", ".gif", ".tiff", ".tif"}
@@ -73,7 +84,9 @@ class File:
     }
 
     def __init__(self, path: str, use_ocr: bool = False, ocr_path: str = None, 
-                 use_transcriber: bool = False, open_file: bool = True) -> None:
+                 use_transcriber: bool = False, open_file: bool = True, lazy: bool = False,
+                 stat_result: os.stat_result = None, cache: MetadataCache = None,
+                 processor_options: dict = None) -> None:
         """
         Initializes the File object with the specified path and optional OCR and transcription capabilities.
 
@@ -83,13 +96,29 @@ class File:
             ocr_path (str): Optional path to Tesseract OCR executable.
             use_transcriber (bool): Flag to enable transcription if applicable.
             open_file (bool): Indicates whether the file should be opened immediately.
+            lazy (bool): Defers processing until `metadata` is first accessed.
+            stat_result (os.stat_result): Optional precomputed `os.lstat` result or `os.DirEntry`
+                                          for `path`, reused instead of stat'ing the file again.
+            cache (MetadataCache): Optional persistent cache consulted before processing; on a hit
+                                   the file is not parsed.
+            processor_options (dict): Processor-specific keyword arguments (e.g. `streaming` for CSV
+                                      files). Options the selected processor does not accept are
+                                      ignored, so one dict can be shared across a mixed batch.
         """
         self.path = Path(path)
-        self.processor = self._get_processor(use_ocr, ocr_path, use_transcriber, open_file)
-        self.process()
-        
-    def _get_processor(self, use_ocr: bool, ocr_path: str,
-                       use_transcriber: bool, open_file: bool) -> FileProcessorStrategy:
+        self.lazy = lazy
+        self.cache = cache
+        self._processed = False
+        self.processor = self._get_processor(use_ocr, ocr_path, use_transcriber, open_file, stat_result,
+                                             processor_options)
+        # Lets `save` tell fields the caller set on a lazy file apart from the processor's defaults
+        self._unprocessed_metadata = dict(self.processor.metadata or {})
+        if not lazy:
+            self.process()
+
+    def _get_processor(self, use_ocr: bool, ocr_path: str, use_transcriber: bool,
+                       open_file: bool, stat_result: os.stat_result = None,
+                       processor_options: dict = None) -> FileProcessorStrategy:
         """
         Determines and returns the appropriate processor for the file based on its extension.
 
@@ -98,6 +127,8 @@ class File:
             ocr_path (str): Path to the OCR executable.
             use_transcriber (bool): Whether to use transcription.
             open_file (bool): Whether to open the file immediately.
+            stat_result (os.stat_result): Optional precomputed `os.lstat` result or `os.DirEntry`.
+            processor_options (dict): Extra keyword arguments for the processor constructor.
 
         Returns:
             FileProcessorStrategy: An instance of a file processor suitable for the file type.
@@ -108,12 +139,22 @@ class File:
             TesseractNotFound: If Tesseract OCR is not installed or configured.
             NotTranscriptionApplicableError: If transcription is requested but not supported for the file type.
         """
-        if self.path.is_dir():
-            return processors.DirectoryProcessor(str(self.path), open_file)
+        if stat_result is None:
+            try:
+                stat_result = os.lstat(self.path)
+            except OSError:
+                stat_result = None  # Let the processor report the missing path
+
+        if self._is_directory(stat_result):
+            processor_class = processors.DirectoryProcessor
+        else:
+            processor_class = File.PROCESSORS.get(self.path.suffix, processors.GenericFileProcessor)
+        options = self._accepted_options(processor_class, processor_options)
+        processor = processor_class(str(self.path), open_file, stat_result, **options)
+        if processor_class is processors.DirectoryProcessor:
+            return processor
 
         extension = self.path.suffix
-        processor_class = File.PROCESSORS.get(extension, processors.GenericFileProcessor)
-        processor = processor_class(str(self.path), open_file)
 
         if use_ocr:
             if extension not in File.OCR_APPLICABLE_EXTENSIONS:
@@ -147,14 +188,83 @@ class File:
 
         return processor
 
-    def save(self, output_path: str = None) -> None:
+    @staticmethod
+    def _accepted_options(processor_class: type, processor_options: dict) -> dict:
+        """
+        Selects the processor options accepted by a processor's constructor.
+
+        Args:
+            processor_class (type): The processor class about to be instantiated.
+            processor_options (dict): Requested processor-specific options, or None.
+
+        Returns:
+            dict: The subset of `processor_options` that `processor_class` accepts.
+        """
+        if not processor_options:
+            return {}
+        parameters = inspect.signature(processor_class.__init__).parameters
+        return {k: v for k, v in processor_options.items() if k in parameters}
+
+    @staticmethod
+    def process_many(paths, workers: int = None, executor: str = "process",
+                     ordered: bool = False, dedup: bool = False, **file_kwargs):
+        """
+        Processes many files concurrently, streaming back one result per path.
+
+        Per-file exceptions are captured on the result instead of aborting the batch. With
+        `dedup=True`, byte-identical files (same extension, confirmed by content hash) are
+        processed once and the extracted metadata is copied to every duplicate path.
+
+        Args:
+            paths (Iterable[str]): Paths to process.
+            workers (int): Number of workers. Defaults to the executor's default.
+            executor (str): 'process' for CPU-bound file types or 'thread' for I/O-bound ones.
+            ordered (bool): Yield results in input order instead of completion order.
+            dedup (bool): Process each distinct file content only once.
+            **file_kwargs: Keyword arguments forwarded to each `File` (e.g. `open_file`, `use_ocr`).
+
+        Returns:
+            Iterator[FileResult]: Results with `path`, `file` and `error` attributes.
+        """
+        from file_processing.batch import process_many, process_unique
+        batch_func = process_unique if dedup else process_many
+        return batch_func(paths, workers=workers, executor=executor, ordered=ordered, **file_kwargs)
+
+    def _is_directory(self, stat_result) -> bool:
+        """
+        Checks whether the path is a directory using an already captured stat result.
+
+        Args:
+            stat_result (os.stat_result | os.DirEntry): The `os.lstat` result or directory entry, if any.
+
+        Returns:
+            bool: True if the path (or the target of a symbolic link) is a directory.
+        """
+        if stat_result is None:
+            return False
+        if isinstance(stat_result, os.DirEntry):
+            return stat_result.is_dir()
+        if stat.S_ISLNK(stat_result.st_mode):
+            return self.path.is_dir()
+        return stat.S_ISDIR(stat_result.st_mode)
+
+    def save(self, output_path: str = None, **save_options) -> None:
         """
         Saves the processed file to the specified output path.
 
+        If `lazy` deferred processing, the file is processed first and any fields already set in
+        `processor.metadata` are applied on top of the extracted ones, so edits are not lost.
+
         Args:
             output_path (str): Destination path (defaults to original file path).
+            **save_options: Processor-specific save options, e.g. `transform` for image processors.
         """
-        self.processor.save(output_path)
+        if not self._processed:
+            edits = {key: value for key, value in (self.processor.metadata or {}).items()
+                     if key not in self._unprocessed_metadata or self._unprocessed_metadata[key] != value}
+            self.process()
+            self.processor.metadata.update(edits)
+        self.processor.save(output_path, **save_options)
 
     def copy(self, output_path: str, verify_integrity: bool = False) -> None:
         """
@@ -178,9 +288,51 @@ class File:
 
     def process(self) -> None:
         """
-        Executes the processing operation on the file.
+        Executes the processing operation on the file, serving the metadata from `cache` when
+        an entry for the file's current stat signature exists.
+        """
+        use_cache = self._is_cacheable()
+        if use_cache:
+            cached = self.cache.get(self.processor)
+            if cached is not None:
+                self._load_metadata(cached)
+                return None
+
+        result = self.processor.process()
+        self._processed = True
+        if use_cache:
+            self.cache.set(self.processor, self.processor.metadata)
+        return result
+
+    def _load_metadata(self, metadata: dict) -> None:
         """
-        return self.processor.process()
+        Installs metadata extracted elsewhere (a cache hit or an identical file) without processing.
+
+        Args:
+            metadata (dict): The metadata to assign to the processor.
+        """
+        if isinstance(self.processor, FileProcessorStrategy):
+            self.processor.load_cached_metadata(metadata)
+        else:
+            self.processor.metadata = metadata
+        self._processed = True
+
+    def _is_cacheable(self) -> bool:
+        """
+        Checks whether the processor's output can be served from or stored in the cache.
+
+        Returns:
+            bool: True if a cache is configured and the processor opened a regular file.
+        """
+        return (self.cache is not None
+                and isinstance(self.processor, FileProcessorStrategy)
+                and self.processor.open_file
+                and self.processor.is_file)
+
+    @property
+    def is_processed(self) -> bool:
+        """bool: Indicates whether the processor has extracted the file's metadata."""
+        return self._processed
 
     # Property methods with docstrings for Sphinx documentation
     @property
@@ -255,5 +407,7 @@ class File:
 
     @property
     def metadata(self) -> dict:
-        """dict: Returns the metadata of the file."""
+        """dict: Returns the metadata of the file, processing it first if `lazy` deferred it."""
+        if not self._processed:
+            self.process()
         return self.processor.metadata
@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
+import os
+import shutil
+import stat
 import sys
 import importlib.util
-from hashlib import md5, sha256
+from typing import Iterable
 from file_processing.errors import FileProcessingFailedError
+from file_processing.hashing import compute_digests, DEFAULT_BUFFER_SIZE
 
 class FileProcessorStrategy(ABC):
     """
@@ -26,38 +30,103 @@ class FileProcessorStrategy(ABC):
         is_file (bool): Indicates if the path is a regular file.
         is_symlink (bool): Indicates if the file is a symbolic link.
         absolute_path (Path): The absolute path of the file.
+        stat_result (os.stat_result): The stat result every attribute above is derived from.
+        CHEAP_FIELDS (tuple): Attributes derived from the filesystem stat, available without opening the file.
+        EXPENSIVE_FIELDS (tuple): Attributes that require reading or parsing the file contents.
+        PROCESSOR_VERSION (int): Version of the extraction logic; bump it when a processor's output
+                                 changes so persistent metadata caches stop serving stale entries.
     """
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
+    CHEAP_FIELDS = (
+        'file_name', 'owner', 'extension', 'size', 'modification_time', 'access_time',
+        'creation_time', 'parent_directory', 'permissions', 'is_file', 'is_symlink', 'absolute_path'
+    )
+    EXPENSIVE_FIELDS = ('metadata', 'hash')
+    PROCESSOR_VERSION = 1
+
+    def __init__(self, file_path: str, open_file: bool = True,
+                 stat_result: os.stat_result = None) -> None:
         """
         Initializes the file processor with metadata extraction for the given file.
 
+        All stat-level attributes are derived from a single `os.lstat` call (plus one `os.stat`
+        when the path is a symbolic link). Callers that already hold a stat result, such as a
+        directory walker using `os.scandir`, can pass it in to avoid touching the filesystem again.
+
         Args:
             file_path (str): The path of the file to process.
             open_file (bool): Flag to open the file immediately if set to True.
+            stat_result (os.stat_result): Optional precomputed `os.lstat` result for `file_path`,
+                                          or the `os.DirEntry` it was listed from.
 
         Raises:
             FileProcessingFailedError: If the specified file or directory does not exist.
         """
         self.file_path = Path(file_path)
 
-        # Check if the file or directory exists
-        if not self.file_path.exists():
+        try:
+            self.stat_result, self.is_symlink = self._capture_stat(stat_result)
+        except OSError:
             raise FileProcessingFailedError(f"File or directory does not exist: {file_path}")
 
+        st = self.stat_result
         self.open_file = open_file
         self.file_name = self.file_path.name
-        self.owner = self._find_owner(file_path)
         self.extension = self.file_path.suffix
-        self.size = self.file_path.stat().st_size
-        self.modification_time = self.file_path.stat().st_mtime
-        self.access_time = self.file_path.stat().st_atime
-        self.creation_time = self.file_path.stat().st_ctime
+        self.size = st.st_size
+        self.modification_time = st.st_mtime
+        self.access_time = st.st_atime
+        self.creation_time = st.st_ctime
         self.parent_directory = self.file_path.parent
-        self.permissions = oct(self.file_path.stat().st_mode)[-3:]
-        self.is_file = self.file_path.is_file()
-        self.is_symlink = self.file_path.is_symlink()
-        self.absolute_path = self.file_path.resolve()
+        self.permissions = oct(st.st_mode)[-3:]
+        self.is_file = stat.S_ISREG(st.st_mode)
+
+    def _capture_stat(self, stat_result=None) -> tuple:
+        """
+        Resolves the stat result for the file, following symbolic links.
+
+        Args:
+            stat_result (os.stat_result | os.DirEntry): Optional precomputed `os.lstat` result or
+                                                        directory entry for the file.
+
+        Returns:
+            tuple: The (followed) `os.stat_result` and whether the path itself is a symbolic link.
+
+        Raises:
+            OSError: If the file does not exist or cannot be stat'ed.
+        """
+        if isinstance(stat_result, os.DirEntry):
+            # DirEntry caches both the link flag (from d_type) and the followed stat
+            return stat_result.stat(), stat_result.is_symlink()
+
+        lstat_result = stat_result if stat_result is not None else os.lstat(self.file_path)
+        if stat.S_ISLNK(lstat_result.st_mode):
+            return os.stat(self.file_path), True
+        return lstat_result, False
+
+    @property
+    def owner(self) -> str:
+        """
+        Returns the owner of the file, looked up on first access.
+
+        Returns:
+            str: The owner of the file in 'domain/name' format, or an empty string if unavailable.
+        """
+        if not hasattr(self, '_owner'):
+            self._owner = self._find_owner(str(self.file_path))
+        return self._owner
+
+    @property
+    def absolute_path(self) -> Path:
+        """
+        Returns the resolved absolute path of the file, computed on first access.
+
+        Returns:
+            Path: The absolute path of the file.
+        """
+        if not hasattr(self, '_absolute_path'):
+            self._absolute_path = self.file_path.resolve()
+        return self._absolute_path
 
     def _find_owner(self, file_path: str) -> str:
         """
@@ -78,6 +147,29 @@ class FileProcessorStrategy(ABC):
             return f'{domain}/{name}'
         return ''
 
+    def load_cached_metadata(self, metadata: dict) -> None:
+        """
+        Installs metadata extracted earlier, on a cache hit or for a byte-identical file, in place
+        of processing.
+
+        Processors that keep state from `process` besides `metadata` override this to rebuild it.
+
+        Args:
+            metadata (dict): Metadata produced by `process` for the same content and cache token.
+        """
+        self.metadata = metadata
+
+    def cache_token(self) -> str:
+        """
+        Identifies the extraction logic used by this processor for metadata cache keys.
+
+        Processors whose options change the extracted metadata should include them here.
+
+        Returns:
+            str: Token combining the processor class name and `PROCESSOR_VERSION`.
+        """
+        return f"{type(self).__name__}:{self.PROCESSOR_VERSION}"
+
     @property
     def hash(self) -> str:
         """
@@ -86,16 +178,17 @@ class FileProcessorStrategy(ABC):
         Returns:
             str: Hexadecimal hash of the file.
         """
-        if not hasattr(self, '_hash'):
-            self._hash = self.compute_hash()
-        return self._hash
+        return self.compute_hash()
 
     def compute_hash(self, algorithm: str = 'sha256') -> str:
         """
         Computes the hash of the file using the specified algorithm.
 
+        Digests are cached per algorithm, so repeated calls do not re-read the file.
+
         Args:
-            algorithm (str, optional): The hashing algorithm to use ('sha256' or 'md5'). Defaults to 'sha256'.
+            algorithm (str, optional): The hashing algorithm to use ('md5', 'sha1', 'sha256' or
+                                       'blake2b'). Defaults to 'sha256'.
 
         Returns:
             str: Hexadecimal hash of the file.
@@ -104,20 +197,57 @@ class FileProcessorStrategy(ABC):
             ValueError: If an unsupported algorithm is specified.
             FileProcessingFailedError: If file hashing fails.
         """
-        hash_func = {'md5': md5, 'sha256': sha256}.get(algorithm)
-        if not hash_func:
-            raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+        return self.compute_hashes([algorithm])[algorithm]
 
-        hasher = hash_func()
-        try:
-            with open(self.file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(8192), b''):
-                    hasher.update(chunk)
-            return hasher.hexdigest()
-        except Exception as e:
-            raise FileProcessingFailedError(
-                f"Error computing hash for {self.file_path}: {e}"
-            )
+    def compute_hashes(self, algorithms: Iterable[str] = ('md5', 'sha256'),
+                       buffer_size: int = DEFAULT_BUFFER_SIZE, use_mmap: bool = False) -> dict:
+        """
+        Computes several hashes of the file in a single read pass.
+
+        Only algorithms without a cached digest are computed; the results are cached per algorithm
+        and reflect the file content at the time it was first hashed.
+
+        Args:
+            algorithms (Iterable[str]): The hashing algorithms to use.
+            buffer_size (int): Number of bytes read and hashed per iteration.
+            use_mmap (bool): Map the file into memory instead of reading it into a buffer.
+
+        Returns:
+            dict: Mapping of algorithm name to hexadecimal hash.
+
+        Raises:
+            ValueError: If an unsupported algorithm is specified.
+            FileProcessingFailedError: If file hashing fails.
+        """
+        if not hasattr(self, '_hashes'):
+            self._hashes = {}
+        algorithms = list(algorithms)
+        missing = [a for a in algorithms if a not in self._hashes]
+        if missing:
+            try:
+                self._hashes.update(compute_digests(self.file_path, missing, buffer_size, use_mmap))
+            except ValueError:
+                raise
+            except Exception as e:
+                raise FileProcessingFailedError(
+                    f"Error computing hash for {self.file_path}: {e}"
+                )
+        return {a: self._hashes[a] for a in algorithms}
+
+    def _copy_contents(self, output_path: str) -> bool:
+        """
+        Copies the file's bytes to `output_path` without reading them into Python.
+
+        Args:
+            output_path (str): Destination path.
+
+        Returns:
+            bool: False if `output_path` is the file itself and nothing was copied, True otherwise.
+        """
+        if os.path.abspath(output_path) == os.path.abspath(self.file_path):
+            return False
+        copy_file_contents(self.file_path, output_path)
+        return True
 
     @abstractmethod
     def process(self) -> None:
@@ -139,3 +269,34 @@ class FileProcessorStrategy(ABC):
         This method must be implemented by subclasses to define save behavior.
         """
         pass
+
+
+def copy_file_contents(src: str, dst: str) -> None:
+    """
+    Copies a file's bytes from `src` to `dst` inside the kernel where possible.
+
+    On Linux, `os.copy_file_range` lets filesystems such as Btrfs and XFS share extents (a reflink)
+    instead of copying data. Otherwise, or if the kernel rejects the call, `shutil.copyfile` uses
+    the platform's zero-copy primitive (sendfile, fcopyfile or CopyFile2). Metadata is not copied.
+
+    Args:
+        src (str): Source path.
+        dst (str): Destination path, created or truncated.
+
+    Raises:
+        OSError: If the file cannot be copied.
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if not copied:
+                        break
+                    remaining -= copied
+                else:
+                    return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
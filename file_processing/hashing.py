@@ -0,0 +1,102 @@
+"""
+Streaming hash engine used by `FileProcessorStrategy.compute_hash` and `compute_hashes`.
+
+Files are read once, either through `readinto` on a single reused buffer or through a read-only
+`mmap`, and every requested digest is updated from the same bytes. `hashlib` releases the GIL for
+large updates, so hashing in worker threads scales with the available disks and cores.
+"""
+
+from hashlib import md5, sha1, sha256, blake2b
+from typing import Iterable
+import mmap
+
+HASH_ALGORITHMS = {
+    'md5': md5,
+    'sha1': sha1,
+    'sha256': sha256,
+    'blake2b': blake2b,
+}
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+
+def compute_digests(file_path: str, algorithms: Iterable[str] = ('sha256',),
+                    buffer_size: int = DEFAULT_BUFFER_SIZE, use_mmap: bool = False) -> dict:
+    """
+    Computes several hex digests of a file in a single read pass.
+
+    Args:
+        file_path (str): Path of the file to hash.
+        algorithms (Iterable[str]): Names of the algorithms to compute (see `HASH_ALGORITHMS`).
+        buffer_size (int): Number of bytes fed to the hashers per update.
+        use_mmap (bool): Map the file into memory instead of reading it into a buffer.
+
+    Returns:
+        dict: Mapping of algorithm name to hexadecimal digest.
+
+    Raises:
+        ValueError: If an unsupported algorithm or buffer size is requested.
+        OSError: If the file cannot be read.
+    """
+    algorithms = list(dict.fromkeys(algorithms))
+    unsupported = [a for a in algorithms if a not in HASH_ALGORITHMS]
+    if unsupported:
+        raise ValueError(f"Unsupported hash algorithm: {', '.join(unsupported)}")
+    if buffer_size <= 0:
+        raise ValueError(f"Buffer size must be positive: {buffer_size}")
+
+    hashers = [HASH_ALGORITHMS[a]() for a in algorithms]
+    with open(file_path, 'rb', buffering=0) as f:
+        if not (use_mmap and _update_from_mmap(f, hashers, buffer_size)):
+            _update_from_reads(f, hashers, buffer_size)
+    return {a: h.hexdigest() for a, h in zip(algorithms, hashers)}
+
+
+def _update_from_reads(f, hashers: list, buffer_size: int) -> None:
+    """
+    Feeds the file to the hashers through one reused buffer.
+
+    Args:
+        f (file object): File opened in unbuffered binary mode.
+        hashers (list): Hash objects to update.
+        buffer_size (int): Size of the reused read buffer.
+    """
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    while True:
+        n = f.readinto(buffer)
+        if not n:
+            break
+        chunk = view[:n]
+        for hasher in hashers:
+            hasher.update(chunk)
+
+
+def _update_from_mmap(f, hashers: list, buffer_size: int) -> bool:
+    """
+    Feeds the file to the hashers from a read-only memory map.
+
+    Args:
+        f (file object): File opened in binary mode.
+        hashers (list): Hash objects to update.
+        buffer_size (int): Number of bytes per update, keeping each slice cache-friendly.
+
+    Returns:
+        bool: False if the file cannot be mapped (e.g. it is empty), in which case nothing was read.
+    """
+    try:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        return False
+
+    with mapped:
+        view = memoryview(mapped)
+        try:
+            for start in range(0, len(view), buffer_size):
+                chunk = view[start:start + buffer_size]
+                for hasher in hashers:
+                    hasher.update(chunk)
+                chunk.release()
+        finally:
+            view.release()
+    return True
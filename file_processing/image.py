@@ -0,0 +1,604 @@
+"""
+Shared engine for the Pillow-based image processors (.png, .jpg, .gif, .tif, .heic).
+
+`Image.open` only parses the file header: format, mode, size, frame count and EXIF are available
+before any pixel data is decoded. `ImageFileProcessor` builds its metadata from that header, and
+decodes the pixels only to validate them unless `header_only` is set. Saving copies the file's bytes
+unless re-encoding is actually needed, i.e. a transform or encoder options were requested or the
+output extension names another format.
+
+Multi-frame images (TIFF pages, GIF animations) are read one frame at a time: `iter_frames` seeks
+to each frame and decodes only that one, so memory stays bounded by a single frame whatever the
+page count.
+
+Perceptual hashes (pHash and dHash) are computed from reduced-resolution decodes: JPEG files are
+decoded directly at 1/2, 1/4 or 1/8 scale through `Image.draft`. `find_near_duplicates` groups
+images whose hashes are within a Hamming distance using a BK-tree, so lookups do not compare
+every pair of images.
+"""
+
+import math
+import os
+import statistics
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator
+from PIL import Image, ExifTags, ImageSequence, TiffImagePlugin
+from file_processing.errors import FileProcessingFailedError
+from file_processing.file_processor_strategy import FileProcessorStrategy
+
+try:
+    import numpy
+except ImportError:  # Optional: only vectorises the pHash DCT
+    numpy = None
+
+EXIF_IFD_POINTER = 0x8769
+HASH_SIZE = 8
+PHASH_HIGHFREQ_FACTOR = 4
+HASH_TYPES = ('phash', 'dhash')
+
+
+class ImageFileProcessor(FileProcessorStrategy):
+    """
+    Base class for image processors, extracting header metadata and saving without re-encoding.
+
+    Attributes:
+        metadata (dict): Contains metadata fields such as 'original_format', 'mode', 'width',
+                         'height', 'frames' and 'exif' if the file is opened.
+        header_only (bool): Skips decoding the pixel data, which otherwise validates the file.
+        perceptual_hash (bool): Adds 'phash' and 'dhash' hex digests of the first frame.
+        SAVE_OPTIONS (dict): Encoder options used when the image has to be re-encoded.
+    """
+
+    PROCESSOR_VERSION = 2
+    SAVE_OPTIONS = {}
+
+    def __init__(self, file_path: str, open_file: bool = True,
+                 stat_result: os.stat_result = None, header_only: bool = False,
+                 perceptual_hash: bool = False) -> None:
+        """
+        Initializes the image processor with the specified file path.
+
+        Args:
+            file_path (str): Path to the image file to process.
+            open_file (bool): Indicates whether to open and process the file immediately.
+            stat_result (os.stat_result): Optional precomputed `os.lstat` result or `os.DirEntry`.
+            header_only (bool): Reads metadata from the header without decoding any pixels.
+                                Corrupted pixel data is then not detected.
+            perceptual_hash (bool): Computes pHash and dHash from a reduced-resolution decode.
+
+        Sets:
+            metadata (dict): Populated with a message if `open_file` is False, otherwise initialized as empty.
+        """
+        super().__init__(file_path, open_file, stat_result)
+        self.metadata = {'message': 'File was not opened'} if not open_file else {}
+        self.header_only = header_only
+        self.perceptual_hash = perceptual_hash
+
+    def cache_token(self) -> str:
+        """
+        Identifies the extraction logic, including the header-only and perceptual hash options.
+
+        Returns:
+            str: Token for metadata cache keys.
+        """
+        return f"{super().cache_token()}:{self.header_only}:{self.perceptual_hash}"
+
+    def process(self) -> None:
+        """
+        Extracts metadata from the image file, including format, mode, width, height, number of
+        frames and EXIF fields, plus perceptual hashes if requested.
+
+        When hashing, the header fields are read first and the pixels are then decoded only at the
+        reduced resolution the hashes need.
+
+        Raises:
+            FileProcessingFailedError: If an error occurs while processing the image file.
+        """
+        if not self.open_file:
+            return
+
+        try:
+            with Image.open(self.file_path) as image:
+                if self.perceptual_hash:
+                    metadata = self._image_metadata(image)
+                    metadata.update(perceptual_hashes(image))
+                else:
+                    if not self.header_only:
+                        image.load()
+                    metadata = self._image_metadata(image)
+                self.metadata.update(metadata)
+        except Exception as e:
+            raise FileProcessingFailedError(
+                f"Error encountered while processing {self.file_path}: {e}"
+            )
+
+    def _image_metadata(self, image: Image.Image) -> dict:
+        """
+        Builds the metadata of an opened image. Subclasses extend this with format-specific fields.
+
+        Args:
+            image (Image.Image): The image, positioned on its first frame.
+
+        Returns:
+            dict: Metadata fields.
+        """
+        return {
+            'original_format': image.format,
+            'mode': image.mode,  # Mode defines pixel type and width
+            'width': image.width,
+            'height': image.height,
+            'frames': getattr(image, 'n_frames', 1),
+            'exif': self._read_exif(image),
+        }
+
+    def _read_exif(self, image: Image.Image) -> dict:
+        """
+        Reads the EXIF fields of an image that are available without decoding it.
+
+        PNG files may store EXIF after the pixel data, where Pillow would have to decode the image
+        to reach it, so it is only read there if already parsed.
+
+        Args:
+            image (Image.Image): The opened image.
+
+        Returns:
+            dict: EXIF tag name to value, from IFD0 and the Exif sub-IFD. Binary values are omitted.
+        """
+        if image.format == 'PNG' and 'exif' not in image.info and self.header_only:
+            return {}
+        exif = image.getexif()
+        fields = {}
+        for ifd in (exif, exif.get_ifd(EXIF_IFD_POINTER)):
+            for tag, value in ifd.items():
+                if tag == EXIF_IFD_POINTER:
+                    continue
+                value = _exif_value(value)
+                if value is not None:
+                    fields[ExifTags.TAGS.get(tag, str(tag))] = value
+        return fields
+
+    def iter_frames(self, mode: str = None) -> Iterator[Image.Image]:
+        """
+        Yields the frames of the image one at a time, e.g. to OCR each page of a scanned TIFF.
+
+        Each frame is decoded when it is reached and handed over as an independent copy, so only
+        the current frame is held in memory. The file stays open until the iterator is exhausted
+        or closed; stopping early never decodes the remaining frames.
+
+        Args:
+            mode (str): Mode to convert each frame to (e.g. 'L' or 'RGB'). Defaults to the frame's own.
+
+        Yields:
+            Image.Image: Each frame, in order.
+
+        Raises:
+            FileProcessingFailedError: If a frame can't be read.
+        """
+        try:
+            with Image.open(self.file_path) as image:
+                for frame in ImageSequence.Iterator(image):
+                    yield frame.convert(mode) if mode else frame.copy()
+        except Exception as e:
+            raise FileProcessingFailedError(
+                f"Error encountered while reading frames of {self.file_path}: {e}"
+            )
+
+    def frame_info(self) -> list:
+        """
+        Describes every frame from the image structure, without keeping any frame in memory.
+
+        TIFF pages are described from their directory entries alone. GIF frames are composited
+        onto the previous one, so Pillow decodes each in turn while seeking, one at a time.
+
+        Returns:
+            list: One dict per frame with 'index', 'width', 'height', 'mode' and 'duration'
+                  (milliseconds, or None for formats without timing such as TIFF).
+
+        Raises:
+            FileProcessingFailedError: If the frames can't be read.
+        """
+        try:
+            with Image.open(self.file_path) as image:
+                return [
+                    {
+                        'index': index,
+                        'width': frame.width,
+                        'height': frame.height,
+                        'mode': frame.mode,
+                        'duration': frame.info.get('duration'),
+                    }
+                    for index, frame in enumerate(ImageSequence.Iterator(image))
+                ]
+        except Exception as e:
+            raise FileProcessingFailedError(
+                f"Error encountered while reading frames of {self.file_path}: {e}"
+            )
+
+    def save(self, output_path: str = None, transform: Callable = None, **save_options) -> None:
+        """
+        Saves the image to the specified output path.
+
+        The file's bytes are copied as-is unless `transform` or encoder options are given, or the
+        output extension belongs to another format than the source's, in which case the image is
+        decoded and re-encoded with Pillow.
+
+        Args:
+            output_path (str): Path to save the image. If None, overwrites the original file.
+            transform (Callable): Function taking and returning a `PIL.Image.Image`, applied before encoding.
+            **save_options: Options passed to `Image.save`, overriding `SAVE_OPTIONS`.
+
+        Raises:
+            FileProcessingFailedError: If an error occurs while saving the image.
+        """
+        save_path = output_path or self.file_path
+        try:
+            if transform is None and not save_options and not self._changes_format(save_path):
+                self._copy_contents(save_path)
+                return
+            with Image.open(self.file_path) as image:
+                image.load()
+                if transform is not None:
+                    image = transform(image)
+                image.save(save_path, **{**self.SAVE_OPTIONS, **save_options})
+        except Exception as e:
+            raise FileProcessingFailedError(
+                f"Error encountered while saving to {save_path}: {e}"
+            )
+
+    def _changes_format(self, save_path: str) -> bool:
+        """
+        Checks whether saving to `save_path` requires converting the image to another format.
+
+        Args:
+            save_path (str): The output path.
+
+        Returns:
+            bool: True if the output extension is not registered for the source's format.
+        """
+        target_format = Image.registered_extensions().get(os.path.splitext(save_path)[1].lower())
+        source_format = self.metadata.get('original_format')
+        if source_format is None:
+            with Image.open(self.file_path) as image:
+                source_format = image.format
+        return target_format != source_format
+
+
+def perceptual_hashes(image: Image.Image, hash_size: int = HASH_SIZE) -> dict:
+    """
+    Computes the pHash and dHash of an image that has not been loaded yet.
+
+    The image is decoded once, in grayscale and, for JPEG, at the smallest scale that is still
+    larger than the pHash DCT input.
+
+    Args:
+        image (Image.Image): The opened, not yet loaded, image.
+        hash_size (int): Side of the hash grid; hashes have hash_size² bits.
+
+    Returns:
+        dict: 'phash' and 'dhash' as zero-padded hexadecimal strings.
+    """
+    dct_size = hash_size * PHASH_HIGHFREQ_FACTOR
+    image.draft('L', (dct_size, dct_size))
+    grayscale = image.convert('L')
+    digits = hash_size * hash_size // 4
+    return {
+        'phash': f"{phash(grayscale, hash_size):0{digits}x}",
+        'dhash': f"{dhash(grayscale, hash_size):0{digits}x}",
+    }
+
+
+def phash(image: Image.Image, hash_size: int = HASH_SIZE) -> int:
+    """
+    Computes the DCT-based perceptual hash of an image.
+
+    The image is shrunk to a (4·hash_size)² grayscale square, transformed with a 2D DCT-II, and
+    each of the hash_size² lowest frequencies sets a bit when it is above their median.
+
+    Args:
+        image (Image.Image): The image.
+        hash_size (int): Side of the hash grid.
+
+    Returns:
+        int: The hash, with the lowest frequency in the most significant bit.
+    """
+    size = hash_size * PHASH_HIGHFREQ_FACTOR
+    pixels = _grayscale_pixels(image, (size, size))
+    frequencies = _dct_low_frequencies(pixels, size, hash_size)
+    median = statistics.median(frequencies)
+    return _bits_to_int(value > median for value in frequencies)
+
+
+def dhash(image: Image.Image, hash_size: int = HASH_SIZE) -> int:
+    """
+    Computes the difference hash of an image.
+
+    The image is shrunk to hash_size rows of hash_size + 1 grayscale pixels, and each bit records
+    whether a pixel is brighter than its left neighbour.
+
+    Args:
+        image (Image.Image): The image.
+        hash_size (int): Side of the hash grid.
+
+    Returns:
+        int: The hash, row by row from the most significant bit.
+    """
+    width = hash_size + 1
+    pixels = _grayscale_pixels(image, (width, hash_size))
+    return _bits_to_int(
+        pixels[row * width + col + 1] > pixels[row * width + col]
+        for row in range(hash_size) for col in range(hash_size)
+    )
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """
+    Counts the bits that differ between two hashes.
+
+    Args:
+        a (int): First hash.
+        b (int): Second hash.
+
+    Returns:
+        int: The Hamming distance.
+    """
+    return (a ^ b).bit_count()
+
+
+def _grayscale_pixels(image: Image.Image, size: tuple) -> bytes:
+    """
+    Resizes an image to `size` in grayscale.
+
+    Args:
+        image (Image.Image): The image.
+        size (tuple): (width, height) of the result.
+
+    Returns:
+        bytes: One brightness value per pixel, row by row.
+    """
+    if image.mode != 'L':
+        image = image.convert('L')
+    return image.resize(size, Image.Resampling.LANCZOS, reducing_gap=2.0).tobytes()
+
+
+@lru_cache(maxsize=None)
+def _dct_basis(size: int, count: int) -> tuple:
+    """
+    Returns the first `count` DCT-II basis vectors of length `size`.
+
+    Args:
+        size (int): Length of the transformed signal.
+        count (int): Number of frequencies.
+
+    Returns:
+        tuple: `count` tuples of `size` cosines.
+    """
+    return tuple(
+        tuple(math.cos(math.pi * u * (2 * x + 1) / (2 * size)) for x in range(size))
+        for u in range(count)
+    )
+
+
+def _dct_low_frequencies(pixels: bytes, size: int, count: int) -> list:
+    """
+    Computes the lowest `count`² coefficients of the 2D DCT-II of a square grayscale image.
+
+    Only the needed coefficients are computed: the image is projected onto the first `count`
+    basis vectors along its rows, then along its columns. NumPy is used when installed.
+
+    Args:
+        pixels (bytes): size² brightness values, row by row.
+        size (int): Side of the image.
+        count (int): Number of frequencies per axis.
+
+    Returns:
+        list: Coefficients [u][v] flattened row by row, u being the vertical frequency.
+    """
+    basis = _dct_basis(size, count)
+    if numpy is not None:
+        basis = numpy.array(basis)
+        matrix = numpy.frombuffer(pixels, dtype=numpy.uint8).reshape(size, size).astype(float)
+        return (basis @ matrix @ basis.T).ravel().tolist()
+
+    rows = [pixels[y * size:(y + 1) * size] for y in range(size)]
+    projected = [[sum(b * p for b, p in zip(vector, row)) for vector in basis] for row in rows]
+    return [
+        sum(basis[u][y] * projected[y][v] for y in range(size))
+        for u in range(count) for v in range(count)
+    ]
+
+
+def _bits_to_int(bits: Iterable[bool]) -> int:
+    """
+    Packs booleans into an integer, the first one becoming the most significant bit.
+
+    Args:
+        bits (Iterable[bool]): The bits.
+
+    Returns:
+        int: The packed value.
+    """
+    value = 0
+    for bit in bits:
+        value = (value << 1) | bit
+    return value
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree indexing integer hashes by Hamming distance.
+
+    Each child edge is labelled with its distance to the parent, so by the triangle inequality a
+    search within `max_distance` of a hash only descends into edges labelled within
+    `max_distance` of the current node's distance. For small radii this visits a small fraction
+    of the tree.
+    """
+
+    def __init__(self) -> None:
+        self._root = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, value: int, item) -> None:
+        """
+        Indexes an item under its hash.
+
+        Args:
+            value (int): The item's hash.
+            item (Any): The item, e.g. a path.
+        """
+        self._size += 1
+        if self._root is None:
+            self._root = _BKNode(value, item)
+            return
+        node = self._root
+        while True:
+            distance = hamming_distance(value, node.value)
+            if distance == 0:
+                node.items.append(item)
+                return
+            child = node.children.get(distance)
+            if child is None:
+                node.children[distance] = _BKNode(value, item)
+                return
+            node = child
+
+    def search(self, value: int, max_distance: int) -> list:
+        """
+        Finds the items whose hashes are within `max_distance` of `value`.
+
+        Args:
+            value (int): The hash to look up.
+            max_distance (int): Maximum Hamming distance, inclusive.
+
+        Returns:
+            list: (distance, item) tuples, in no particular order.
+        """
+        matches = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            distance = hamming_distance(value, node.value)
+            if distance <= max_distance:
+                matches.extend((distance, item) for item in node.items)
+            for edge, child in node.children.items():
+                if distance - max_distance <= edge <= distance + max_distance:
+                    stack.append(child)
+        return matches
+
+
+class _BKNode:
+    """Node of a `BKTree`: a hash, the items sharing it and children keyed by distance."""
+
+    __slots__ = ('value', 'items', 'children')
+
+    def __init__(self, value: int, item) -> None:
+        self.value = value
+        self.items = [item]
+        self.children = {}
+
+
+def find_near_duplicates(paths: Iterable[str], max_distance: int = 8, hash_type: str = 'phash',
+                         workers: int = None, executor: str = 'process') -> list:
+    """
+    Groups images that look alike, even when their bytes differ (re-encodes, resizes, rescans).
+
+    Hashes are computed in parallel through `File.process_many`. Each image is then looked up in
+    a BK-tree of the images seen before it, and matches are merged transitively. Paths that are
+    not images or cannot be processed are skipped.
+
+    Args:
+        paths (Iterable[str]): Paths to compare.
+        max_distance (int): Maximum Hamming distance between hashes of near-duplicates.
+        hash_type (str): 'phash' (robust to scaling and compression) or 'dhash' (cheaper, stricter).
+        workers (int): Number of workers. Defaults to the executor's own default.
+        executor (str): 'process' or 'thread'.
+
+    Returns:
+        list: Groups of two or more paths, each in input order, ordered by their first path.
+
+    Raises:
+        ValueError: If an unsupported hash type is requested.
+    """
+    from file_processing.file import File
+
+    if hash_type not in HASH_TYPES:
+        raise ValueError(f"Unsupported hash type: {hash_type}. Expected one of {HASH_TYPES}")
+
+    tree = BKTree()
+    parents = {}
+    order = {}
+    results = File.process_many(paths, workers=workers, executor=executor, ordered=True,
+                                processor_options={'perceptual_hash': True, 'header_only': True})
+    for result in results:
+        if not result.ok or hash_type not in result.file.metadata:
+            continue
+        path = result.path
+        value = int(result.file.metadata[hash_type], 16)
+        parents[path] = path
+        order[path] = len(order)
+        for _, other in tree.search(value, max_distance):
+            _union(parents, order, other, path)
+        tree.add(value, path)
+
+    groups = {}
+    for path in order:
+        groups.setdefault(_find(parents, path), []).append(path)
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def _find(parents: dict, path: str) -> str:
+    """
+    Finds the representative of a path's group, compressing the path to it.
+
+    Args:
+        parents (dict): Parent of each path; representatives are their own parent.
+        path (str): The path.
+
+    Returns:
+        str: The representative path.
+    """
+    root = path
+    while parents[root] != root:
+        root = parents[root]
+    while parents[path] != root:
+        parents[path], path = root, parents[path]
+    return root
+
+
+def _union(parents: dict, order: dict, a: str, b: str) -> None:
+    """
+    Merges the groups of two paths, keeping the earliest path as the representative.
+
+    Args:
+        parents (dict): Parent of each path.
+        order (dict): Input position of each path.
+        a (str): A path.
+        b (str): Another path.
+    """
+    root_a, root_b = _find(parents, a), _find(parents, b)
+    if root_a != root_b:
+        first, second = sorted((root_a, root_b), key=order.get)
+        parents[second] = first
+
+
+def _exif_value(value):
+    """
+    Converts an EXIF value to plain Python types.
+
+    Args:
+        value (Any): Value as parsed by Pillow.
+
+    Returns:
+        Any: A str, int, float or tuple of these, or None for binary values.
+    """
+    if isinstance(value, bytes):
+        return None
+    if isinstance(value, str):
+        return value.rstrip('\x00')
+    if isinstance(value, TiffImagePlugin.IFDRational):
+        return float(value)
+    if isinstance(value, tuple):
+        return tuple(_exif_value(item) for item in value)
+    return value
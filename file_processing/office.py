@@ -0,0 +1,169 @@
+"""
+Helpers shared by the Office Open XML processors (.docx, .pptx, .xlsx).
+
+OOXML documents are zip packages of XML parts linked by relationship parts. These helpers resolve
+parts through the package relationships and read the core document properties straight from the
+zip, so processors can extract content without building a full python-docx/python-pptx object model.
+Password-protected documents are instead wrapped in an OLE compound file, which the leading magic
+bytes reveal without reading the rest of the file.
+"""
+
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import BinaryIO
+import msoffcrypto
+from file_processing.errors import FileCorruptionError
+
+ZIP_MAGIC = b'PK\x03\x04'
+REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+CORE_PROPERTIES_NS = {
+    'cp': 'http://schemas.openxmlformats.org/package/2006/metadata/core-properties',
+    'dc': 'http://purl.org/dc/elements/1.1/',
+}
+
+
+def relationship_part_name(part_name: str) -> str:
+    """
+    Returns the name of the relationships part belonging to a package part.
+
+    Args:
+        part_name (str): Name of the source part (e.g. 'word/document.xml'), or '' for the package.
+
+    Returns:
+        str: Name of the relationships part (e.g. 'word/_rels/document.xml.rels').
+    """
+    directory, name = posixpath.split(part_name)
+    return posixpath.join(directory, '_rels', f'{name}.rels')
+
+
+def part_relationships(package: zipfile.ZipFile, part_name: str = '') -> list:
+    """
+    Lists the internal relationships of a part, in the order they are declared.
+
+    Args:
+        package (zipfile.ZipFile): The open OOXML package.
+        part_name (str): Name of the source part, or '' for the package-level relationships.
+
+    Returns:
+        list: (relationship type suffix, target part name) tuples, e.g. ('header', 'word/header1.xml').
+    """
+    return [(rel_type, target) for _, rel_type, target in _read_relationships(package, part_name)]
+
+
+def relationship_targets(package: zipfile.ZipFile, part_name: str = '') -> dict:
+    """
+    Maps the relationship ids of a part to their target part names.
+
+    Args:
+        package (zipfile.ZipFile): The open OOXML package.
+        part_name (str): Name of the source part, or '' for the package-level relationships.
+
+    Returns:
+        dict: Relationship id (e.g. 'rId2') to target part name.
+    """
+    return {rel_id: target for rel_id, _, target in _read_relationships(package, part_name)}
+
+
+def _read_relationships(package: zipfile.ZipFile, part_name: str) -> list:
+    """
+    Parses the relationships part of a part, skipping external targets.
+
+    Args:
+        package (zipfile.ZipFile): The open OOXML package.
+        part_name (str): Name of the source part, or '' for the package-level relationships.
+
+    Returns:
+        list: (relationship id, type suffix, target part name) tuples in declaration order.
+    """
+    try:
+        root = ET.fromstring(package.read(relationship_part_name(part_name)))
+    except KeyError:
+        return []
+
+    base = posixpath.dirname(part_name)
+    relationships = []
+    for rel in root.iter(f'{REL_NS}Relationship'):
+        if rel.get('TargetMode') == 'External':
+            continue
+        target = rel.get('Target', '')
+        target = target.lstrip('/') if target.startswith('/') else posixpath.join(base, target)
+        relationships.append((rel.get('Id'), rel.get('Type', '').rsplit('/', 1)[-1], posixpath.normpath(target)))
+    return relationships
+
+
+def find_part(package: zipfile.ZipFile, rel_type: str, part_name: str = '', default: str = None) -> str:
+    """
+    Finds the first part targeted by a relationship of the given type.
+
+    Args:
+        package (zipfile.ZipFile): The open OOXML package.
+        rel_type (str): Relationship type suffix, e.g. 'officeDocument' or 'core-properties'.
+        part_name (str): Name of the source part, or '' for the package-level relationships.
+        default (str): Part name returned when no such relationship exists.
+
+    Returns:
+        str: The target part name, or `default`.
+    """
+    for found_type, target in part_relationships(package, part_name):
+        if found_type == rel_type:
+            return target
+    return default
+
+
+def read_core_properties(package: zipfile.ZipFile) -> dict:
+    """
+    Reads the creator and last-modified-by core properties of a package.
+
+    Missing properties are returned as empty strings, matching python-docx and python-pptx.
+
+    Args:
+        package (zipfile.ZipFile): The open OOXML package.
+
+    Returns:
+        dict: 'author' and 'last_modified_by' values.
+    """
+    properties = {'author': '', 'last_modified_by': ''}
+    part_name = find_part(package, 'core-properties', default='docProps/core.xml')
+    try:
+        root = ET.fromstring(package.read(part_name))
+    except KeyError:
+        return properties
+
+    for key, path in (('author', 'dc:creator'), ('last_modified_by', 'cp:lastModifiedBy')):
+        element = root.find(path, CORE_PROPERTIES_NS)
+        if element is not None and element.text:
+            properties[key] = element.text
+    return properties
+
+
+def is_encrypted_office_file(f: BinaryIO) -> bool:
+    """
+    Checks whether an open Office file is password protected, reading as little as possible.
+
+    A zip signature means a plain OOXML package; only its central directory is read to confirm that
+    it is a valid package. Anything else (an OLE compound file, or unrecognised bytes) is handed to
+    msoffcrypto. The file position is reset to the start before returning, so the same handle can
+    be passed straight to a parser.
+
+    Args:
+        f (BinaryIO): The file opened in binary mode.
+
+    Returns:
+        bool: True if the file is encrypted.
+
+    Raises:
+        FileCorruptionError: If the file is neither a valid OOXML package nor a recognised OLE file.
+    """
+    try:
+        if f.read(len(ZIP_MAGIC)) == ZIP_MAGIC:
+            f.seek(0)
+            with zipfile.ZipFile(f) as package:
+                package.getinfo('[Content_Types].xml')
+            return False
+        f.seek(0)
+        return msoffcrypto.OfficeFile(f).is_encrypted()
+    except Exception as e:
+        raise FileCorruptionError(f"File is corrupted: {getattr(f, 'name', f)}") from e
+    finally:
+        f.seek(0)
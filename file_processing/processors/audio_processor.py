@@ -1,6 +1,8 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Iterator
 from mutagen import File
-from mutagen.easyid3 import EasyID3
-from mutagen.mp3 import MP3
+from mutagen.mp3 import EasyMP3
 from mutagen.flac import FLAC
 from mutagen.oggvorbis import OggVorbis
 from mutagen.aiff import AIFF
@@ -9,27 +11,43 @@ from mutagen.mp4 import MP4
 from file_processing.errors import FileProcessingFailedError
 from file_processing.file_processor_strategy import FileProcessorStrategy
 
+# Formats mutagen may detect; MP3 files are opened as EasyMP3 so their ID3 tags are read through
+# EasyID3 keys in the same parse.
+AUDIO_TYPES = [EasyMP3, FLAC, OggVorbis, AIFF, WAVE, MP4]
+
+# Tag key of each metadata field, per format
+EASY_ID3_KEYS = {'artist': 'artist', 'date': 'date', 'title': 'title', 'organization': 'organization'}
+VORBIS_KEYS = {'artist': 'ARTIST', 'date': 'DATE', 'title': 'TITLE', 'organization': 'ORGANIZATION'}
+MP4_KEYS = {'artist': '©ART', 'date': '©day', 'title': '©nam', 'organization': '©wrk'}
+
+
 class AudioFileProcessor(FileProcessorStrategy):
     """
     Processor for handling audio files, extracting and saving metadata for supported file types.
 
+    Metadata is read in a single mutagen parse, which only visits the container headers and tag
+    blocks, never the audio payload. Saving copies the file in the kernel (if the output is a new
+    path) and then rewrites the tags in place.
+
     Attributes:
         metadata (dict): Contains metadata fields such as 'bitrate', 'length', 'artist', 'date', 'title',
                          and 'organization' if the file is opened and supported.
     """
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
+    def __init__(self, file_path: str, open_file: bool = True,
+                 stat_result: os.stat_result = None) -> None:
         """
         Initializes the AudioFileProcessor with the specified file path.
 
         Args:
             file_path (str): Path to the audio file to process.
             open_file (bool): Indicates whether to open and process the file immediately.
+            stat_result (os.stat_result): Optional precomputed `os.lstat` result or `os.DirEntry`.
 
         Sets:
             metadata (dict): Populated with 'message' if `open_file` is False.
         """
-        super().__init__(file_path, open_file)
+        super().__init__(file_path, open_file, stat_result)
         self.metadata = {'message': 'File was not opened'} if not open_file else {}
 
     def process(self) -> None:
@@ -47,49 +65,70 @@ class AudioFileProcessor(FileProcessorStrategy):
             return
 
         try:
-            audio = File(self.file_path)
-            if isinstance(audio, MP3):
-                audio_tags = EasyID3(self.file_path)
+            audio = File(self.file_path, options=AUDIO_TYPES)
+            if isinstance(audio, EasyMP3):
+                if audio.tags is None:
+                    # Reading MP3 tags has always required an ID3 header (as EasyID3 does)
+                    raise FileProcessingFailedError(f"{self.file_path} has no ID3 tags")
                 self.metadata.update({
                     'bitrate': audio.info.bitrate,
                     'length': audio.info.length,
-                    'artist': audio_tags.get('artist', [''])[0],
-                    'date': audio_tags.get('date', [''])[0],
-                    'title': audio_tags.get('title', [''])[0],
-                    'organization': audio_tags.get('organization', [''])[0]
+                    **self._read_tags(audio, EASY_ID3_KEYS)
                 })
             elif isinstance(audio, (WAVE, FLAC, OggVorbis)):
                 self.metadata.update({
                     'bitrate': audio.info.bitrate,
                     'length': audio.info.length,
-                    'artist': audio.get('ARTIST', [''])[0],
-                    'date': audio.get('DATE', [''])[0],
-                    'title': audio.get('TITLE', [''])[0],
-                    'organization': audio.get('ORGANIZATION', [''])[0]
+                    **self._read_tags(audio, VORBIS_KEYS)
                 })
             elif isinstance(audio, MP4):
                 self.metadata.update({
                     'bitrate': audio.info.bitrate if audio.info is not None else 0,
                     'length': audio.info.length,
-                    'artist': audio.get('©ART', [''])[0],
-                    'date': audio.get('©day', [''])[0],
-                    'title': audio.get('©nam', [''])[0],
-                    'organization': audio.get('©wrk', [''])[0]
+                    **self._read_tags(audio, MP4_KEYS)
                 })
             elif isinstance(audio, AIFF):
-                if audio.tags is None:
-                    audio.add_tags()
                 self.metadata.update({
                     'bitrate': audio.info.bitrate,
                     'length': audio.info.length,
-                    'artist': audio.tags.get('artist', [''])[0],
-                    'date': audio.tags.get('date', [''])[0],
-                    'title': audio.tags.get('title', [''])[0],
-                    'organization': audio.tags.get('organization', [''])[0]
+                    **self._read_tags(audio.tags or {}, EASY_ID3_KEYS)
                 })
         except Exception as e:
             raise FileProcessingFailedError(f"Error encountered while processing: {e}")
 
+    @staticmethod
+    def _read_tags(tags, tag_keys: dict) -> dict:
+        """
+        Reads the first value of each tag, defaulting to ''.
+
+        Args:
+            tags (Mapping): The parsed file or its tags.
+            tag_keys (dict): Tag key of each metadata field.
+
+        Returns:
+            dict: Metadata field to tag value.
+        """
+        return {field: tags.get(key, [''])[0] for field, key in tag_keys.items()}
+
+    @staticmethod
+    def _tag_keys(audio) -> dict:
+        """
+        Returns the tag keys used to save metadata to a parsed file.
+
+        Args:
+            audio (FileType): The file parsed by mutagen.
+
+        Returns:
+            dict: Tag key of each metadata field, or None if tags can't be saved for the format.
+        """
+        if isinstance(audio, EasyMP3):
+            return EASY_ID3_KEYS
+        if isinstance(audio, MP4):
+            return MP4_KEYS
+        if isinstance(audio, (FLAC, OggVorbis)):
+            return VORBIS_KEYS
+        return None
+
     def save(self, output_path: str = None) -> None:
         """
         Saves updated metadata to the audio file if the file format supports metadata updates.
@@ -97,6 +136,9 @@ class AudioFileProcessor(FileProcessorStrategy):
         Supported formats for metadata saving include MP3, MP4, FLAC, and OggVorbis. WAVE and AIFF formats
         do not support saving metadata and will raise an error. For MP3 files, ID3 tags are used.
 
+        When `output_path` is a different file, the original is first copied without passing through
+        Python; mutagen then rewrites only the tag block of the output, in place when its padding allows.
+
         Args:
             output_path (str): Path to save the file with updated metadata. If None, overwrites the original file.
 
@@ -107,34 +149,79 @@ class AudioFileProcessor(FileProcessorStrategy):
         save_path = output_path or self.file_path
         if self.extension in [".mp3", ".mp4", ".flac", ".ogg"]:
             try:
-                # Copy the file first
-                main_file = open(self.file_path, "rb").read()
-                with open(save_path, 'wb+') as dest_file:
-                    dest_file.write(main_file)
-
-                # Update the metadata of the copied file
-                audio = File(save_path)
-
-                if isinstance(audio, MP3):
-                    audio = EasyID3(save_path)
-                    audio['artist'] = self.metadata.get('artist', audio.get('artist', [''])[0])
-                    audio['date'] = self.metadata.get('date', audio.get('date', [''])[0])
-                    audio['title'] = self.metadata.get('title', audio.get('title', [''])[0])
-                    audio['organization'] = self.metadata.get('organization', audio.get('organization', [''])[0])
-                elif isinstance(audio, MP4):
-                    audio['©ART'] = self.metadata.get('artist', audio.get('©ART', [''])[0])
-                    audio['©day'] = self.metadata.get('date', audio.get('©day', [''])[0])
-                    audio['©nam'] = self.metadata.get('title', audio.get('©nam', [''])[0])
-                    audio['©wrk'] = self.metadata.get('organization', audio.get('©wrk', [''])[0])
-                elif isinstance(audio, (FLAC, OggVorbis)):
-                    audio['ARTIST'] = self.metadata.get('artist', audio.get('ARTIST', [''])[0])
-                    audio['DATE'] = self.metadata.get('date', audio.get('DATE', [''])[0])
-                    audio['TITLE'] = self.metadata.get('title', audio.get('TITLE', [''])[0])
-                    audio['ORGANIZATION'] = self.metadata.get('organization', audio.get('ORGANIZATION', [''])[0])
+                self._copy_contents(save_path)
+
+                # Update the metadata of the output file
+                audio = File(save_path, options=AUDIO_TYPES)
+                tag_keys = self._tag_keys(audio)
+                if tag_keys is not None:
+                    for field, key in tag_keys.items():
+                        audio[key] = self.metadata.get(field, audio.get(key, [''])[0])
                 audio.save()
             except Exception as e:
                 raise FileProcessingFailedError(f"Error encountered while saving to {save_path}: {e}")
         elif self.extension in [".wav", ".aiff"]:
             raise FileProcessingFailedError(f"Metadata can't be saved for {self.extension} files.")
         else:
-            raise FileProcessingFailedError(f"Unsupported file type for {save_path}")
\ No newline at end of file
+            raise FileProcessingFailedError(f"Unsupported file type for {save_path}")
+
+    @staticmethod
+    def update_tags_many(updates, workers: int = 4, max_pending: int = None) -> Iterator:
+        """
+        Rewrites the tags of many files in place with bounded concurrency.
+
+        Each file's tags are updated with a thread, since the work is dominated by file I/O. At most
+        `max_pending` updates are queued at a time, so `updates` may be a lazy iterable.
+
+        Args:
+            updates (Mapping | Iterable[tuple]): Path to a dict of metadata fields ('artist', 'date',
+                                                 'title', 'organization') to set; missing fields
+                                                 keep their current value.
+            workers (int): Number of threads.
+            max_pending (int): Maximum number of queued updates. Defaults to 4x workers.
+
+        Yields:
+            FileResult: The outcome for each path, in completion order.
+        """
+        from file_processing.batch import FileResult
+
+        if hasattr(updates, 'items'):
+            updates = updates.items()
+        max_pending = max_pending or 4 * workers
+
+        def collect(path, future):
+            try:
+                future.result()
+                return FileResult(path)
+            except Exception as e:
+                return FileResult(path, error=e)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = {}
+            for path, tags in updates:
+                path = str(path)
+                pending[pool.submit(_update_tags, path, tags)] = path
+                if len(pending) >= max_pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield collect(pending.pop(future), future)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield collect(pending.pop(future), future)
+
+
+def _update_tags(path: str, tags: dict) -> None:
+    """
+    Writes metadata fields to the tags of an audio file in place.
+
+    Args:
+        path (str): Path of the audio file.
+        tags (dict): Metadata fields to set.
+
+    Raises:
+        FileProcessingFailedError: If the tags can't be saved.
+    """
+    processor = AudioFileProcessor(path, open_file=False)
+    processor.metadata = dict(tags)
+    processor.save()
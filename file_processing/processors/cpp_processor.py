@@ -1,5 +1,6 @@
-import chardet
-import re
+import os
+from file_processing.code_scanner import scan, CPP
+from file_processing.encoding import read_text
 from file_processing.errors import FileProcessingFailedError
 from file_processing.file_processor_strategy import FileProcessorStrategy
 
@@ -12,34 +13,27 @@ class CppFileProcessor(FileProcessorStrategy):
                          'num_functions', 'num_classes', and 'num_comments'.
     """
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
-        super().__init__(file_path, open_file)
+    PROCESSOR_VERSION = 2
+
+    def __init__(self, file_path: str, open_file: bool = True,
+                 stat_result: os.stat_result = None) -> None:
+        super().__init__(file_path, open_file, stat_result)
         self.metadata = {'message': 'File was not opened'} if not open_file else {}
 
     def process(self) -> None:
         if not self.open_file:
             return
         try:
-            raw_data = open(self.file_path, 'rb').read()
-            encoding = chardet.detect(raw_data)['encoding'] or 'utf-8'
-
-            with open(self.file_path, 'r', encoding=encoding, errors='replace') as f:
-                text = f.read()
-
-                num_lines = len(text.splitlines())
-
-                num_functions = len(re.findall(r'\b[a-zA-Z_]\w*\s+[a-zA-Z_]\w*\s*\(.*?\)\s*\{', text))
-                num_classes = len(re.findall(r'\bclass\s+\w+', text))
-                num_comments = len(re.findall(r'(//[^\n]*|/\*.*?\*/)', text, re.DOTALL))
-
-                self.metadata.update({
-                    'text': text,
-                    'encoding': encoding,
-                    'num_lines': num_lines,
-                    'num_functions': num_functions,
-                    'num_classes': num_classes,
-                    'num_comments': num_comments
-                })
+            text, encoding = read_text(self.file_path, errors='replace', default='utf-8')
+
+            num_lines = len(text.splitlines())
+
+            self.metadata.update({
+                'text': text,
+                'encoding': encoding,
+                'num_lines': num_lines,
+                **scan(text, CPP)
+            })
 
         except Exception as e:
             raise FileProcessingFailedError(
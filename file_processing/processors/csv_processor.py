@@ -1,8 +1,20 @@
+import os
+import io
 import csv
-import chardet
+import codecs
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from file_processing.encoding import FALLBACK_ENCODING, decode_fallback, detect_file_encoding, read_text
 from file_processing.errors import FileProcessingFailedError
 from file_processing.file_processor_strategy import FileProcessorStrategy
 
+# Codec name prefixes of encodings in which '"' and '\n' are single bytes that never occur inside a
+# multi-byte character, so a file can be split at raw byte offsets.
+ASCII_COMPATIBLE_CODECS = ('ascii', 'utf-8', 'cp125', 'iso8859')
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+SCAN_BLOCK_SIZE = 1024 * 1024
+
+
 class CsvFileProcessor(FileProcessorStrategy):
     """
     Processor for handling CSV files, extracting metadata and saving processed data.
@@ -10,21 +22,50 @@ class CsvFileProcessor(FileProcessorStrategy):
     Attributes:
         metadata (dict): Contains extracted metadata such as 'text', 'encoding', 'num_rows',
                          'num_cols', 'num_cells', and 'empty_cells' if the file is opened.
+        streaming (bool): Computes the row statistics in one pass over the reader instead of
+                          materialising every row. 'text' then only holds the first `head_rows` rows.
+        head_rows (int): Number of leading rows kept as 'text' in streaming mode. None omits 'text'.
+        chunk_size (int): In streaming mode, splits files larger than this many bytes at row boundaries
+                          and aggregates per-chunk statistics computed in separate processes.
+        workers (int): Number of processes used for chunked statistics.
     """
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
+    PROCESSOR_VERSION = 2
+
+    def __init__(self, file_path: str, open_file: bool = True, stat_result: os.stat_result = None,
+                 streaming: bool = False, head_rows: int = None, chunk_size: int = None,
+                 workers: int = None) -> None:
         """
         Initializes the CsvFileProcessor with the specified file path.
 
         Args:
             file_path (str): Path to the CSV file to process.
             open_file (bool): Indicates whether to open and process the file immediately.
+            stat_result (os.stat_result): Optional precomputed `os.lstat` result or `os.DirEntry`.
+            streaming (bool): Computes statistics with constant memory instead of loading every row.
+            head_rows (int): Number of leading rows kept as 'text' in streaming mode.
+            chunk_size (int): Approximate chunk size in bytes for parallel statistics in streaming mode.
+            workers (int): Number of processes used for chunked statistics.
 
         Sets:
             metadata (dict): Populated with 'message' if `open_file` is False.
         """
-        super().__init__(file_path, open_file)
+        super().__init__(file_path, open_file, stat_result)
         self.metadata = {'message': 'File was not opened'} if not open_file else {}
+        self.streaming = streaming
+        self.head_rows = head_rows
+        self.chunk_size = chunk_size
+        self.workers = workers
+
+    def cache_token(self) -> str:
+        """
+        Identifies the extraction logic, including the streaming head sample size.
+
+        Returns:
+            str: Token for metadata cache keys.
+        """
+        token = super().cache_token()
+        return f"{token}:stream={self.head_rows}" if self.streaming else token
 
     def process(self) -> None:
         """
@@ -38,30 +79,121 @@ class CsvFileProcessor(FileProcessorStrategy):
         """
         if not self.open_file:
             return
+        if self.streaming:
+            return self._process_streaming()
         try:
-            encoding = chardet.detect(open(self.file_path, 'rb').read())['encoding']
-            with open(self.file_path, 'r', newline='\n', encoding=encoding) as f:
+            content, encoding = read_text(self.file_path, translate_newlines=False)
+            with io.StringIO(content, newline='\n') as f:
                 reader = csv.reader(f)
                 rows = [row for row in reader]
-                text = '\n'.join(['","'.join(row) for row in rows])
-                
-                # Calculate number of cells and empty cells
-                num_cells = sum(len(row) for row in rows)
-                empty_cells = sum(cell in ('', ' ') for row in rows for cell in row)
-                
-                self.metadata.update({
-                    'text': text,
-                    'encoding': encoding,
-                    'num_rows': len(rows),
-                    'num_cols': len(rows[0]) if rows else 0,
-                    'num_cells': num_cells,
-                    'empty_cells': empty_cells
-                })
+            text = '\n'.join(['","'.join(row) for row in rows])
+
+            # Calculate number of cells and empty cells
+            num_cells = sum(len(row) for row in rows)
+            empty_cells = sum(cell in ('', ' ') for row in rows for cell in row)
+
+            self.metadata.update({
+                'text': text,
+                'encoding': encoding,
+                'num_rows': len(rows),
+                'num_cols': len(rows[0]) if rows else 0,
+                'num_cells': num_cells,
+                'empty_cells': empty_cells
+            })
         except Exception as e:
             raise FileProcessingFailedError(
                 f"Error encountered while processing {self.file_path}: {e}"
             )
 
+    def _process_streaming(self) -> None:
+        """
+        Extracts the same statistics as `process` in a single pass with constant memory.
+
+        The encoding is detected from a bounded sample at the start of the file. When `chunk_size`
+        is set and the encoding is ASCII-compatible, the file is split at row boundaries and each
+        chunk is counted in a separate process. Content past the sample that is not valid in the
+        detected encoding is decoded as in `decode_fallback`, and 'encoding' records the fallback.
+
+        Raises:
+            FileProcessingFailedError: If an error occurs during CSV file processing.
+        """
+        try:
+            encoding = detect_file_encoding(self.file_path)
+            if self.chunk_size and self._is_ascii_compatible(encoding) and self.size > self.chunk_size:
+                stats = self._chunked_stats(encoding or 'utf-8')
+            else:
+                stats = self._stream_stats(encoding or 'utf-8')
+
+            used_encoding = stats.pop('encoding')
+            if used_encoding != (encoding or 'utf-8'):
+                encoding = used_encoding  # content past the detection sample needed a fallback
+            head = stats.pop('head')
+            if self.head_rows is not None:
+                stats['text'] = '\n'.join(['","'.join(row) for row in head])
+            self.metadata.update({'encoding': encoding, **stats})
+        except Exception as e:
+            raise FileProcessingFailedError(
+                f"Error encountered while processing {self.file_path}: {e}"
+            )
+
+    @staticmethod
+    def _is_ascii_compatible(encoding: str) -> bool:
+        """
+        Checks whether a file in this encoding can be split at raw byte offsets.
+
+        Args:
+            encoding (str): Detected encoding name, or None.
+
+        Returns:
+            bool: True for ASCII, UTF-8 (with or without BOM) and single-byte Latin/Windows code pages.
+        """
+        if encoding is None:
+            return True
+        return codecs.lookup(encoding).name.startswith(ASCII_COMPATIBLE_CODECS)
+
+    def _stream_stats(self, encoding: str) -> dict:
+        """
+        Computes the statistics in one pass over the file in text mode.
+
+        A decoding error restarts the pass with Windows-1252, then with the detected encoding and
+        replacement characters.
+
+        Args:
+            encoding (str): Detected encoding of the file.
+
+        Returns:
+            dict: Statistics as returned by `_row_stats`, plus the 'encoding' used.
+        """
+        for candidate in dict.fromkeys((encoding, FALLBACK_ENCODING)):
+            try:
+                with open(self.file_path, 'r', newline='\n', encoding=candidate) as f:
+                    return {**_row_stats(csv.reader(f), self.head_rows), 'encoding': candidate}
+            except UnicodeDecodeError:
+                pass
+        with open(self.file_path, 'r', newline='\n', encoding=encoding, errors='replace') as f:
+            return {**_row_stats(csv.reader(f), self.head_rows), 'encoding': encoding}
+
+    def _chunked_stats(self, encoding: str) -> dict:
+        """
+        Splits the file at row boundaries and aggregates the statistics of each chunk.
+
+        Args:
+            encoding (str): Encoding used to decode every chunk.
+
+        Returns:
+            dict: Aggregated 'num_rows', 'num_cols', 'num_cells', 'empty_cells' and 'head', plus the
+                  'encoding' of the first chunk that needed a fallback, or `encoding` if none did.
+        """
+        offsets = find_row_boundaries(self.file_path, self.chunk_size)
+        ranges = list(zip(offsets, offsets[1:]))
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            chunk_stats = list(pool.map(_chunk_stats, [str(self.file_path)] * len(ranges), *zip(*ranges),
+                                        [encoding] * len(ranges), [self.head_rows] * len(ranges)))
+        stats = merge_row_stats(chunk_stats, self.head_rows)
+        stats['encoding'] = next((chunk['encoding'] for chunk in chunk_stats if chunk['encoding'] != encoding),
+                                 encoding)
+        return stats
+
     def save(self, output_path: str = None) -> None:
         """
         Saves the processed CSV file to the specified output path with updated metadata.
@@ -69,11 +201,17 @@ class CsvFileProcessor(FileProcessorStrategy):
         Args:
             output_path (str): Path to save the processed CSV file. If None, overwrites the original file.
 
+        In streaming mode 'text' only holds a sample, so the original file is copied unchanged.
+
         Raises:
             FileProcessingFailedError: If an error occurs while saving the CSV file.
         """
         try:
             save_path = output_path or self.file_path
+            if self.streaming:
+                if os.path.abspath(save_path) != os.path.abspath(self.file_path):
+                    shutil.copyfile(self.file_path, save_path)
+                return
             with open(save_path, 'w', newline='\n', encoding=self.metadata['encoding']) as f:
                 writer = csv.writer(f)
                 rows = self.metadata['text'].split('\n')
@@ -83,3 +221,130 @@ class CsvFileProcessor(FileProcessorStrategy):
             raise FileProcessingFailedError(
                 f"Error encountered while saving file {self.file_path} to {save_path}: {e}"
             )
+
+
+def _row_stats(reader, head_rows: int = None) -> dict:
+    """
+    Counts rows, columns, cells and empty cells in one pass over a CSV reader.
+
+    Args:
+        reader (Iterable[list]): Parsed CSV rows.
+        head_rows (int): Number of leading rows to keep. None keeps none.
+
+    Returns:
+        dict: 'num_rows', 'num_cols' (length of the first row), 'num_cells', 'empty_cells' and 'head'.
+    """
+    num_rows = num_cols = num_cells = empty_cells = 0
+    head = []
+    for row in reader:
+        if not num_rows:
+            num_cols = len(row)
+        if head_rows and len(head) < head_rows:
+            head.append(row)
+        num_rows += 1
+        num_cells += len(row)
+        empty_cells += sum(cell in ('', ' ') for cell in row)
+    return {
+        'num_rows': num_rows,
+        'num_cols': num_cols,
+        'num_cells': num_cells,
+        'empty_cells': empty_cells,
+        'head': head,
+    }
+
+
+def _chunk_stats(file_path: str, start: int, end: int, encoding: str, head_rows: int = None) -> dict:
+    """
+    Computes row statistics for the byte range [start, end) of a CSV file.
+
+    Args:
+        file_path (str): Path of the CSV file.
+        start (int): Offset of the first byte of the chunk; must be a row boundary.
+        end (int): Offset just past the last byte of the chunk; must be a row boundary.
+        encoding (str): Encoding used to decode the chunk, falling back as in `decode_fallback`.
+        head_rows (int): Number of leading rows to keep.
+
+    Returns:
+        dict: Statistics as returned by `_row_stats`, plus the 'encoding' used.
+    """
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        raw = f.read(end - start)
+    try:
+        content = raw.decode(encoding)
+    except UnicodeDecodeError:
+        content, encoding = decode_fallback(raw, encoding)
+    with io.StringIO(content, newline='\n') as f:
+        return {**_row_stats(csv.reader(f), head_rows), 'encoding': encoding}
+
+
+def merge_row_stats(chunk_stats, head_rows: int = None) -> dict:
+    """
+    Aggregates per-chunk statistics, given in file order, into whole-file statistics.
+
+    Args:
+        chunk_stats (Iterable[dict]): Statistics of consecutive chunks as returned by `_row_stats`.
+        head_rows (int): Number of leading rows to keep across chunks.
+
+    Returns:
+        dict: Statistics for the whole file, in the same shape as each chunk's.
+    """
+    merged = {'num_rows': 0, 'num_cols': 0, 'num_cells': 0, 'empty_cells': 0, 'head': []}
+    for stats in chunk_stats:
+        if not merged['num_rows']:
+            merged['num_cols'] = stats['num_cols']
+        for key in ('num_rows', 'num_cells', 'empty_cells'):
+            merged[key] += stats[key]
+        if head_rows:
+            merged['head'].extend(stats['head'][:head_rows - len(merged['head'])])
+    return merged
+
+
+def find_row_boundaries(file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> list:
+    """
+    Finds byte offsets that split a CSV file into chunks of roughly `chunk_size` bytes.
+
+    Each split point is the first newline at or after the nominal boundary that is not inside a
+    quoted field, tracked by the parity of quote characters seen so far (doubled quotes cancel
+    out). The file is scanned once in large blocks without being parsed. Assumes an ASCII-compatible
+    encoding and RFC 4180 style quoting.
+
+    Args:
+        file_path (str): Path of the CSV file.
+        chunk_size (int): Target chunk size in bytes.
+
+    Returns:
+        list: Sorted offsets starting with 0 and ending with the file size; consecutive offsets
+              delimit one chunk.
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"Chunk size must be positive: {chunk_size}")
+
+    boundaries = [0]
+    next_target = chunk_size
+    in_quotes = False
+    offset = 0
+    with open(file_path, 'rb') as f:
+        while True:
+            block = f.read(SCAN_BLOCK_SIZE)
+            if not block:
+                break
+            pos = 0  # in_quotes holds the quoting state at block[pos]
+            while offset + len(block) > next_target:
+                newline = block.find(b'\n', max(next_target - offset, pos))
+                while newline != -1:
+                    in_quotes ^= bool(block.count(b'"', pos, newline) & 1)
+                    pos = newline
+                    if not in_quotes:
+                        break
+                    newline = block.find(b'\n', newline + 1)
+                if newline == -1:
+                    break
+                boundaries.append(offset + newline + 1)
+                next_target = offset + newline + 1 + chunk_size
+            in_quotes ^= bool(block.count(b'"', pos) & 1)
+            offset += len(block)
+
+    if boundaries[-1] != offset:
+        boundaries.append(offset)
+    return boundaries
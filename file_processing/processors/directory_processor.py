@@ -1,3 +1,5 @@
+import os
+import stat
 from pathlib import Path
 from file_processing.file_processor_strategy import FileProcessorStrategy
 from file_processing.errors import FileProcessingFailedError
@@ -5,27 +7,30 @@ from file_processing.errors import FileProcessingFailedError
 class DirectoryProcessor(FileProcessorStrategy):
     """
     Processor for handling directories, gathering metadata and saving information about
-    the top-level contents of the directory.
+    the top-level contents of the directory. Recursive traversal is available through `walk`
+    and `summarize_tree`, both built on `os.scandir`.
 
     Attributes:
         metadata (dict): Contains metadata such as the number of items, total size, and permissions.
     """
 
-    def __init__(self, dir_path: str, open_file: bool = True) -> None:
+    def __init__(self, dir_path: str, open_file: bool = True,
+                 stat_result: os.stat_result = None) -> None:
         """
         Initializes the DirectoryProcessor with the specified directory path.
 
         Args:
             dir_path (str): Path to the directory to process.
             open_file (bool): Indicates whether to process the directory immediately.
+            stat_result (os.stat_result): Optional precomputed `os.lstat` result or `os.DirEntry`.
 
         Raises:
             FileProcessingFailedError: If the provided path is not a directory.
         """
-        super().__init__(dir_path, open_file)
+        super().__init__(dir_path, open_file, stat_result)
 
         # Ensure that this path is a directory
-        if not self.file_path.is_dir():
+        if not stat.S_ISDIR(self.stat_result.st_mode):
             raise FileProcessingFailedError(f"Path is not a directory: {dir_path}")
 
         self.metadata = self._gather_basic_metadata()
@@ -34,16 +39,30 @@ class DirectoryProcessor(FileProcessorStrategy):
         """
         Gathers and returns basic metadata about the directory, excluding subdirectories.
 
+        The top level is listed once with `os.scandir`; file sizes come from the cached
+        `DirEntry` stat data rather than a separate `stat()` per path.
+
         Returns:
             dict: Metadata with the number of items, total size of files, and directory permissions.
         """
+        entries = self._scan_top_level()
         metadata = {
-            'num_items_in_top_level': len(list(self.file_path.iterdir())),
-            'total_size_of_files_in_top_level': self._get_top_level_size(),
+            'num_items_in_top_level': len(entries),
+            'total_size_of_files_in_top_level': self._get_top_level_size(entries),
             'permissions': self._get_permissions(),  # Gather directory permissions
         }
         return metadata
 
+    def _scan_top_level(self) -> list:
+        """
+        Lists the top-level entries of the directory in a single `os.scandir` pass.
+
+        Returns:
+            list: `os.DirEntry` objects for each item in the top-level directory.
+        """
+        with os.scandir(self.file_path) as it:
+            return list(it)
+
     def _get_permissions(self) -> str:
         """
         Fetches and returns the permissions of the directory in octal format.
@@ -51,16 +70,20 @@ class DirectoryProcessor(FileProcessorStrategy):
         Returns:
             str: Permissions of the directory.
         """
-        return oct(self.file_path.stat().st_mode)[-3:]
+        return oct(self.stat_result.st_mode)[-3:]
 
-    def _get_top_level_size(self) -> int:
+    def _get_top_level_size(self, entries: list = None) -> int:
         """
         Calculates the total size of files in the top-level directory (excluding subdirectories).
 
+        Args:
+            entries (list): Optional `os.DirEntry` list from a previous scan of the top level.
+
         Returns:
             int: Total size of files in bytes.
         """
-        return sum(f.stat().st_size for f in self.file_path.iterdir() if f.is_file())
+        entries = self._scan_top_level() if entries is None else entries
+        return sum(e.stat().st_size for e in entries if e.is_file())
 
     def list_files_in_top_level(self) -> list:
         """
@@ -69,7 +92,7 @@ class DirectoryProcessor(FileProcessorStrategy):
         Returns:
             list: List of Path objects for each file in the top-level directory.
         """
-        return [f for f in self.file_path.iterdir() if f.is_file()]
+        return [Path(e.path) for e in self._scan_top_level() if e.is_file()]
 
     def list_top_level_subdirectories(self) -> list:
         """
@@ -78,7 +101,167 @@ class DirectoryProcessor(FileProcessorStrategy):
         Returns:
             list: List of Path objects for each subdirectory in the top-level directory.
         """
-        return [d for d in self.file_path.iterdir() if d.is_dir()]
+        return [Path(e.path) for e in self._scan_top_level() if e.is_dir()]
+
+    def walk(self, max_depth: int = None, follow_symlinks: bool = False):
+        """
+        Recursively yields every entry below the directory using `os.scandir`.
+
+        Entries are yielded as `os.DirEntry` objects, whose cached stat data can be handed straight
+        to `File(entry.path, stat_result=entry)` without another stat call. Directories that cannot
+        be listed (e.g. permission denied) are skipped.
+
+        Args:
+            max_depth (int): How many directory levels below the top level to descend into.
+                             0 yields only top-level entries; None walks the whole tree.
+            follow_symlinks (bool): Whether to descend into symbolic links to directories. Each
+                                    directory is then entered at most once, so links to an
+                                    ancestor or to an already walked directory are not followed.
+
+        Yields:
+            tuple: (`os.DirEntry`, depth) for each entry, where depth 0 is the top level.
+        """
+        for entry, depth, _ in self._walk(max_depth, follow_symlinks):
+            yield entry, depth
+
+    def _walk(self, max_depth: int = None, follow_symlinks: bool = False):
+        """
+        Walks the tree as `walk` does, also reporting which directories are descended into.
+
+        Args:
+            max_depth (int): How many directory levels below the top level to descend into.
+            follow_symlinks (bool): Whether to descend into symbolic links to directories.
+
+        Yields:
+            tuple: (`os.DirEntry`, depth, descended) for each entry.
+        """
+        # With links followed, the walk could loop; directories are identified by (device, inode)
+        visited = None
+        if follow_symlinks:
+            visited = set()
+            self._first_visit(str(self.file_path), visited)
+        stack = [(str(self.file_path), 0)]
+        while stack:
+            dir_path, depth = stack.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    for entry in it:
+                        descend = ((max_depth is None or depth < max_depth)
+                                   and self._is_walkable_dir(entry, follow_symlinks)
+                                   and (visited is None or self._first_visit(entry.path, visited)))
+                        yield entry, depth, descend
+                        if descend:
+                            stack.append((entry.path, depth + 1))
+            except OSError:
+                continue
+
+    def summarize_tree(self, max_depth: int = None, follow_symlinks: bool = False) -> dict:
+        """
+        Computes per-subtree aggregates for the directory in a single recursive walk.
+
+        Each directory's aggregate includes everything below it (within `max_depth`): the number
+        of files, their total size in bytes, a histogram of file extensions and the newest file
+        modification time.
+
+        Args:
+            max_depth (int): How many directory levels below the top level to descend into.
+                             None walks the whole tree.
+            follow_symlinks (bool): Whether to descend into symbolic links to directories.
+
+        Returns:
+            dict: Mapping of directory paths relative to this directory ('.' for the directory
+                  itself) to dicts with 'num_files', 'total_size', 'extensions' and 'newest_mtime'.
+        """
+        root = str(self.file_path)
+        summaries = {root: self._empty_summary()}
+        parents = {}
+        order = [root]  # Pre-order: every directory appears after its parent
+
+        for entry, depth, descended in self._walk(max_depth, follow_symlinks):
+            parent = os.path.dirname(entry.path)
+            if self._is_walkable_dir(entry, follow_symlinks):
+                if descended:
+                    summaries[entry.path] = self._empty_summary()
+                    parents[entry.path] = parent
+                    order.append(entry.path)
+                continue
+            if not entry.is_file():
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            summary = summaries[parent]
+            summary['num_files'] += 1
+            summary['total_size'] += st.st_size
+            ext = os.path.splitext(entry.name)[1]
+            summary['extensions'][ext] = summary['extensions'].get(ext, 0) + 1
+            if summary['newest_mtime'] is None or st.st_mtime > summary['newest_mtime']:
+                summary['newest_mtime'] = st.st_mtime
+
+        # Roll children into parents, deepest directories first
+        for dir_path in reversed(order[1:]):
+            child, parent = summaries[dir_path], summaries[parents[dir_path]]
+            parent['num_files'] += child['num_files']
+            parent['total_size'] += child['total_size']
+            for ext, count in child['extensions'].items():
+                parent['extensions'][ext] = parent['extensions'].get(ext, 0) + count
+            if child['newest_mtime'] is not None and (
+                    parent['newest_mtime'] is None or child['newest_mtime'] > parent['newest_mtime']):
+                parent['newest_mtime'] = child['newest_mtime']
+
+        return {os.path.relpath(path, root): summary for path, summary in summaries.items()}
+
+    @staticmethod
+    def _is_walkable_dir(entry: os.DirEntry, follow_symlinks: bool) -> bool:
+        """
+        Checks whether a directory entry should be descended into.
+
+        Args:
+            entry (os.DirEntry): The entry to check.
+            follow_symlinks (bool): Whether symbolic links to directories are descended into.
+
+        Returns:
+            bool: True if the entry is a directory that the walk should enter.
+        """
+        try:
+            return entry.is_dir(follow_symlinks=follow_symlinks)
+        except OSError:
+            return False
+
+    @staticmethod
+    def _first_visit(dir_path: str, visited: set) -> bool:
+        """
+        Checks whether a directory is reached for the first time, recording it if so.
+
+        `os.stat` is used rather than `DirEntry.stat`, which reports no inode on Windows.
+
+        Args:
+            dir_path (str): The directory, whose symbolic links are resolved.
+            visited (set): (device, inode) identities of the directories already entered.
+
+        Returns:
+            bool: True if the directory has not been entered before and can be stat'ed.
+        """
+        try:
+            st = os.stat(dir_path)
+        except OSError:
+            return False
+        key = (st.st_dev, st.st_ino)
+        if key in visited:
+            return False
+        visited.add(key)
+        return True
+
+    @staticmethod
+    def _empty_summary() -> dict:
+        """
+        Returns an empty per-directory aggregate.
+
+        Returns:
+            dict: Aggregate with zeroed counters.
+        """
+        return {'num_files': 0, 'total_size': 0, 'extensions': {}, 'newest_mtime': None}
 
     def process(self) -> None:
         """Processes the directory; intended as a placeholder for interface compatibility."""
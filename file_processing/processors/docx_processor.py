@@ -1,30 +1,54 @@
-from io import BytesIO
-import msoffcrypto
+import os
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import Iterator
 from docx import Document
-from file_processing.errors import FileProcessingFailedError, FileCorruptionError
+from file_processing.errors import FileProcessingFailedError
 from file_processing.file_processor_strategy import FileProcessorStrategy
+from file_processing.office import find_part, is_encrypted_office_file, part_relationships, read_core_properties
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+# Text equivalents of run content, matching python-docx's `Run.text`
+RUN_CONTENT = {
+    f'{W}tab': '\t',
+    f'{W}ptab': '\t',
+    f'{W}cr': '\n',
+    f'{W}noBreakHyphen': '-',
+}
+
+# Footnote/endnote types that hold separator lines rather than note text
+SEPARATOR_NOTE_TYPES = {'separator', 'continuationSeparator', 'continuationNotice'}
 
 class DocxFileProcessor(FileProcessorStrategy):
     """
     Processor for handling .docx files, extracting metadata and saving modifications.
 
+    Text is extracted by streaming the WordprocessingML parts of the zip package with `iterparse`;
+    python-docx is only used to write core properties back in `save`.
+
     Attributes:
         metadata (dict): Contains metadata fields such as 'text', 'author', 'last_modified_by',
-                         and 'has_password' if the file is opened.
+                         'has_password', 'tables', 'headers', 'footers' and 'footnotes' if the
+                         file is opened. 'text' holds the body paragraphs only, as in python-docx.
     """
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
+    PROCESSOR_VERSION = 2
+
+    def __init__(self, file_path: str, open_file: bool = True,
+                 stat_result: os.stat_result = None) -> None:
         """
         Initializes the DocxFileProcessor with the specified file path.
 
         Args:
             file_path (str): Path to the .docx file to process.
             open_file (bool): Indicates whether to open and process the file immediately.
+            stat_result (os.stat_result): Optional precomputed `os.lstat` result or `os.DirEntry`.
 
         Sets:
             metadata (dict): Populated with a message if `open_file` is False, or with default metadata otherwise.
         """
-        super().__init__(file_path, open_file)
+        super().__init__(file_path, open_file, stat_result)
         self.metadata = {'message': 'File was not opened'} if not open_file else self._default_metadata()
 
     def _default_metadata(self) -> dict:
@@ -54,26 +78,33 @@ class DocxFileProcessor(FileProcessorStrategy):
             return
 
         with open(self.file_path, 'rb') as f:
-            file_content = BytesIO(f.read())
-
-        try:
-            office_file = msoffcrypto.OfficeFile(file_content)
-            if office_file.is_encrypted():
+            if is_encrypted_office_file(f):
                 self.metadata["has_password"] = True
                 return
-        except Exception as e:
-            raise FileCorruptionError(f"File is corrupted: {self.file_path}") from e
+            try:
+                with zipfile.ZipFile(f) as package:
+                    document_part = find_part(package, 'officeDocument', default='word/document.xml')
+                    paragraphs, tables = [], []
+                    for kind, content in iter_body_blocks(package, document_part):
+                        (paragraphs if kind == 'p' else tables).append(content)
 
-        try:
-            file_content.seek(0)  # Reset the position to the start
-            doc = Document(file_content)
-            self.metadata.update({'text': self.extract_text_from_docx(doc)})
-            self.metadata.update({'author': doc.core_properties.author})
-            self.metadata.update({'last_modified_by': doc.core_properties.last_modified_by})
-        except Exception as e:
-            raise FileProcessingFailedError(
-                f"Error encountered while processing {self.file_path}: {e}"
-            )
+                    parts = {'header': [], 'footer': [], 'footnotes': []}
+                    for rel_type, part_name in part_relationships(package, document_part):
+                        if rel_type in parts:
+                            parts[rel_type].extend(iter_part_paragraphs(package, part_name))
+
+                    self.metadata.update({
+                        'text': '\n'.join(paragraphs),
+                        'tables': tables,
+                        'headers': '\n'.join(parts['header']),
+                        'footers': '\n'.join(parts['footer']),
+                        'footnotes': '\n'.join(parts['footnotes']),
+                        **read_core_properties(package)
+                    })
+            except Exception as e:
+                raise FileProcessingFailedError(
+                    f"Error encountered while processing {self.file_path}: {e}"
+                )
 
     def save(self, output_path: str = None) -> None:
         """
@@ -100,23 +131,131 @@ class DocxFileProcessor(FileProcessorStrategy):
                 f"Error encountered while saving to {save_path}: {e}"
             )
 
-    def extract_text_from_docx(self, doc: Document) -> str:
+    def iter_paragraphs(self) -> Iterator[str]:
         """
-        Extracts and returns the full text content from a .docx Document object.
-
-        Args:
-            doc (Document): A `Document` instance representing the .docx file.
+        Lazily yields the text of each body paragraph, streaming the document part from the zip.
 
-        Returns:
-            str: Extracted text content from the .docx file.
+        Yields:
+            str: The text of one paragraph, in document order.
 
         Raises:
-            FileProcessingFailedError: If an error occurs while reading the document.
+            FileProcessingFailedError: If the file is not a readable .docx package.
         """
         try:
-            full_text = [para.text for para in doc.paragraphs]
-            return '\n'.join(full_text)
-        except Exception as e:
+            with zipfile.ZipFile(self.file_path) as package:
+                document_part = find_part(package, 'officeDocument', default='word/document.xml')
+                for kind, content in iter_body_blocks(package, document_part):
+                    if kind == 'p':
+                        yield content
+        except (zipfile.BadZipFile, KeyError, ET.ParseError) as e:
             raise FileProcessingFailedError(
-                f"Error encountered while opening or processing {self.file_path}: {e}"
-            )
\ No newline at end of file
+                f"Error encountered while processing {self.file_path}: {e}"
+            )
+
+
+def paragraph_text(paragraph: ET.Element) -> str:
+    """
+    Returns the text of a `w:p` element the way python-docx's `Paragraph.text` does.
+
+    Only runs that are direct children of the paragraph or of its hyperlinks contribute; breaks,
+    tabs and no-break hyphens are translated to their plain-text equivalents.
+
+    Args:
+        paragraph (Element): The `w:p` element.
+
+    Returns:
+        str: The paragraph text.
+    """
+    parts = []
+    for child in paragraph:
+        if child.tag == f'{W}r':
+            runs = (child,)
+        elif child.tag == f'{W}hyperlink':
+            runs = child.iterfind(f'{W}r')
+        else:
+            continue
+        for run in runs:
+            for content in run:
+                if content.tag == f'{W}t':
+                    parts.append(content.text or '')
+                elif content.tag == f'{W}br':
+                    parts.append('\n' if content.get(f'{W}type', 'textWrapping') == 'textWrapping' else '')
+                else:
+                    parts.append(RUN_CONTENT.get(content.tag, ''))
+    return ''.join(parts)
+
+
+def table_rows(table: ET.Element) -> list:
+    """
+    Returns the cell texts of a `w:tbl` element, row by row.
+
+    Args:
+        table (Element): The `w:tbl` element.
+
+    Returns:
+        list: One list of cell texts per row; paragraphs within a cell are joined with newlines.
+    """
+    return [
+        ['\n'.join(paragraph_text(p) for p in cell.iterfind(f'{W}p')) for cell in row.iterfind(f'{W}tc')]
+        for row in table.iterfind(f'{W}tr')
+    ]
+
+
+def iter_body_blocks(package: zipfile.ZipFile, part_name: str) -> Iterator[tuple]:
+    """
+    Streams the top-level paragraphs and tables of a document body.
+
+    Each block is discarded as soon as it has been converted, so memory stays bounded by the
+    largest single paragraph or table rather than the whole document.
+
+    Args:
+        package (zipfile.ZipFile): The open .docx package.
+        part_name (str): Name of the main document part.
+
+    Yields:
+        tuple: ('p', paragraph text) or ('tbl', table rows), in document order.
+    """
+    depth = 0
+    body = None
+    with package.open(part_name) as stream:
+        for event, element in ET.iterparse(stream, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                if element.tag == f'{W}body':
+                    body, body_depth = element, depth
+                continue
+
+            if body is not None and depth == body_depth + 1:
+                if element.tag == f'{W}p':
+                    yield 'p', paragraph_text(element)
+                elif element.tag == f'{W}tbl':
+                    yield 'tbl', table_rows(element)
+                body.remove(element)
+            depth -= 1
+
+
+def iter_part_paragraphs(package: zipfile.ZipFile, part_name: str) -> Iterator[str]:
+    """
+    Streams the text of every paragraph in a header, footer or notes part, including table cells.
+
+    Separator footnotes and endnotes are skipped.
+
+    Args:
+        package (zipfile.ZipFile): The open .docx package.
+        part_name (str): Name of the part to read.
+
+    Yields:
+        str: The text of each paragraph, in document order.
+    """
+    skipping = None
+    with package.open(part_name) as stream:
+        for event, element in ET.iterparse(stream, events=('start', 'end')):
+            if event == 'start':
+                if skipping is None and element.get(f'{W}type') in SEPARATOR_NOTE_TYPES:
+                    skipping = element
+                continue
+            if element is skipping:
+                skipping = None
+            elif skipping is None and element.tag == f'{W}p':
+                yield paragraph_text(element)
+                element.clear()
@@ -1,36 +1,70 @@
+import os
+import math
 import pefile
 from pathlib import Path
 import shutil
 from file_processing.errors import FileProcessingFailedError
 from file_processing.file_processor_strategy import FileProcessorStrategy
 
+try:
+    import numpy
+except ImportError:  # Optional: only speeds up byte histograms for entropy
+    numpy = None
+
+# For each high nibble, the byte values to delete from a buffer to keep only those having it
+OTHER_HIGH_NIBBLES = [bytes(value for value in range(256) if value >> 4 != high) for high in range(16)]
+
 class ExeFileProcessor(FileProcessorStrategy):
     """
     Processor for handling .exe files, extracting metadata and saving the file.
 
     Attributes:
         metadata (dict): Contains metadata fields such as 'entry_point', 'machine', 'num_sections',
-                         'imports', and 'sections' if the file is opened.
+                         'imports', 'imphash', and 'sections' if the file is opened.
+        imports (bool): Parses the import directory for 'imports' and 'imphash'.
+        exports (bool): Parses the export directory for 'exports'.
+        resources (bool): Parses the resource directory for 'resources'.
+
+    Headers and the section table are read with pefile's `fast_load`; only the data directories
+    needed by the enabled fields are parsed afterwards.
     """
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
+    def __init__(self, file_path: str, open_file: bool = True,
+                 stat_result: os.stat_result = None, imports: bool = True,
+                 exports: bool = False, resources: bool = False) -> None:
         """
         Initializes the ExeFileProcessor with the specified file path.
 
         Args:
             file_path (str): Path to the .exe file to process.
             open_file (bool): Indicates whether to open and process the file immediately.
+            stat_result (os.stat_result): Optional precomputed `os.lstat` result or `os.DirEntry`.
+            imports (bool): Extracts imported functions and the imphash.
+            exports (bool): Extracts exported symbol names.
+            resources (bool): Extracts the number of resources of each type.
 
         Sets:
             metadata (dict): Populated with 'message' if `open_file` is False.
         """
-        super().__init__(file_path, open_file)
+        super().__init__(file_path, open_file, stat_result)
         self.metadata = {'message': 'File was not opened'} if not open_file else {}
+        self.imports = imports
+        self.exports = exports
+        self.resources = resources
+
+    def cache_token(self) -> str:
+        """
+        Identifies the extraction logic, including which data directories are parsed.
+
+        Returns:
+            str: Token for metadata cache keys.
+        """
+        return f"{super().cache_token()}:{self.imports}:{self.exports}:{self.resources}"
 
     def process(self) -> None:
         """
         Extracts metadata from the .exe file, including entry point, machine type, number of sections,
-        imports, and section details.
+        imports, imphash, and section details, plus exports and resources when enabled.
 
         Raises:
             FileProcessingFailedError: If an error occurs during .exe file processing.
@@ -39,14 +73,33 @@ class ExeFileProcessor(FileProcessorStrategy):
             return
 
         try:
-            pe = pefile.PE(self.file_path)
-            self.metadata.update({
-                "entry_point": hex(pe.OPTIONAL_HEADER.AddressOfEntryPoint),
-                "machine": hex(pe.FILE_HEADER.Machine),
-                "num_sections": len(pe.sections),
-                "imports": self.extract_imports(pe),
-                "sections": self.extract_sections(pe),
-            })
+            pe = pefile.PE(self.file_path, fast_load=True)
+            try:
+                directories = [
+                    pefile.DIRECTORY_ENTRY[name] for name, enabled in (
+                        ('IMAGE_DIRECTORY_ENTRY_IMPORT', self.imports),
+                        ('IMAGE_DIRECTORY_ENTRY_EXPORT', self.exports),
+                        ('IMAGE_DIRECTORY_ENTRY_RESOURCE', self.resources),
+                    ) if enabled
+                ]
+                if directories:
+                    pe.parse_data_directories(directories=directories)
+
+                self.metadata.update({
+                    "entry_point": hex(pe.OPTIONAL_HEADER.AddressOfEntryPoint),
+                    "machine": hex(pe.FILE_HEADER.Machine),
+                    "num_sections": len(pe.sections),
+                    "sections": self.extract_sections(pe),
+                })
+                if self.imports:
+                    self.metadata["imports"] = self.extract_imports(pe)
+                    self.metadata["imphash"] = pe.get_imphash()
+                if self.exports:
+                    self.metadata["exports"] = self.extract_exports(pe)
+                if self.resources:
+                    self.metadata["resources"] = self.extract_resources(pe)
+            finally:
+                pe.close()
         except Exception as e:
             raise FileProcessingFailedError(
                 f"Error encountered while processing {self.file_path}: {e}"
@@ -79,11 +132,54 @@ class ExeFileProcessor(FileProcessorStrategy):
             )
         return imports
 
+    @staticmethod
+    def extract_exports(pe):
+        """
+        Extracts the names of exported symbols from the .exe file.
+
+        Args:
+            pe (PE): A `PE` instance whose export directory has been parsed.
+
+        Returns:
+            list: Exported symbol names, with unnamed exports given as 'ordinal_<n>'.
+        """
+        if not hasattr(pe, 'DIRECTORY_ENTRY_EXPORT'):
+            return []
+        return [
+            symbol.name.decode('utf-8') if symbol.name else f"ordinal_{symbol.ordinal}"
+            for symbol in pe.DIRECTORY_ENTRY_EXPORT.symbols
+        ]
+
+    @staticmethod
+    def extract_resources(pe):
+        """
+        Counts the resources of each type in the .exe file.
+
+        Args:
+            pe (PE): A `PE` instance whose resource directory has been parsed.
+
+        Returns:
+            dict: Resource type (e.g. 'RT_ICON', or the custom type name) to number of resources.
+        """
+        resources = {}
+        if not hasattr(pe, 'DIRECTORY_ENTRY_RESOURCE'):
+            return resources
+        for resource_type in pe.DIRECTORY_ENTRY_RESOURCE.entries:
+            if resource_type.name is not None:
+                type_name = str(resource_type.name)
+            else:
+                type_name = pefile.RESOURCE_TYPE.get(resource_type.id, str(resource_type.id))
+            directory = getattr(resource_type, 'directory', None)
+            resources[type_name] = resources.get(type_name, 0) + (len(directory.entries) if directory else 0)
+        return resources
+
     @staticmethod
     def extract_sections(pe):
         """
         Extracts details of sections in the .exe file, such as name, virtual address, size of raw data, and entropy.
 
+        Entropy is computed from views of the memory-mapped file, without copying section data.
+
         Args:
             pe (PE): A `PE` instance representing the parsed .exe file.
 
@@ -95,13 +191,18 @@ class ExeFileProcessor(FileProcessorStrategy):
         """
         sections = []
         try:
-            for section in pe.sections:
-                sections.append({
-                    'name': section.Name.decode('utf-8').strip(),
-                    'virtual_address': hex(section.VirtualAddress),
-                    'size_of_raw_data': section.SizeOfRawData,
-                    'entropy': section.get_entropy(),
-                })
+            with memoryview(pe.__data__) as data:
+                for section in pe.sections:
+                    start = section.get_PointerToRawData_adj()
+                    end = min(start + section.SizeOfRawData, section.PointerToRawData + section.SizeOfRawData)
+                    with data[start:end] as section_data:
+                        entropy = byte_entropy(section_data)
+                    sections.append({
+                        'name': section.Name.decode('utf-8').strip(),
+                        'virtual_address': hex(section.VirtualAddress),
+                        'size_of_raw_data': section.SizeOfRawData,
+                        'entropy': entropy,
+                    })
         except Exception as e:
             raise FileProcessingFailedError(
                 f"Error encountered while extracting sections: {e}"
@@ -124,4 +225,54 @@ class ExeFileProcessor(FileProcessorStrategy):
         except Exception as e:
             raise FileProcessingFailedError(
                 f"Error encountered while saving {self.file_path}: {e}"
-            )
\ No newline at end of file
+            )
+
+
+def byte_entropy(data) -> float:
+    """
+    Computes the Shannon entropy of a buffer in bits per byte, as pefile's `get_entropy` does.
+
+    The byte histogram is built with NumPy's `bincount` when NumPy is installed, otherwise with
+    `byte_counts`.
+
+    Args:
+        data (bytes-like): The bytes to measure.
+
+    Returns:
+        float: Entropy between 0.0 and 8.0.
+    """
+    length = len(data)
+    if not length:
+        return 0.0
+    if numpy is not None:
+        counts = numpy.bincount(numpy.frombuffer(data, dtype=numpy.uint8), minlength=256)
+        counts = counts[counts > 0].tolist()
+    else:
+        counts = [count for count in byte_counts(data) if count]
+    entropy = 0
+    for count in counts:
+        p_x = count / length
+        entropy -= p_x * math.log(p_x, 2)
+    return entropy
+
+
+def byte_counts(data) -> list:
+    """
+    Counts the occurrences of each byte value without NumPy.
+
+    The buffer is split by high nibble with `bytes.translate`, then each part's 16 values are
+    counted with `bytes.count`, so all the work is done by C loops over contiguous bytes rather
+    than by one dictionary update per byte.
+
+    Args:
+        data (bytes-like): The bytes to count.
+
+    Returns:
+        list: 256 counts, indexed by byte value.
+    """
+    data = bytes(data)
+    counts = []
+    for high, other_bytes in enumerate(OTHER_HIGH_NIBBLES):
+        part = data.translate(None, other_bytes)
+        counts += [part.count(high << 4 | low) for low in range(16)] if part else [0] * 16
+    return counts
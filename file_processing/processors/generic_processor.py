@@ -1,3 +1,4 @@
+import os
 import shutil
 import logging
 from file_processing.errors import FileProcessingFailedError
@@ -13,19 +14,21 @@ class GenericFileProcessor(FileProcessorStrategy):
         parent_directory (Path): The directory containing the file.
     """
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
+    def __init__(self, file_path: str, open_file: bool = True,
+                 stat_result: os.stat_result = None) -> None:
         """
         Initializes the GenericFileProcessor with the specified file path.
 
         Args:
             file_path (str): Path to the file to process.
             open_file (bool): Indicates whether to open and process the file. Default is False.
+            stat_result (os.stat_result): Optional precomputed `os.lstat` result or `os.DirEntry`.
         
         Sets:
             metadata (dict): Contains a message noting limited functionality.
             parent_directory (Path): Set to the file's parent directory.
         """
-        super().__init__(file_path)
+        super().__init__(file_path, stat_result=stat_result)
         self.metadata = {'message': 'This is a generic processor. Limited functionality available. File was not opened'}
         self.parent_directory = self.file_path.parent  # Add parent_directory
 
@@ -1,7 +1,15 @@
+import os
+import mmap
 import struct
+import sys
+from array import array
+from collections.abc import Sequence
 from file_processing.file_processor_strategy import FileProcessorStrategy
 from file_processing.errors import FileProcessingFailedError
 
+UINT32 = struct.Struct("<I")
+UINT64 = struct.Struct("<Q")
+
 class GgufFileProcessor(FileProcessorStrategy):
     """
     Processor for handling GGUF files, extracting metadata and tensor information.
@@ -11,9 +19,22 @@ class GgufFileProcessor(FileProcessorStrategy):
         VALUE_FORMATS (dict): Mapping of value types to struct formats for unpacking.
         TENSOR_TYPES (dict): Mapping of tensor type identifiers to tensor type names.
         metadata (dict): Extracted metadata, including key-value pairs and tensor information.
-        tensors_info (list): Information about tensors in the file.
+                         'tensors_info' holds one plain dict per tensor (see `GgufTensorInfo.to_dict`).
+        tensors_info (list): `GgufTensorInfo` record of each tensor in the file.
+        data_offset (int): File offset of the tensor data section.
+        skip_arrays_larger_than (int): Arrays with more elements than this are not decoded.
+        LAZY_ARRAY_LENGTH (int): Arrays with more elements than this are returned as lazy views.
+
+    The header is parsed from a read-only memory map, so only the pages it spans are read. Short
+    arrays are decoded to lists, numeric ones in a single C-level pass. Longer arrays (tokenizer
+    vocabularies, scores, merges) are returned as read-only `GgufNumericArray` and
+    `GgufStringArray` sequences that keep the raw bytes and decode elements on access; convert
+    them with `list()` where a list is required, e.g. for JSON. `tensor_data` returns zero-copy
+    views of tensor bytes from the same kind of map.
     """
 
+    PROCESSOR_VERSION = 4
+
     GGUF_MAGIC_NUMBER = b"GGUF"
     VALUE_FORMATS = {
         0: "B",  # UINT8
@@ -28,6 +49,8 @@ class GgufFileProcessor(FileProcessorStrategy):
         11: "q",  # INT64
         12: "d",  # FLOAT64
     }
+    STRING_TYPE = 8
+    ARRAY_TYPE = 9
     TENSOR_TYPES = {
         0: "GGML_TYPE_F32",
         1: "GGML_TYPE_F16",
@@ -57,22 +80,89 @@ class GgufFileProcessor(FileProcessorStrategy):
         27: "GGML_TYPE_I64",
         28: "GGML_TYPE_F64",
         29: "GGML_TYPE_IQ1_M",
+        30: "GGML_TYPE_BF16",
     }
+    # (elements per block, bytes per block) of each tensor type, as in ggml's type traits
+    TENSOR_TYPE_SIZES = {
+        0: (1, 4),
+        1: (1, 2),
+        2: (32, 18),
+        3: (32, 20),
+        6: (32, 22),
+        7: (32, 24),
+        8: (32, 34),
+        9: (32, 36),
+        10: (256, 84),
+        11: (256, 110),
+        12: (256, 144),
+        13: (256, 176),
+        14: (256, 210),
+        15: (256, 292),
+        16: (256, 66),
+        17: (256, 74),
+        18: (256, 98),
+        19: (256, 50),
+        20: (32, 18),
+        21: (256, 110),
+        22: (256, 82),
+        23: (256, 136),
+        24: (1, 1),
+        25: (1, 2),
+        26: (1, 4),
+        27: (1, 8),
+        28: (1, 8),
+        29: (256, 56),
+        30: (1, 2),
+    }
+    # Tensor data is aligned to this many bytes unless the header sets general.alignment
+    DEFAULT_DATA_ALIGNMENT = 32
+    LAZY_ARRAY_LENGTH = 1024
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
+    def __init__(self, file_path: str, open_file: bool = True,
+                 stat_result: os.stat_result = None, skip_arrays_larger_than: int = None) -> None:
         """
         Initializes the GgufFileProcessor with the specified file path.
 
         Args:
             file_path (str): Path to the GGUF file to process.
             open_file (bool): Indicates whether to open and process the file.
+            stat_result (os.stat_result): Optional precomputed `os.lstat` result or `os.DirEntry`.
+            skip_arrays_larger_than (int): Arrays with more elements than this are replaced by a
+                                           {'array_type', 'array_length'} summary. None decodes all.
         """
-        super().__init__(file_path, open_file)
+        super().__init__(file_path, open_file, stat_result)
         self.magic_number = None
         self.version = None
         self.metadata = None
         self.tensors_info = None
         self.alignment = None
+        self.data_offset = None
+        self.skip_arrays_larger_than = skip_arrays_larger_than
+        self._tensors_by_name = None
+        self._mmap = None
+
+    def __getstate__(self) -> dict:
+        """
+        Drops the memory map so the processor can be sent to worker processes.
+
+        Returns:
+            dict: The picklable state of the processor.
+        """
+        state = self.__dict__.copy()
+        state['_mmap'] = None
+        return state
+
+    def cache_token(self) -> str:
+        """
+        Identifies the extraction logic, including the array size limit.
+
+        Returns:
+            str: Token for metadata cache keys.
+        """
+        token = super().cache_token()
+        if self.skip_arrays_larger_than is None:
+            return token
+        return f"{token}:skip_arrays={self.skip_arrays_larger_than}"
 
     def process(self) -> None:
         """
@@ -84,25 +174,26 @@ class GgufFileProcessor(FileProcessorStrategy):
         if not self.open_file:
             return
         try:
-            with open(self.file_path, "rb") as f:
+            with open(self.file_path, "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
                 # Read magic number
-                self.magic_number = f.read(4)
+                self.magic_number = buf[:4]
                 if self.magic_number != self.GGUF_MAGIC_NUMBER:
                     raise FileProcessingFailedError("Invalid GGUF magic number.")
 
                 # Read version
-                self.version = struct.unpack("I", f.read(4))[0]
+                self.version = UINT32.unpack_from(buf, 4)[0]
                 if self.version != 3:
                     raise FileProcessingFailedError("Unsupported GGUF version.")
 
                 # Read tensor count and metadata key-value count
-                tensor_count = struct.unpack("Q", f.read(8))[0]
-                metadata_kv_count = struct.unpack("Q", f.read(8))[0]
+                tensor_count, metadata_kv_count = struct.unpack_from("<QQ", buf, 8)
+                pos = 24
 
                 # Read metadata key-value pairs
                 self.metadata = {}
                 for _ in range(metadata_kv_count):
-                    key, value = self._read_metadata_kv(f)
+                    key, value, pos = self._read_metadata_kv(buf, pos)
                     self.metadata[key] = value
 
                 # Extract alignment
@@ -111,8 +202,13 @@ class GgufFileProcessor(FileProcessorStrategy):
                 # Read tensor information
                 self.tensors_info = []
                 for _ in range(tensor_count):
-                    tensor_info = self._read_tensor_info(f)
+                    tensor_info, pos = self._read_tensor_info(buf, pos)
                     self.tensors_info.append(tensor_info)
+                self._tensors_by_name = None
+
+                # The data section starts at the next multiple of the alignment
+                data_alignment = self.metadata.get("general.alignment", self.DEFAULT_DATA_ALIGNMENT)
+                self.data_offset = pos + -pos % data_alignment
 
                 # Store extracted metadata
                 self.metadata.update({
@@ -120,90 +216,489 @@ class GgufFileProcessor(FileProcessorStrategy):
                     "version": self.version,
                     "tensor_count": tensor_count,
                     "alignment": self.alignment,
-                    "tensors_info": self.tensors_info
+                    "tensors_info": [tensor.to_dict() for tensor in self.tensors_info],
+                    "data_offset": self.data_offset,
+                    "parameter_count": sum(tensor.n_elements for tensor in self.tensors_info),
+                    "tensor_bytes_by_type": self._tensor_bytes_by_type()
                 })
 
         except Exception as e:
             raise FileProcessingFailedError(f"Error processing GGUF file {self.file_path}: {e}")
 
-    def _read_string(self, f) -> str:
+    def load_cached_metadata(self, metadata: dict) -> None:
+        """
+        Installs previously extracted metadata and rebuilds the header fields and tensor index
+        used by `get_tensor_info` and `tensor_data`.
+
+        Args:
+            metadata (dict): Metadata produced by `process` for the same content and cache token.
+        """
+        super().load_cached_metadata(metadata)
+        self.magic_number = metadata["magic_number"].encode("utf-8")
+        self.version = metadata["version"]
+        self.alignment = metadata["alignment"]
+        self.data_offset = metadata["data_offset"]
+        self.tensors_info = [GgufTensorInfo.from_dict(info) for info in metadata["tensors_info"]]
+        self._tensors_by_name = None
+
+    def _read_string(self, buf, pos: int) -> tuple:
         """
-        Reads a string from the GGUF file.
+        Reads a length-prefixed string from the GGUF header.
 
         Args:
-            f (file object): Opened GGUF file.
+            buf (mmap.mmap): Memory map of the GGUF file.
+            pos (int): Offset of the string's length prefix.
 
         Returns:
-            str: Decoded string from the file.
+            tuple: (decoded string, offset just past the string).
         """
-        length = struct.unpack("Q", f.read(8))[0]
-        return f.read(length).decode("utf-8")
+        length = UINT64.unpack_from(buf, pos)[0]
+        pos += 8
+        return buf[pos:pos + length].decode("utf-8"), pos + length
 
-    def _read_metadata_kv(self, f):
+    def _read_metadata_kv(self, buf, pos: int) -> tuple:
         """
-        Reads a metadata key-value pair from the GGUF file.
+        Reads a metadata key-value pair from the GGUF header.
 
         Args:
-            f (file object): Opened GGUF file.
+            buf (mmap.mmap): Memory map of the GGUF file.
+            pos (int): Offset of the key.
 
         Returns:
-            tuple: Key-value pair, where key is a string and value varies by type.
+            tuple: (key, value, offset just past the value); the value type varies.
         """
-        key = self._read_string(f)
-        value_type = struct.unpack("I", f.read(4))[0]
-        value = self._read_value(f, value_type)
-        return key, value
+        key, pos = self._read_string(buf, pos)
+        value_type = UINT32.unpack_from(buf, pos)[0]
+        value, pos = self._read_value(buf, pos + 4, value_type)
+        return key, value, pos
 
-    def _read_value(self, f, value_type):
+    def _read_value(self, buf, pos: int, value_type: int) -> tuple:
         """
-        Reads a value from the GGUF file based on its type.
+        Reads a value from the GGUF header based on its type.
 
         Args:
-            f (file object): Opened GGUF file.
+            buf (mmap.mmap): Memory map of the GGUF file.
+            pos (int): Offset of the value.
             value_type (int): Type identifier for the value.
 
         Returns:
-            Any: Value read from the file, format depends on type.
+            tuple: (value, offset just past the value); the value format depends on the type.
 
         Raises:
             FileProcessingFailedError: If an unsupported value type is encountered.
         """
         if value_type in self.VALUE_FORMATS:
-            return struct.unpack(
-                self.VALUE_FORMATS[value_type],
-                f.read(struct.calcsize(self.VALUE_FORMATS[value_type]))
-            )[0]
-        if value_type == 8:  # STRING
-            return self._read_string(f)
-        if value_type == 9:  # ARRAY
-            array_type = struct.unpack("I", f.read(4))[0]
-            array_len = struct.unpack("Q", f.read(8))[0]
-            return [self._read_value(f, array_type) for _ in range(array_len)]
+            value_format = "<" + self.VALUE_FORMATS[value_type]
+            return struct.unpack_from(value_format, buf, pos)[0], pos + struct.calcsize(value_format)
+        if value_type == self.STRING_TYPE:
+            return self._read_string(buf, pos)
+        if value_type == self.ARRAY_TYPE:
+            array_type, array_len = struct.unpack_from("<IQ", buf, pos)
+            return self._read_array(buf, pos + 12, array_type, array_len)
         raise FileProcessingFailedError(f"Unsupported GGUF value type: {value_type}")
 
-    def _read_tensor_info(self, f) -> dict:
+    def _read_array(self, buf, pos: int, array_type: int, array_len: int) -> tuple:
         """
-        Reads tensor information from the GGUF file.
+        Reads the elements of an array from the GGUF header.
+
+        Numeric arrays are decoded in one pass over their bytes. Arrays longer than
+        `LAZY_ARRAY_LENGTH` become lazy `GgufNumericArray` or `GgufStringArray` views instead, and
+        arrays longer than `skip_arrays_larger_than` are stepped over and summarised.
 
         Args:
-            f (file object): Opened GGUF file.
+            buf (mmap.mmap): Memory map of the GGUF file.
+            pos (int): Offset of the first element.
+            array_type (int): Type identifier of the elements.
+            array_len (int): Number of elements.
 
         Returns:
-            dict: Dictionary containing tensor details.
+            tuple: (elements, offset just past the array). Elements are a list, a
+                   GgufNumericArray, a GgufStringArray or, for skipped arrays, a summary dict.
+
+        Raises:
+            FileProcessingFailedError: If an unsupported element type is encountered.
         """
-        name = self._read_string(f)
-        n_dimensions = struct.unpack("I", f.read(4))[0]
-        dimensions = struct.unpack(f"{n_dimensions}Q", f.read(8 * n_dimensions))
-        tensor_type = struct.unpack("I", f.read(4))[0]
-        offset = struct.unpack("Q", f.read(8))[0]
-        return {
-            "name": name,
-            "n_dimensions": n_dimensions,
-            "dimensions": dimensions,
-            "type": self.TENSOR_TYPES.get(tensor_type, "UNKNOWN"),
-            "offset": offset
-        }
+        skip = self.skip_arrays_larger_than is not None and array_len > self.skip_arrays_larger_than
+        lazy = array_len > self.LAZY_ARRAY_LENGTH
+        summary = {"array_type": array_type, "array_length": array_len}
+
+        if array_type in self.VALUE_FORMATS:
+            value_format = self.VALUE_FORMATS[array_type]
+            end = pos + array_len * struct.calcsize(value_format)
+            if skip:
+                return summary, end
+            if lazy:
+                return GgufNumericArray(buf[pos:end], value_format), end
+            return _unpack_array(buf[pos:end], value_format, array_len), end
+        if array_type == self.STRING_TYPE:
+            offsets, end = _string_offsets(buf, pos, array_len)
+            if skip:
+                return summary, end
+            strings = GgufStringArray(buf[pos:end], offsets)
+            return (strings if lazy else list(strings)), end
+
+        values = []
+        for _ in range(array_len):
+            value, pos = self._read_value(buf, pos, array_type)
+            values.append(value)
+        return (summary if skip else values), pos
+
+    def _read_tensor_info(self, buf, pos: int) -> tuple:
+        """
+        Reads tensor information from the GGUF header.
+
+        Args:
+            buf (mmap.mmap): Memory map of the GGUF file.
+            pos (int): Offset of the tensor's name.
+
+        Returns:
+            tuple: (GgufTensorInfo record, offset just past the tensor information).
+        """
+        name, pos = self._read_string(buf, pos)
+        n_dimensions = UINT32.unpack_from(buf, pos)[0]
+        dimensions = struct.unpack_from(f"<{n_dimensions}Q", buf, pos + 4)
+        pos += 4 + 8 * n_dimensions
+        tensor_type, offset = struct.unpack_from("<IQ", buf, pos)
+
+        n_elements = 1
+        for dimension in dimensions:
+            n_elements *= dimension
+        n_bytes = None
+        if tensor_type in self.TENSOR_TYPE_SIZES:
+            block_size, type_size = self.TENSOR_TYPE_SIZES[tensor_type]
+            n_bytes = n_elements // block_size * type_size
+
+        tensor_info = GgufTensorInfo(name, dimensions, tensor_type,
+                                     self.TENSOR_TYPES.get(tensor_type, "UNKNOWN"),
+                                     offset, n_elements, n_bytes)
+        return tensor_info, pos + 12
+
+    def _tensor_bytes_by_type(self) -> dict:
+        """
+        Totals the data size of the tensors of each type.
+
+        Returns:
+            dict: Tensor type name to total bytes. Types of unknown size are omitted.
+        """
+        totals = {}
+        for tensor in self.tensors_info:
+            if tensor.n_bytes is not None:
+                totals[tensor.type] = totals.get(tensor.type, 0) + tensor.n_bytes
+        return totals
+
+    def get_tensor_info(self, tensor) -> "GgufTensorInfo":
+        """
+        Looks up a tensor in the index built by `process`.
+
+        Args:
+            tensor (str | int): Tensor name, or its position in the header.
+
+        Returns:
+            GgufTensorInfo: The tensor's record.
+
+        Raises:
+            FileProcessingFailedError: If the file has not been processed or has no such tensor.
+        """
+        if self.tensors_info is None:
+            raise FileProcessingFailedError(f"GGUF file {self.file_path} has not been processed")
+        if isinstance(tensor, int):
+            return self.tensors_info[tensor]
+        if self._tensors_by_name is None:
+            self._tensors_by_name = {info.name: info for info in self.tensors_info}
+        if tensor not in self._tensors_by_name:
+            raise FileProcessingFailedError(f"Tensor {tensor} not found in {self.file_path}")
+        return self._tensors_by_name[tensor]
+
+    def tensor_data(self, tensor) -> memoryview:
+        """
+        Returns a zero-copy view of a tensor's raw bytes.
+
+        The view is backed by a memory map of the file that stays open until `close` is called,
+        so pages are only read when the view is accessed (e.g. by `hashlib`'s `update`).
+
+        Args:
+            tensor (str | int): Tensor name, or its position in the header.
+
+        Returns:
+            memoryview: Read-only bytes of the tensor, in its on-disk (possibly quantized) layout.
+
+        Raises:
+            FileProcessingFailedError: If the tensor is unknown, has a type of unknown size or lies
+                                       outside the file.
+        """
+        tensor_info = self.get_tensor_info(tensor)
+        if tensor_info.n_bytes is None:
+            raise FileProcessingFailedError(
+                f"Size of tensor {tensor_info.name} of type {tensor_info.type_id} is unknown"
+            )
+        start = self.data_offset + tensor_info.offset
+        end = start + tensor_info.n_bytes
+        buf = self._get_mmap()
+        if end > len(buf):
+            raise FileProcessingFailedError(
+                f"Tensor {tensor_info.name} extends past the end of {self.file_path}"
+            )
+        return memoryview(buf)[start:end]
+
+    def _get_mmap(self) -> mmap.mmap:
+        """
+        Maps the file read-only on first use and caches the map.
+
+        Returns:
+            mmap.mmap: Memory map of the whole file.
+        """
+        if self._mmap is None:
+            with open(self.file_path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def close(self) -> None:
+        """
+        Releases the memory map used by `tensor_data`.
+
+        If views returned by `tensor_data` are still alive, the map is unmapped once the last of
+        them is released instead.
+        """
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass
+            self._mmap = None
 
     def save(self, output_path: str = None) -> None:
         """No save implementation needed for GGUF files (read-only)."""
-        pass
\ No newline at end of file
+        pass
+
+
+class GgufTensorInfo:
+    """
+    Compact record of a tensor in the GGUF header.
+
+    Fields are also readable by key (e.g. `info["name"]`), and `to_dict` converts the record to
+    the plain dict stored in the processor's metadata.
+
+    Attributes:
+        name (str): Tensor name.
+        dimensions (tuple): Size of each dimension.
+        type_id (int): ggml tensor type identifier.
+        type (str): ggml tensor type name, or 'UNKNOWN'.
+        offset (int): Offset of the tensor's bytes from the start of the data section.
+        n_elements (int): Number of elements (parameters).
+        n_bytes (int): Size of the tensor's data, or None for types of unknown size.
+    """
+
+    __slots__ = ("name", "dimensions", "type_id", "type", "offset", "n_elements", "n_bytes")
+
+    def __init__(self, name: str, dimensions: tuple, type_id: int, type_name: str, offset: int,
+                 n_elements: int, n_bytes: int) -> None:
+        """
+        Initializes the record with the fields read from the header.
+
+        Args:
+            name (str): Tensor name.
+            dimensions (tuple): Size of each dimension.
+            type_id (int): ggml tensor type identifier.
+            type_name (str): ggml tensor type name, or 'UNKNOWN'.
+            offset (int): Offset of the tensor's bytes from the start of the data section.
+            n_elements (int): Number of elements (parameters).
+            n_bytes (int): Size of the tensor's data, or None for types of unknown size.
+        """
+        self.name = name
+        self.dimensions = dimensions
+        self.type_id = type_id
+        self.type = type_name
+        self.offset = offset
+        self.n_elements = n_elements
+        self.n_bytes = n_bytes
+
+    @property
+    def n_dimensions(self) -> int:
+        return len(self.dimensions)
+
+    @classmethod
+    def from_dict(cls, info: dict) -> "GgufTensorInfo":
+        """
+        Rebuilds a record from the dict returned by `to_dict`.
+
+        Args:
+            info (dict): Tensor details as stored in the processor's metadata.
+
+        Returns:
+            GgufTensorInfo: The record.
+        """
+        return cls(info["name"], tuple(info["dimensions"]), info["type_id"], info["type"],
+                   info["offset"], info["n_elements"], info["n_bytes"])
+
+    def to_dict(self) -> dict:
+        """
+        Converts the record to a JSON-serialisable dict.
+
+        Returns:
+            dict: 'name', 'n_dimensions', 'dimensions', 'type', 'type_id', 'offset', 'n_elements'
+                  and 'n_bytes'.
+        """
+        return {
+            "name": self.name,
+            "n_dimensions": self.n_dimensions,
+            "dimensions": self.dimensions,
+            "type": self.type,
+            "type_id": self.type_id,
+            "offset": self.offset,
+            "n_elements": self.n_elements,
+            "n_bytes": self.n_bytes,
+        }
+
+    def __getitem__(self, key: str):
+        if key != "n_dimensions" and key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, GgufTensorInfo):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    def __repr__(self) -> str:
+        return (f"GgufTensorInfo(name={self.name!r}, dimensions={self.dimensions}, "
+                f"type={self.type!r}, offset={self.offset})")
+
+
+class GgufNumericArray(Sequence):
+    """
+    Read-only view of a GGUF numeric array that decodes elements only when they are accessed.
+
+    Holds a copy of the array's little-endian bytes, a fraction of the size of a list of Python
+    numbers for large arrays such as tokenizer scores and token types.
+    """
+
+    __slots__ = ("_data", "_format")
+
+    def __init__(self, data: bytes, value_format: str) -> None:
+        """
+        Initializes the view over an array's raw bytes.
+
+        Args:
+            data (bytes): Raw little-endian bytes of the array's elements.
+            value_format (str): struct format character of a single element.
+        """
+        self._data = data
+        self._format = value_format
+
+    def __len__(self) -> int:
+        return len(self._data) // struct.calcsize(self._format)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("GGUF array index out of range")
+        return struct.unpack_from("<" + self._format, self._data, index * struct.calcsize(self._format))[0]
+
+    def __iter__(self):
+        for value, in struct.iter_unpack("<" + self._format, self._data):
+            yield value
+
+    def tolist(self) -> list:
+        """
+        Decodes every element.
+
+        Returns:
+            list: The array's values.
+        """
+        return _unpack_array(self._data, self._format, len(self))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, GgufNumericArray):
+            return self._format == other._format and self._data == other._data
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and self.tolist() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"GgufNumericArray(format={self._format!r}, len={len(self)})"
+
+
+class GgufStringArray(Sequence):
+    """
+    Read-only view of a GGUF string array that decodes elements only when they are accessed.
+
+    Holds a copy of the array's raw bytes and the offset of each element's length prefix, which
+    is far smaller than a list of decoded strings for large tokenizer vocabularies.
+    """
+
+    __slots__ = ("_data", "_offsets")
+
+    def __init__(self, data: bytes, offsets: array) -> None:
+        """
+        Initializes the view over an array's raw bytes.
+
+        Args:
+            data (bytes): Raw bytes of the array's elements.
+            offsets (array): Offset of each element's length prefix in `data`, followed by `len(data)`.
+        """
+        self._data = data
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("GGUF string array index out of range")
+        return self._data[self._offsets[index] + 8:self._offsets[index + 1]].decode("utf-8")
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, GgufStringArray):
+            return self._data == other._data
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"GgufStringArray(len={len(self)})"
+
+
+def _unpack_array(raw: bytes, value_format: str, length: int) -> list:
+    """
+    Decodes a little-endian array of fixed-size values.
+
+    Args:
+        raw (bytes): Raw bytes of the array.
+        value_format (str): struct format character of a single element.
+        length (int): Number of elements.
+
+    Returns:
+        list: The decoded values.
+    """
+    if sys.byteorder == "little":
+        return memoryview(raw).cast(value_format).tolist()
+    return list(struct.unpack(f"<{length}{value_format}", raw))
+
+
+def _string_offsets(buf, pos: int, length: int) -> tuple:
+    """
+    Steps over a string array, recording where each element starts.
+
+    Args:
+        buf (mmap.mmap): Memory map of the GGUF file.
+        pos (int): Offset of the first element.
+        length (int): Number of elements.
+
+    Returns:
+        tuple: (offsets relative to `pos` as in `GgufStringArray`, offset just past the array).
+    """
+    unpack_from = UINT64.unpack_from
+    offsets = array("Q")
+    start = pos
+    for _ in range(length):
+        offsets.append(pos - start)
+        pos += 8 + unpack_from(buf, pos)[0]
+    offsets.append(pos - start)
+    return offsets, pos
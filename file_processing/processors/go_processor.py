@@ -1,5 +1,6 @@
-import chardet
-import re
+import os
+from file_processing.code_scanner import scan, GO
+from file_processing.encoding import read_text
 from file_processing.errors import FileProcessingFailedError
 from file_processing.file_processor_strategy import FileProcessorStrategy
 
@@ -12,34 +13,27 @@ class GoFileProcessor(FileProcessorStrategy):
                          'num_functions', 'num_structs', and 'num_interfaces'.
     """
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
-        super().__init__(file_path, open_file)
+    PROCESSOR_VERSION = 2
+
+    def __init__(self, file_path: str, open_file: bool = True,
+                 stat_result: os.stat_result = None) -> None:
+        super().__init__(file_path, open_file, stat_result)
         self.metadata = {'message': 'File was not opened'} if not open_file else {}
 
     def process(self) -> None:
         if not self.open_file:
             return
         try:
-            raw_data = open(self.file_path, 'rb').read()
-            encoding = chardet.detect(raw_data)['encoding'] or 'utf-8'
-
-            with open(self.file_path, 'r', encoding=encoding) as f:
-                text = f.read()
-
-                num_lines = len(text.splitlines())
-
-                num_functions = len(re.findall(r'\bfunc\s+\w+\s*\(', text))
-                num_structs = len(re.findall(r'\btype\s+\w+\s+struct\s*\{', text))
-                num_interfaces = len(re.findall(r'\btype\s+\w+\s+interface\s*\{', text))
-
-                self.metadata.update({
-                    'text': text,
-                    'encoding': encoding,
-                    'num_lines': num_lines,
-                    'num_functions': num_functions,
-                    'num_structs': num_structs,
-                    'num_interfaces': num_interfaces
-                })
+            text, encoding = read_text(self.file_path, default='utf-8')
+
+            num_lines = len(text.splitlines())
+
+            self.metadata.update({
+                'text': text,
+                'encoding': encoding,
+                'num_lines': num_lines,
+                **scan(text, GO)
+            })
 
         except Exception as e:
             raise FileProcessingFailedError(
@@ -1,5 +1,6 @@
-import chardet
-import re
+import os
+from file_processing.code_scanner import scan, H
+from file_processing.encoding import read_text
 from file_processing.errors import FileProcessingFailedError
 from file_processing.file_processor_strategy import FileProcessorStrategy
 
@@ -19,44 +20,27 @@ class HFileProcessor(FileProcessorStrategy):
             'num_comments' (int): Count of single-line and multi-line comments.
     """
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
-        super().__init__(file_path, open_file)
+    PROCESSOR_VERSION = 2
+
+    def __init__(self, file_path: str, open_file: bool = True,
+                 stat_result: os.stat_result = None) -> None:
+        super().__init__(file_path, open_file, stat_result)
         self.metadata = {'message': 'File was not opened'} if not open_file else {}
 
     def process(self) -> None:
         if not self.open_file:
             return
         try:
-            raw_data = open(self.file_path, 'rb').read()
-            encoding = chardet.detect(raw_data)['encoding'] or 'utf-8'
-
-            with open(self.file_path, 'r', encoding=encoding, errors='replace') as f:
-                text = f.read()
+            text, encoding = read_text(self.file_path, errors='replace', default='utf-8')
 
             num_lines = len(text.splitlines())
 
-            # Regex patterns:
-            include_pattern = re.compile(r'^\s*#\s*include\s+["<].*[">]', re.MULTILINE)
-            macro_pattern = re.compile(r'^\s*#\s*define\s+\w+', re.MULTILINE)
-            struct_pattern = re.compile(r'\bstruct\s+\w+', re.MULTILINE)
-            class_pattern = re.compile(r'\bclass\s+\w+', re.MULTILINE)
-            comment_pattern = re.compile(r'(//[^\n]*|/\*.*?\*/)', re.DOTALL)
-
-            num_includes = len(include_pattern.findall(text))
-            num_macros = len(macro_pattern.findall(text))
-            num_structs = len(struct_pattern.findall(text))
-            num_classes = len(class_pattern.findall(text))
-            num_comments = len(comment_pattern.findall(text))
-
+            # Includes, macros, structs, classes and comments in one pass
             self.metadata.update({
                 'text': text,
                 'encoding': encoding,
                 'num_lines': num_lines,
-                'num_includes': num_includes,
-                'num_macros': num_macros,
-                'num_structs': num_structs,
-                'num_classes': num_classes,
-                'num_comments': num_comments,
+                **scan(text, H),
             })
 
         except Exception as e:
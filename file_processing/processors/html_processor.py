@@ -1,4 +1,5 @@
-import chardet
+import os
+from file_processing.encoding import read_text
 from file_processing.file_processor_strategy import FileProcessorStrategy
 from file_processing.errors import FileProcessingFailedError
 
@@ -15,18 +16,22 @@ class HtmlFileProcessor(FileProcessorStrategy):
                          'num_lines', and 'num_words' if the file is opened.
     """
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
+    PROCESSOR_VERSION = 2
+
+    def __init__(self, file_path: str, open_file: bool = True,
+                 stat_result: os.stat_result = None) -> None:
         """
         Initializes the HtmlFileProcessor with the specified file path.
 
         Args:
             file_path (str): Path to the HTML file to process.
             open_file (bool): Indicates whether to open and process the file immediately.
+            stat_result (os.stat_result): Optional precomputed `os.lstat` result or `os.DirEntry`.
 
         Sets:
             metadata (dict): Populated with a message if `open_file` is False, otherwise initialized as empty.
         """
-        super().__init__(file_path, open_file)
+        super().__init__(file_path, open_file, stat_result)
         self.metadata = {'message': 'File was not opened'} if not open_file else {}
 
     def process(self) -> None:
@@ -42,11 +47,9 @@ class HtmlFileProcessor(FileProcessorStrategy):
 
         try:
             # Detect file encoding for accurate text processing
-            encoding = chardet.detect(open(self.file_path, "rb").read())['encoding']
-            with open(self.file_path, 'r', encoding=encoding) as f:
-                text = f.read()
-                lines = text.split('\n')
-                words = text.split()
+            text, encoding = read_text(self.file_path)
+            lines = text.split('\n')
+            words = text.split()
 
             # Populate metadata with extracted content and counts
             self.metadata.update({
@@ -1,3 +1,4 @@
+import os
 import json
 from file_processing.errors import FileProcessingFailedError
 from file_processing.file_processor_strategy import FileProcessorStrategy
@@ -11,18 +12,20 @@ class IpynbFileProcessor(FileProcessorStrategy):
                          and 'num_markdown_cells' if the file is opened.
     """
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
+    def __init__(self, file_path: str, open_file: bool = True,
+                 stat_result: os.stat_result = None) -> None:
         """
         Initializes the IpynbFileProcessor with the specified file path.
 
         Args:
             file_path (str): Path to the .ipynb file to process.
             open_file (bool): Indicates whether to open and process the file immediately.
+            stat_result (os.stat_result): Optional precomputed `os.lstat` result or `os.DirEntry`.
 
         Sets:
             metadata (dict): Populated with a message if `open_file` is False, otherwise initialized as empty.
         """
-        super().__init__(file_path, open_file)
+        super().__init__(file_path, open_file, stat_result)
         self.metadata = {'message': 'File was not opened'} if not open_file else {}
 
     def process(self) -> None:
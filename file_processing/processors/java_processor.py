@@ -1,4 +1,6 @@
-import chardet
+import os
+from file_processing.code_scanner import scan, JAVA
+from file_processing.encoding import read_text
 from file_processing.errors import FileProcessingFailedError
 from file_processing.file_processor_strategy import FileProcessorStrategy
 
@@ -11,18 +13,22 @@ class JavaFileProcessor(FileProcessorStrategy):
                          'num_lines', 'num_characters', 'num_methods', and 'num_classes'.
     """
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
+    PROCESSOR_VERSION = 2
+
+    def __init__(self, file_path: str, open_file: bool = True,
+                 stat_result: os.stat_result = None) -> None:
         """
         Initializes the JavaFileProcessor with the specified file path.
 
         Args:
             file_path (str): Path to the Java file to process.
             open_file (bool): Indicates whether to open and process the file immediately.
+            stat_result (os.stat_result): Optional precomputed `os.lstat` result or `os.DirEntry`.
 
         Sets:
             metadata (dict): Populated with 'message' if `open_file` is False.
         """
-        super().__init__(file_path, open_file)
+        super().__init__(file_path, open_file, stat_result)
         self.metadata = {'message': 'File was not opened'} if not open_file else {}
 
     def process(self) -> None:
@@ -38,31 +44,19 @@ class JavaFileProcessor(FileProcessorStrategy):
         if not self.open_file:
             return
         try:
-            raw_data = open(self.file_path, 'rb').read()
-            encoding = chardet.detect(raw_data)['encoding']
-
-            with open(self.file_path, 'r', encoding=encoding) as f:
-                text = f.read()
-
-                num_lines = len(text.splitlines())
-                num_characters = len(text)
-
-                # Simple method/class counting using regex patterns
-                import re
-                method_pattern = re.compile(r'\b(public|private|protected|static|\s)+\s+\w+\s+\w+\s*\([^\)]*\)\s*\{', re.MULTILINE)
-                class_pattern = re.compile(r'\b(class|interface|enum)\s+\w+', re.MULTILINE)
-
-                num_methods = len(method_pattern.findall(text))
-                num_classes = len(class_pattern.findall(text))
-
-                self.metadata.update({
-                    'text': text,
-                    'encoding': encoding,
-                    'num_lines': num_lines,
-                    'num_characters': num_characters,
-                    'num_methods': num_methods,
-                    'num_classes': num_classes,
-                })
+            text, encoding = read_text(self.file_path)
+
+            num_lines = len(text.splitlines())
+            num_characters = len(text)
+
+            # Method definitions and class/interface/enum declarations, outside comments and strings
+            self.metadata.update({
+                'text': text,
+                'encoding': encoding,
+                'num_lines': num_lines,
+                'num_characters': num_characters,
+                **scan(text, JAVA),
+            })
         except Exception as e:
             raise FileProcessingFailedError(
                 f"Error encountered while processing {self.file_path}: {e}"
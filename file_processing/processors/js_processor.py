@@ -1,5 +1,6 @@
-import chardet
-import re
+import os
+from file_processing.code_scanner import scan, JS
+from file_processing.encoding import read_text
 from file_processing.errors import FileProcessingFailedError
 from file_processing.file_processor_strategy import FileProcessorStrategy
 
@@ -12,8 +13,11 @@ class JsFileProcessor(FileProcessorStrategy):
                          'num_functions', 'num_classes', and 'num_comments'.
     """
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
-        super().__init__(file_path, open_file)
+    PROCESSOR_VERSION = 2
+
+    def __init__(self, file_path: str, open_file: bool = True,
+                 stat_result: os.stat_result = None) -> None:
+        super().__init__(file_path, open_file, stat_result)
         self.metadata = {'message': 'File was not opened'} if not open_file else {}
 
     def process(self) -> None:
@@ -21,36 +25,17 @@ class JsFileProcessor(FileProcessorStrategy):
         if not self.open_file:
             return
         try:
-            raw_data = open(self.file_path, 'rb').read()
-            encoding = chardet.detect(raw_data)['encoding'] or 'utf-8'
-
-            # Read using the detected (or fallback) encoding
-            with open(self.file_path, 'r', encoding=encoding, errors='replace') as f:
-                text = f.read()
+            text, encoding = read_text(self.file_path, errors='replace', default='utf-8')
 
             num_lines = len(text.splitlines())
 
-            # Basic regex patterns:
-            # Matches 'function foo(...) { ... }' or 'export function foo(...) { ... }'
-            function_pattern = re.compile(r'\b(function|export\s+function)\s+[A-Za-z_]\w*\s*\(.*?\)\s*\{')
-
-            # Matches 'class SomeClass { ... }'
-            class_pattern = re.compile(r'\bclass\s+[A-Za-z_]\w*\s*\{?')
-
-            # Matches single-line (// ...) and multi-line (/* ... */) comments
-            comment_pattern = re.compile(r'(//[^\n]*|/\*.*?\*/)', re.DOTALL)
-
-            num_functions = len(function_pattern.findall(text))
-            num_classes = len(class_pattern.findall(text))
-            num_comments = len(comment_pattern.findall(text))
-
+            # Counts 'function foo(...) {' definitions, 'class Foo' declarations and comments,
+            # ignoring anything inside strings, template literals and regular expressions
             self.metadata.update({
                 'text': text,
                 'encoding': encoding,
                 'num_lines': num_lines,
-                'num_functions': num_functions,
-                'num_classes': num_classes,
-                'num_comments': num_comments
+                **scan(text, JS)
             })
 
         except Exception as e:
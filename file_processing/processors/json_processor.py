@@ -1,6 +1,7 @@
+import os
 import json
 from json.decoder import JSONDecodeError
-import chardet
+from file_processing.encoding import read_text
 from file_processing.file_processor_strategy import FileProcessorStrategy
 from file_processing.errors import FileProcessingFailedError, FileCorruptionError
 
@@ -14,18 +15,22 @@ class JsonFileProcessor(FileProcessorStrategy):
                          'key_names', and 'empty_values' if the file is opened.
     """
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
+    PROCESSOR_VERSION = 2
+
+    def __init__(self, file_path: str, open_file: bool = True,
+                 stat_result: os.stat_result = None) -> None:
         """
         Initializes the JsonFileProcessor with the specified file path.
 
         Args:
             file_path (str): Path to the JSON file to process.
             open_file (bool): Indicates whether to open and process the file immediately.
+            stat_result (os.stat_result): Optional precomputed `os.lstat` result or `os.DirEntry`.
 
         Sets:
             metadata (dict): Populated with a message if `open_file` is False, otherwise initialized as empty.
         """
-        super().__init__(file_path, open_file)
+        super().__init__(file_path, open_file, stat_result)
         self.metadata = {'message': 'File was not opened'} if not open_file else {}
 
     def process(self) -> None:
@@ -41,12 +46,8 @@ class JsonFileProcessor(FileProcessorStrategy):
             return
 
         try:
-            # Read binary content and detect encoding
-            with open(self.file_path, 'rb') as f:
-                binary_content = f.read()
-
-            encoding = chardet.detect(binary_content)['encoding']
-            content = binary_content.decode(encoding)
+            # Read binary content once and decode it with the detected encoding
+            content, encoding = read_text(self.file_path, translate_newlines=False)
 
             # Parse JSON data and gather metadata
             data = json.loads(content)
@@ -1,3 +1,4 @@
+import os
 import extract_msg
 import re
 from file_processing.errors import FileProcessingFailedError
@@ -9,8 +10,9 @@ class MsgFileProcessor(FileProcessorStrategy):
       oldest -> next -> ... -> newest
     """
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
-        super().__init__(file_path, open_file)
+    def __init__(self, file_path: str, open_file: bool = True,
+                 stat_result: os.stat_result = None) -> None:
+        super().__init__(file_path, open_file, stat_result)
         self.metadata = {'message': 'File was not opened'} if not open_file else {}
 
     def split_email_thread(self, body_text: str) -> list[str]:
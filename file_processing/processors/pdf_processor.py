@@ -1,31 +1,85 @@
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator
 from pypdf import PdfReader, PdfWriter
 from pypdf.errors import PdfReadError
 from file_processing.errors import FileProcessingFailedError
 from file_processing.file_processor_strategy import FileProcessorStrategy
 
+PROCESSING_LEVELS = ('metadata', 'text', 'full')
+
+# Metadata fields written back to the document information dictionary on save
+INFO_FIELDS = {'author': '/Author', 'producer': '/Producer'}
+
 class PdfFileProcessor(FileProcessorStrategy):
     """
     Processor for handling PDF files, extracting metadata such as text content, author,
     and producer, and handling encrypted PDFs.
 
     Attributes:
-        metadata (dict): Contains metadata fields such as 'text', 'has_password', 'author', and
-                         'producer' if the file is opened.
+        metadata (dict): Contains metadata fields such as 'text', 'has_password', 'author', 'producer'
+                         and 'num_pages' if the file is opened.
+        level (str): 'metadata' reads only the trailer, info dictionary and page count; 'text' also
+                     extracts the page text; 'full' additionally reports every info dictionary entry
+                     and the PDF version.
+        pages (Iterable[int]): Zero-based indexes of the pages whose text is extracted. None extracts all.
+        max_pages (int): Maximum number of pages whose text is extracted.
+        workers (int): Number of processes sharing the text extraction of one document.
     """
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
+    def __init__(self, file_path: str, open_file: bool = True, stat_result: os.stat_result = None,
+                 level: str = 'text', pages: Iterable[int] = None, max_pages: int = None,
+                 workers: int = None) -> None:
         """
         Initializes the PdfFileProcessor with the specified file path.
 
         Args:
             file_path (str): Path to the PDF file to process.
             open_file (bool): Indicates whether to open and process the file immediately.
+            stat_result (os.stat_result): Optional precomputed `os.lstat` result or `os.DirEntry`.
+            level (str): How much of the document to process: 'metadata', 'text' or 'full'.
+            pages (Iterable[int]): Zero-based page indexes to extract text from, e.g. `range(0, 10)`.
+            max_pages (int): Stops text extraction after this many pages.
+            workers (int): Spreads the pages across this many processes when greater than 1.
 
         Sets:
             metadata (dict): Populated with a message if `open_file` is False, otherwise initialized with default values.
+
+        Raises:
+            ValueError: If an unsupported processing level is requested.
         """
-        super().__init__(file_path, open_file)
+        if level not in PROCESSING_LEVELS:
+            raise ValueError(f"Unsupported PDF processing level: {level}. Expected one of {PROCESSING_LEVELS}")
+        super().__init__(file_path, open_file, stat_result)
         self.metadata = {'message': 'File was not opened'} if not open_file else self._default_metadata()
+        self.level = level
+        self.pages = pages if pages is None or isinstance(pages, range) else tuple(pages)
+        self.max_pages = max_pages
+        self.workers = workers
+        self._reader = None
+        self._saved_info = {}
+
+    def __getstate__(self) -> dict:
+        """
+        Drops the cached reader so the processor can be sent to worker processes.
+
+        Returns:
+            dict: The picklable state of the processor.
+        """
+        state = self.__dict__.copy()
+        state['_reader'] = None
+        return state
+
+    def cache_token(self) -> str:
+        """
+        Identifies the extraction logic, including the processing level and selected pages.
+
+        Returns:
+            str: Token for metadata cache keys.
+        """
+        return f"{super().cache_token()}:{self.level}:{self.pages}:{self.max_pages}"
 
     def _default_metadata(self) -> dict:
         """
@@ -52,8 +106,11 @@ class PdfFileProcessor(FileProcessorStrategy):
 
         if not self.open_file:
             return
+        if self.level == 'metadata':
+            return self._process_metadata_only()
 
         try:
+            # Not cached: pinning the parsed document would keep it in memory for the File's lifetime
             reader = PdfReader(self.file_path)
         except Exception as e:
             raise FileProcessingFailedError(
@@ -61,19 +118,76 @@ class PdfFileProcessor(FileProcessorStrategy):
             )
 
         if not reader.is_encrypted:
-            metadata = reader.metadata if reader else {}
+            metadata = reader.metadata or {}
             self.metadata.update({
                 'text': self.extract_text_from_pdf(reader),
                 'author': str(metadata.get('/Author')),
-                'producer': str(metadata.get('/Producer'))
+                'producer': str(metadata.get('/Producer')),
+                'num_pages': len(reader.pages)
             })
+            self._saved_info = {field: self.metadata[field] for field in INFO_FIELDS}
+            if self.level == 'full':
+                self.metadata.update({
+                    'info': {key.lstrip('/'): str(value) for key, value in metadata.items()},
+                    'pdf_version': reader.pdf_header.removeprefix('%PDF-')
+                })
         else:
             self.metadata['has_password'] = True
 
+    def _process_metadata_only(self) -> None:
+        """
+        Extracts the author, producer, page count and encryption status without touching any page.
+
+        The file is handed to `PdfReader` as an open stream rather than a path, so pypdf seeks to
+        the cross-reference table and resolves only the objects it is asked for (the trailer, the
+        info dictionary and the root of the page tree) instead of loading the whole document.
+
+        Raises:
+            FileProcessingFailedError: If the file cannot be opened as a PDF.
+        """
+        try:
+            with open(self.file_path, 'rb') as f:
+                reader = PdfReader(f)
+                if reader.is_encrypted:
+                    self.metadata['has_password'] = True
+                    return
+                metadata = reader.metadata or {}
+                self.metadata.update({
+                    'author': str(metadata.get('/Author')),
+                    'producer': str(metadata.get('/Producer')),
+                    'num_pages': self._page_count(reader)
+                })
+                self._saved_info = {field: self.metadata[field] for field in INFO_FIELDS}
+        except Exception as e:
+            raise FileProcessingFailedError(
+                f"Error encountered while opening {self.file_path}: {e}"
+            )
+
+    @staticmethod
+    def _page_count(reader: PdfReader) -> int:
+        """
+        Reads the page count from the root of the page tree without flattening it.
+
+        Args:
+            reader (PdfReader): Reader for the PDF file.
+
+        Returns:
+            int: Number of pages in the document.
+        """
+        try:
+            return int(reader.trailer['/Root']['/Pages']['/Count'])
+        except (KeyError, TypeError, ValueError):
+            return len(reader.pages)
+
     def save(self, output_path: str = None) -> None:
         """
         Saves the PDF file to the specified output path.
 
+        The document is never rewritten page by page. If 'author' or 'producer' were changed in
+        `metadata`, an incremental update holding the new information dictionary and trailer is
+        appended to the original bytes. Otherwise the file is copied byte for byte (or left
+        untouched when saving over itself).
+
         Args:
             output_path (str): Path to save the PDF file. If None, overwrites the original file.
 
@@ -83,26 +197,136 @@ class PdfFileProcessor(FileProcessorStrategy):
         output_path = output_path or self.file_path
 
         try:
-            pdf_read = PdfReader(self.file_path)
-            if pdf_read.is_encrypted:
-                raise FileProcessingFailedError(
-                    f"Cannot save encrypted PDF {self.file_path} without password."
-                )
-
-            pdf = PdfWriter()
-            for page in pdf_read.pages:
-                pdf.add_page(page)
-
-            with open(output_path, 'wb') as output_pdf:
-                pdf.write(output_pdf)
+            with open(self.file_path, 'rb') as f:
+                if PdfReader(f).is_encrypted:
+                    raise FileProcessingFailedError(
+                        f"Cannot save encrypted PDF {self.file_path} without password."
+                    )
+
+            changes = self._info_changes()
+            if changes:
+                pdf = PdfWriter(self.file_path, incremental=True)
+                pdf.add_metadata({INFO_FIELDS[field]: value for field, value in changes.items()})
+                with open(output_path, 'wb') as output_pdf:
+                    pdf.write(output_pdf)
+            elif os.path.abspath(output_path) != os.path.abspath(self.file_path):
+                shutil.copyfile(self.file_path, output_path)
+
+            if os.path.abspath(output_path) == os.path.abspath(self.file_path):
+                self._saved_info.update(changes)
+                self._reader = None
         except Exception as e:
             raise FileProcessingFailedError(
                 f"Error encountered while saving to {output_path}: {e}"
             )
 
+    def load_cached_metadata(self, metadata: dict) -> None:
+        """
+        Installs previously extracted metadata and records its information dictionary fields as
+        the values in the file, so edits made afterwards are still written by `save`.
+
+        Args:
+            metadata (dict): Metadata produced by `process` for the same content and cache token.
+        """
+        super().load_cached_metadata(metadata)
+        self._saved_info = {field: metadata[field] for field in INFO_FIELDS if field in metadata}
+
+    def _info_changes(self) -> dict:
+        """
+        Compares the information dictionary fields in `metadata` with the values read from the file.
+
+        Returns:
+            dict: The fields of `INFO_FIELDS` whose values were modified, mapped to their new values.
+        """
+        return {
+            field: str(self.metadata[field])
+            for field, original in self._saved_info.items()
+            if field in self.metadata and self.metadata[field] != original
+        }
+
+    def _get_reader(self) -> PdfReader:
+        """
+        Opens the PDF on the first page-level call and reuses the reader for later ones.
+
+        Returns:
+            PdfReader: The reader for this file.
+        """
+        if self._reader is None:
+            self._reader = PdfReader(self.file_path)
+        return self._reader
+
+    @staticmethod
+    def _selected_pages(num_pages: int, pages: Iterable[int] = None, max_pages: int = None) -> list:
+        """
+        Resolves a page selection against the document, dropping out-of-range indexes.
+
+        Args:
+            num_pages (int): Number of pages in the document.
+            pages (Iterable[int]): Zero-based page indexes. None selects every page.
+            max_pages (int): Maximum number of pages to keep.
+
+        Returns:
+            list: The zero-based page indexes to extract, in order.
+        """
+        selected = range(num_pages) if pages is None else (p for p in pages if 0 <= p < num_pages)
+        return list(islice(selected, max_pages))
+
+    def iter_pages(self, pages: Iterable[int] = None, max_pages: int = None) -> Iterator[str]:
+        """
+        Lazily extracts the text of the PDF one page at a time.
+
+        Consumers that stop early (e.g. after finding a keyword) never pay for the remaining pages.
+
+        Args:
+            pages (Iterable[int]): Zero-based page indexes to extract. Defaults to the processor's `pages`.
+            max_pages (int): Maximum number of pages to extract. Defaults to the processor's `max_pages`.
+
+        Yields:
+            str: The text of each selected page, or an empty string if the page has none.
+
+        Raises:
+            FileProcessingFailedError: If the PDF cannot be opened or a page cannot be read.
+        """
+        try:
+            reader = self._get_reader()
+            selected = self._selected_pages(
+                len(reader.pages),
+                self.pages if pages is None else pages,
+                self.max_pages if max_pages is None else max_pages
+            )
+        except Exception as e:
+            raise FileProcessingFailedError(
+                f"Error encountered while extracting text from {self.file_path}: {e}"
+            )
+        for page_number in selected:
+            yield self.page_text(page_number)
+
+    def page_text(self, page_number: int) -> str:
+        """
+        Extracts the text of a single page.
+
+        Args:
+            page_number (int): Zero-based index of the page.
+
+        Returns:
+            str: The text of the page, or an empty string if the page has none.
+
+        Raises:
+            FileProcessingFailedError: If the page does not exist or cannot be read.
+        """
+        try:
+            return _extract_page_text(self._get_reader(), page_number, self.file_path)
+        except Exception as e:
+            raise FileProcessingFailedError(
+                f"Error encountered while extracting text from page {page_number} of {self.file_path}: {e}"
+            )
+
     def extract_text_from_pdf(self, reader: PdfReader) -> str:
         """
-        Extracts text from each page of the PDF.
+        Extracts text from the selected pages of the PDF.
+
+        Page texts are joined once at the end. With `workers` greater than 1, contiguous runs of
+        pages are extracted in separate processes and joined in page order.
 
         Args:
             reader (PdfReader): An instance of `PdfReader` for the PDF file.
@@ -114,18 +338,50 @@ class PdfFileProcessor(FileProcessorStrategy):
             FileProcessingFailedError: If an error occurs while extracting text.
         """
         try:
-            text = ""
-            for page_number, page in enumerate(reader.pages, start=1):
-                try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text
-                except UnboundLocalError as e:
-                    # Log a warning and continue to the next page
-                    print(f"Warning: Failed to extract text from page {page_number} in {self.file_path}: {e}")
-                    continue
-            return text
+            selected = self._selected_pages(len(reader.pages), self.pages, self.max_pages)
+            if self.workers and self.workers > 1 and len(selected) > 1:
+                batch_size = -(-len(selected) // (self.workers * 4))
+                batches = [selected[i:i + batch_size] for i in range(0, len(selected), batch_size)]
+                with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                    texts = pool.map(_extract_page_range, [str(self.file_path)] * len(batches), batches)
+                    return ''.join(''.join(batch) for batch in texts)
+            return ''.join(_extract_page_text(reader, n, self.file_path) for n in selected)
         except Exception as e:
             raise FileProcessingFailedError(
                 f"Error encountered while extracting text from {self.file_path}: {e}"
             )
+
+
+def _extract_page_text(reader: PdfReader, page_number: int, file_path) -> str:
+    """
+    Extracts the text of one page, tolerating pages pypdf fails to decode.
+
+    Args:
+        reader (PdfReader): Reader for the PDF file.
+        page_number (int): Zero-based index of the page.
+        file_path (str): Path of the PDF file, used in warnings.
+
+    Returns:
+        str: The text of the page, or an empty string if it has none or could not be decoded.
+    """
+    try:
+        return reader.pages[page_number].extract_text() or ''
+    except UnboundLocalError as e:
+        # Log a warning and continue to the next page
+        print(f"Warning: Failed to extract text from page {page_number + 1} in {file_path}: {e}")
+        return ''
+
+
+def _extract_page_range(file_path: str, page_numbers: list) -> list:
+    """
+    Extracts the text of several pages inside a worker process, using its own reader.
+
+    Args:
+        file_path (str): Path of the PDF file.
+        page_numbers (list): Zero-based page indexes to extract.
+
+    Returns:
+        list: The text of each page, in the order given.
+    """
+    reader = PdfReader(file_path)
+    return [_extract_page_text(reader, n, file_path) for n in page_numbers]
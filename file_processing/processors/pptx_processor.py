@@ -1,32 +1,54 @@
-from io import BytesIO
+import os
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
 from pptx import Presentation
-import msoffcrypto
-from file_processing.errors import FileProcessingFailedError, FileCorruptionError
+from file_processing.errors import FileProcessingFailedError
 from file_processing.file_processor_strategy import FileProcessorStrategy
+from file_processing.office import find_part, is_encrypted_office_file, relationship_targets, read_core_properties
+
+A = '{http://schemas.openxmlformats.org/drawingml/2006/main}'
+P = '{http://schemas.openxmlformats.org/presentationml/2006/main}'
+R = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+TABLE_URI = 'http://schemas.openxmlformats.org/drawingml/2006/table'
+
+# Paragraph children that carry text, as in python-pptx's `_Paragraph.text`
+PARAGRAPH_CONTENT = {f'{A}r', f'{A}fld', f'{A}br'}
 
 class PptxFileProcessor(FileProcessorStrategy):
     """
     Processor for handling PowerPoint (PPTX) files, extracting metadata such as text content,
     author, last modified by, number of slides, and handling encrypted files.
 
+    Slide text is read by iterparsing the slide parts straight from the zip package, producing the
+    same text as python-pptx without building a `Presentation`; python-pptx is only used by `save`.
+
     Attributes:
         metadata (dict): Contains metadata fields such as 'text', 'author', 'last_modified_by',
                          'num_slides', and 'has_password' if the file is opened.
+        workers (int): Number of processes sharing the slides of one presentation.
     """
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
+    PROCESSOR_VERSION = 2
+
+    def __init__(self, file_path: str, open_file: bool = True, stat_result: os.stat_result = None,
+                 workers: int = None) -> None:
         """
         Initializes the PptxFileProcessor with the specified file path.
 
         Args:
             file_path (str): Path to the PPTX file to process.
             open_file (bool): Indicates whether to open and process the file immediately.
+            stat_result (os.stat_result): Optional precomputed `os.lstat` result or `os.DirEntry`.
+            workers (int): Spreads the slides across this many processes when greater than 1.
 
         Sets:
             metadata (dict): Populated with a message if `open_file` is False, otherwise initialized with default values.
         """
-        super().__init__(file_path, open_file)
+        super().__init__(file_path, open_file, stat_result)
         self.metadata = {'message': 'File was not opened'} if not open_file else self._default_metadata()
+        self.workers = workers
 
     def _default_metadata(self) -> dict:
         """
@@ -57,30 +79,25 @@ class PptxFileProcessor(FileProcessorStrategy):
             return
 
         with open(self.file_path, 'rb') as f:
-            file_content = BytesIO(f.read())
-
-        try:
-            office_file = msoffcrypto.OfficeFile(file_content)
-            if office_file.is_encrypted():
+            if is_encrypted_office_file(f):
                 self.metadata["has_password"] = True
                 return
-        except Exception as e:
-            raise FileCorruptionError(
-                f"File is corrupted: {self.file_path}"
-            ) from e
-
-        try:
-            ppt = Presentation(file_content)
-            self.metadata.update({
-                'text': self.extract_text_from_pptx(ppt),
-                'author': ppt.core_properties.author,
-                'last_modified_by': ppt.core_properties.last_modified_by,
-                "num_slides": len(ppt.slides),
-            })
-        except Exception as e:
-            raise FileProcessingFailedError(
-                f"Error encountered while processing {self.file_path}: {e}"
-            )
+            try:
+                with zipfile.ZipFile(f) as package:
+                    slide_parts = slide_part_names(package)
+                    if self.workers and self.workers > 1 and len(slide_parts) > 1:
+                        slide_texts = self._extract_slides_in_parallel(slide_parts)
+                    else:
+                        slide_texts = [slide_text(package, part_name) for part_name in slide_parts]
+                    self.metadata.update({
+                        'text': '\n'.join(text for text in slide_texts if text is not None),
+                        "num_slides": len(slide_parts),
+                        **read_core_properties(package)
+                    })
+            except Exception as e:
+                raise FileProcessingFailedError(
+                    f"Error encountered while processing {self.file_path}: {e}"
+                )
 
     def save(self, output_path: str = None) -> None:
         """
@@ -109,34 +126,160 @@ class PptxFileProcessor(FileProcessorStrategy):
                 f"Error encountered while saving to {save_path}: {e}"
             )
 
-    @staticmethod
-    def extract_text_from_pptx(ppt: Presentation) -> str:
+    def _extract_slides_in_parallel(self, slide_parts: list) -> list:
         """
-        Extracts text from each slide in the PPTX file, including text from tables.
+        Extracts slide texts in a process pool, one contiguous run of slides per task.
 
         Args:
-            ppt (Presentation): An instance of `Presentation` representing the PPTX file.
+            slide_parts (list): Slide part names in presentation order.
 
         Returns:
-            str: Extracted text from the PPTX slides.
+            list: The text of each slide (None for slides without text entries), in order.
+        """
+        batch_size = -(-len(slide_parts) // (self.workers * 4))
+        batches = [slide_parts[i:i + batch_size] for i in range(0, len(slide_parts), batch_size)]
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            results = pool.map(_extract_slide_batch, [str(self.file_path)] * len(batches), batches)
+            return [text for batch in results for text in batch]
+
+    def iter_slides(self) -> Iterator[str]:
+        """
+        Lazily yields the text of each slide in presentation order.
+
+        Yields:
+            str: The text of one slide; shape texts and table rows are separated by newlines.
 
         Raises:
-            FileProcessingFailedError: If an error occurs while extracting text from the PPTX file.
+            FileProcessingFailedError: If the file is not a readable .pptx package.
         """
         try:
-            full_text = []
-            for slide in ppt.slides:
-                for shape in slide.shapes:
-                    if hasattr(shape, "text"):
-                        full_text.append(shape.text)
-                    if shape.has_table:
-                        for r in shape.table.rows:
-                            s = ""
-                            for c in r.cells:
-                                s += c.text_frame.text + " | "
-                            full_text.append(s)
-            return '\n'.join(full_text)
-        except Exception as e:
+            with zipfile.ZipFile(self.file_path) as package:
+                for part_name in slide_part_names(package):
+                    yield slide_text(package, part_name) or ''
+        except (zipfile.BadZipFile, KeyError, ET.ParseError) as e:
             raise FileProcessingFailedError(
-                f"Error encountered while extracting text from pptx: {e}"
+                f"Error encountered while processing {self.file_path}: {e}"
             )
+
+
+def slide_part_names(package: zipfile.ZipFile) -> list:
+    """
+    Lists the slide parts of a presentation in presentation order (`p:sldIdLst`).
+
+    Args:
+        package (zipfile.ZipFile): The open .pptx package.
+
+    Returns:
+        list: Slide part names, e.g. ['ppt/slides/slide1.xml', ...].
+    """
+    presentation_part = find_part(package, 'officeDocument', default='ppt/presentation.xml')
+    targets = relationship_targets(package, presentation_part)
+    root = ET.fromstring(package.read(presentation_part))
+    return [targets[slide_id.get(f'{R}id')] for slide_id in root.iter(f'{P}sldId')]
+
+
+def paragraph_text(paragraph: ET.Element) -> str:
+    """
+    Returns the text of an `a:p` element the way python-pptx's `_Paragraph.text` does.
+
+    Args:
+        paragraph (Element): The `a:p` element.
+
+    Returns:
+        str: Run and field text, with a vertical tab for each line break.
+    """
+    parts = []
+    for child in paragraph:
+        if child.tag == f'{A}br':
+            parts.append('\v')
+        elif child.tag in PARAGRAPH_CONTENT:
+            t = child.find(f'{A}t')
+            parts.append((t.text or '') if t is not None else '')
+    return ''.join(parts)
+
+
+def text_body_text(text_body: ET.Element) -> str:
+    """
+    Returns the text of a `p:txBody`/`a:txBody` element, one line per paragraph.
+
+    Args:
+        text_body (Element): The text body element, or None.
+
+    Returns:
+        str: The text of the text frame ('' when there is no text body).
+    """
+    if text_body is None:
+        return ''
+    return '\n'.join(paragraph_text(p) for p in text_body.iterfind(f'{A}p'))
+
+
+def shape_text_entries(shape: ET.Element) -> list:
+    """
+    Returns the text entries python-pptx-based extraction produced for a top-level shape.
+
+    Autoshapes and placeholders (`p:sp`) contribute their text frame, even when empty. Table
+    frames contribute one entry per row, with every cell followed by ' | '. Other shapes, including
+    groups, pictures and connectors, contribute nothing.
+
+    Args:
+        shape (Element): A direct child of the slide's `p:spTree`.
+
+    Returns:
+        list: The text entries of the shape.
+    """
+    if shape.tag == f'{P}sp':
+        return [text_body_text(shape.find(f'{P}txBody'))]
+    if shape.tag == f'{P}graphicFrame':
+        graphic_data = shape.find(f'{A}graphic/{A}graphicData')
+        if graphic_data is not None and graphic_data.get('uri') == TABLE_URI:
+            return [
+                ''.join(text_body_text(cell.find(f'{A}txBody')) + ' | ' for cell in row.iterfind(f'{A}tc'))
+                for row in graphic_data.iterfind(f'{A}tbl/{A}tr')
+            ]
+    return []
+
+
+def slide_text(package: zipfile.ZipFile, part_name: str) -> str:
+    """
+    Streams a slide part and returns its text.
+
+    Each top-level shape is converted and discarded as soon as it has been parsed.
+
+    Args:
+        package (zipfile.ZipFile): The open .pptx package.
+        part_name (str): Name of the slide part.
+
+    Returns:
+        str: The slide's text entries joined by newlines, or None if the slide has no entries.
+    """
+    entries = []
+    depth = 0
+    tree = None
+    with package.open(part_name) as stream:
+        for event, element in ET.iterparse(stream, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                if element.tag == f'{P}spTree' and tree is None:
+                    tree, tree_depth = element, depth
+                continue
+
+            if tree is not None and depth == tree_depth + 1:
+                entries.extend(shape_text_entries(element))
+                tree.remove(element)
+            depth -= 1
+    return '\n'.join(entries) if entries else None
+
+
+def _extract_slide_batch(file_path: str, part_names: list) -> list:
+    """
+    Extracts the text of several slides inside a worker process.
+
+    Args:
+        file_path (str): Path of the .pptx file.
+        part_names (list): Slide part names to extract.
+
+    Returns:
+        list: The text of each slide as returned by `slide_text`, in the order given.
+    """
+    with zipfile.ZipFile(file_path) as package:
+        return [slide_text(package, part_name) for part_name in part_names]
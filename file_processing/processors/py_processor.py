@@ -1,53 +1,78 @@
+import os
 import ast
 import shutil
+from file_processing.cache import ContentSummaryCache
 from file_processing.errors import FileProcessingFailedError
 from file_processing.file_processor_strategy import FileProcessorStrategy
 
+# Fields of the AST that hold nested statements; definitions and imports can't appear elsewhere
+STATEMENT_FIELDS = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+
+
 class PyFileProcessor(FileProcessorStrategy):
     """
     Processor for handling Python (.py) files, extracting metadata such as line count,
     function count, class count, imports, docstrings, and full text content.
 
+    The AST is summarised in a single visit that only descends through statements, never into
+    expressions. With `summary_cache`, the summary is stored under the hash of the file's content,
+    so unchanged files are not parsed again, even after a checkout changes their modification time.
+
     Attributes:
         metadata (dict): Contains metadata fields such as 'num_lines', 'num_functions',
-                         'num_classes', 'imports', 'docstrings', and 'text' if the file is opened.
+                         'num_async_functions', 'num_classes', 'imports', 'docstrings',
+                         'decorators', 'top_level_symbols' and 'text' if the file is opened.
+        summary_cache (ContentSummaryCache): Cache of AST summaries, or None.
     """
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
+    PROCESSOR_VERSION = 3
+
+    def __init__(self, file_path: str, open_file: bool = True,
+                 stat_result: os.stat_result = None, summary_cache=None) -> None:
         """
         Initializes the PyFileProcessor with the specified file path.
 
         Args:
             file_path (str): Path to the Python file to process.
             open_file (bool): Indicates whether to open and process the file immediately.
+            stat_result (os.stat_result): Optional precomputed `os.lstat` result or `os.DirEntry`.
+            summary_cache (ContentSummaryCache | str): Cache, or cache directory, of AST summaries
+                                                       keyed by content hash.
 
         Sets:
             metadata (dict): Populated with a message if `open_file` is False, otherwise initialized with default values.
         """
-        super().__init__(file_path, open_file)
+        super().__init__(file_path, open_file, stat_result)
         self.metadata = {'message': 'File was not opened'} if not open_file else self._default_metadata()
+        if summary_cache is not None and not isinstance(summary_cache, ContentSummaryCache):
+            summary_cache = ContentSummaryCache(summary_cache)
+        self.summary_cache = summary_cache
 
     def _default_metadata(self) -> dict:
         """
         Returns default metadata for an unopened Python file.
 
         Returns:
-            dict: Default metadata with 'num_lines', 'num_functions', 'num_classes',
-                  'imports', 'docstrings', and 'text' fields.
+            dict: Default metadata with 'num_lines', 'num_functions', 'num_async_functions',
+                  'num_classes', 'imports', 'docstrings', 'decorators', 'top_level_symbols',
+                  and 'text' fields.
         """
         return {
             'num_lines': 0,
             'num_functions': 0,
+            'num_async_functions': 0,
             'num_classes': 0,
             'imports': [],
             'docstrings': [],
+            'decorators': [],
+            'top_level_symbols': [],
             'text': None
         }
 
     def process(self) -> None:
         """
         Extracts metadata from the Python file, including line count, function count,
-        class count, imports, docstrings, and full text content.
+        class count, imports, docstrings, decorators, top-level symbols and full text content.
 
         Raises:
             FileProcessingFailedError: If an error occurs during Python file processing.
@@ -56,36 +81,44 @@ class PyFileProcessor(FileProcessorStrategy):
             return
 
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                self.metadata['num_lines'] = len(content.splitlines())
-                self.metadata['text'] = content
-                ast_tree = ast.parse(content)
-                self._extract_metadata(ast_tree)
+            with open(self.file_path, 'rb') as f:
+                data = f.read()
+            content = data.decode('utf-8')
+            if '\r' in content:
+                # Universal newlines, as when reading in text mode
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            self.metadata['num_lines'] = len(content.splitlines())
+            self.metadata['text'] = content
+
+            summary = None
+            if self.summary_cache is not None:
+                digest = self.summary_cache.digest(data)
+                summary = self.summary_cache.get(self.cache_token(), digest)
+            if summary is None:
+                summary = self._extract_metadata(ast.parse(content))
+                if self.summary_cache is not None:
+                    self.summary_cache.set(self.cache_token(), digest, summary)
+            self.metadata.update(summary)
         except Exception as e:
             raise FileProcessingFailedError(
                 f"Error encountered while processing {self.file_path}: {e}"
             )
 
-    def _extract_metadata(self, ast_tree) -> None:
+    def _extract_metadata(self, ast_tree) -> dict:
         """
-        Extracts metadata from the abstract syntax tree (AST) of the Python file,
-        counting functions, classes, and collecting imports and docstrings.
+        Summarises the abstract syntax tree (AST) of the Python file in a single visit,
+        counting functions and classes, and collecting imports, docstrings, decorators and
+        top-level symbols.
 
         Args:
             ast_tree (AST): The abstract syntax tree of the Python file content.
+
+        Returns:
+            dict: The summary fields of the metadata.
         """
-        for node in ast.walk(ast_tree):
-            if isinstance(node, ast.FunctionDef):
-                self.metadata['num_functions'] += 1
-                if node.body and isinstance(node.body[0], ast.Expr) and isinstance(node.body[0].value, ast.Str):
-                    self.metadata['docstrings'].append(node.body[0].value.s)
-            elif isinstance(node, ast.ClassDef):
-                self.metadata['num_classes'] += 1
-                if node.body and isinstance(node.body[0], ast.Expr) and isinstance(node.body[0].value, ast.Str):
-                    self.metadata['docstrings'].append(node.body[0].value.s)
-            elif isinstance(node, ast.Import) or isinstance(node, ast.ImportFrom):
-                self.metadata['imports'].append(ast.unparse(node))
+        visitor = _SummaryVisitor()
+        visitor.visit(ast_tree)
+        return visitor.summary
 
     def save(self, output_path: str = None) -> None:
         """
@@ -105,3 +138,98 @@ class PyFileProcessor(FileProcessorStrategy):
             raise FileProcessingFailedError(
                 f"Error encountered while saving to {output_path}: {e}"
             )
+
+
+class _SummaryVisitor(ast.NodeVisitor):
+    """
+    Collects the summary of a module in one pass over its statements.
+
+    Only statement-holding fields are visited: function and class definitions and imports are
+    statements, so skipping expressions, which make up most of the tree, loses nothing.
+
+    Attributes:
+        summary (dict): The collected summary fields.
+    """
+
+    def __init__(self) -> None:
+        self.summary = {
+            'num_functions': 0,
+            'num_async_functions': 0,
+            'num_classes': 0,
+            'imports': [],
+            'docstrings': [],
+            'decorators': [],
+            'top_level_symbols': [],
+        }
+
+    def visit_Module(self, node: ast.Module) -> None:
+        symbols = self.summary['top_level_symbols']
+        for statement in node.body:
+            if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                symbols.append(statement.name)
+            elif isinstance(statement, ast.Assign):
+                for target in statement.targets:
+                    symbols.extend(_assigned_names(target))
+            elif isinstance(statement, (ast.AnnAssign, ast.AugAssign)):
+                symbols.extend(_assigned_names(statement.target))
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self.summary['num_functions'] += 1
+        self._visit_definition(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        # Counted separately so 'num_functions' keeps its meaning
+        self.summary['num_async_functions'] += 1
+        self._visit_definition(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.summary['num_classes'] += 1
+        self._visit_definition(node)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        self.summary['imports'].append(ast.unparse(node))
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        self.summary['imports'].append(ast.unparse(node))
+
+    def _visit_definition(self, node) -> None:
+        """
+        Records the decorators and docstring of a definition, then visits its body.
+
+        Args:
+            node (ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef): The definition.
+        """
+        for decorator in node.decorator_list:
+            # '@app.route("/")' is recorded as 'app.route'
+            self.summary['decorators'].append(
+                ast.unparse(decorator.func if isinstance(decorator, ast.Call) else decorator)
+            )
+        docstring = ast.get_docstring(node, clean=False)
+        if docstring is not None:
+            self.summary['docstrings'].append(docstring)
+        self.generic_visit(node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        for field in STATEMENT_FIELDS:
+            for child in getattr(node, field, ()):
+                self.visit(child)
+
+
+def _assigned_names(target: ast.AST) -> list:
+    """
+    Lists the names bound by an assignment target, unpacking tuples and lists.
+
+    Args:
+        target (ast.AST): The assignment target.
+
+    Returns:
+        list: Bound names; attribute and subscript targets bind none.
+    """
+    if isinstance(target, ast.Name):
+        return [target.id]
+    if isinstance(target, (ast.Tuple, ast.List)):
+        return [name for element in target.elts for name in _assigned_names(element)]
+    if isinstance(target, ast.Starred):
+        return _assigned_names(target.value)
+    return []
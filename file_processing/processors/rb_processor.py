@@ -1,5 +1,6 @@
-import chardet
-import re
+import os
+from file_processing.code_scanner import scan, RUBY
+from file_processing.encoding import read_text
 from file_processing.errors import FileProcessingFailedError
 from file_processing.file_processor_strategy import FileProcessorStrategy
 
@@ -12,34 +13,27 @@ class RbFileProcessor(FileProcessorStrategy):
                          'num_methods', 'num_classes', and 'num_modules'.
     """
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
-        super().__init__(file_path, open_file)
+    PROCESSOR_VERSION = 2
+
+    def __init__(self, file_path: str, open_file: bool = True,
+                 stat_result: os.stat_result = None) -> None:
+        super().__init__(file_path, open_file, stat_result)
         self.metadata = {'message': 'File was not opened'} if not open_file else {}
 
     def process(self) -> None:
         if not self.open_file:
             return
         try:
-            raw_data = open(self.file_path, 'rb').read()
-            encoding = chardet.detect(raw_data)['encoding'] or 'utf-8'
-
-            with open(self.file_path, 'r', encoding=encoding) as f:
-                text = f.read()
-
-                num_lines = len(text.splitlines())
-
-                num_methods = len(re.findall(r'^\s*def\s+\w+', text, re.MULTILINE))
-                num_classes = len(re.findall(r'^\s*class\s+\w+', text, re.MULTILINE))
-                num_modules = len(re.findall(r'^\s*module\s+\w+', text, re.MULTILINE))
-
-                self.metadata.update({
-                    'text': text,
-                    'encoding': encoding,
-                    'num_lines': num_lines,
-                    'num_methods': num_methods,
-                    'num_classes': num_classes,
-                    'num_modules': num_modules
-                })
+            text, encoding = read_text(self.file_path, default='utf-8')
+
+            num_lines = len(text.splitlines())
+
+            self.metadata.update({
+                'text': text,
+                'encoding': encoding,
+                'num_lines': num_lines,
+                **scan(text, RUBY)
+            })
 
         except Exception as e:
             raise FileProcessingFailedError(
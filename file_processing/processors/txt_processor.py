@@ -1,4 +1,5 @@
-import chardet
+import os
+from file_processing.encoding import read_text
 from file_processing.errors import FileProcessingFailedError
 from file_processing.file_processor_strategy import FileProcessorStrategy
 
@@ -12,18 +13,22 @@ class TextFileProcessor(FileProcessorStrategy):
                          'num_lines', and 'num_words' if the file is opened.
     """
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
+    PROCESSOR_VERSION = 2
+
+    def __init__(self, file_path: str, open_file: bool = True,
+                 stat_result: os.stat_result = None) -> None:
         """
         Initializes the TextFileProcessor with the specified file path.
 
         Args:
             file_path (str): Path to the text file to process.
             open_file (bool): Indicates whether to open and process the file immediately.
+            stat_result (os.stat_result): Optional precomputed `os.lstat` result or `os.DirEntry`.
 
         Sets:
             metadata (dict): Populated with a message if `open_file` is False, otherwise initialized as empty.
         """
-        super().__init__(file_path, open_file)
+        super().__init__(file_path, open_file, stat_result)
         self.metadata = {'message': 'File was not opened'} if not open_file else {}
 
     def process(self) -> None:
@@ -39,12 +44,9 @@ class TextFileProcessor(FileProcessorStrategy):
 
         try:
             # Detect encoding and read content
-            encoding = chardet.detect(
-                open(self.file_path, "rb").read())['encoding']
-            with open(self.file_path, 'r', encoding=encoding) as f:
-                text = f.read()
-                lines = text.split('\n')
-                words = text.split()
+            text, encoding = read_text(self.file_path)
+            lines = text.split('\n')
+            words = text.split()
 
             # Update metadata with extracted values
             self.metadata.update({
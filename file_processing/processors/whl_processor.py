@@ -1,3 +1,4 @@
+import os
 import re
 import zipfile
 import shutil
@@ -18,18 +19,20 @@ class WhlFileProcessor(FileProcessorStrategy):
                          'non_optional_dependencies', 'author', and 'build_tag'.
     """
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
+    def __init__(self, file_path: str, open_file: bool = True,
+                 stat_result: os.stat_result = None) -> None:
         """
         Initializes the WhlFileProcessor with the specified file path.
 
         Args:
             file_path (str): Path to the .whl file to process.
             open_file (bool): Indicates whether to open and process the file immediately.
+            stat_result (os.stat_result): Optional precomputed `os.lstat` result or `os.DirEntry`.
 
         Sets:
             metadata (dict): Populated with a message if `open_file` is False, otherwise initialized with default values.
         """
-        super().__init__(file_path, open_file)
+        super().__init__(file_path, open_file, stat_result)
         self.metadata = {'message': 'File was not opened'} if not open_file else self._default_metadata()
 
     def _default_metadata(self) -> dict:
@@ -1,8 +1,8 @@
-from io import BytesIO
+import os
 from openpyxl import load_workbook
-import msoffcrypto
-from file_processing.errors import FileProcessingFailedError, FileCorruptionError
+from file_processing.errors import FileProcessingFailedError
 from file_processing.file_processor_strategy import FileProcessorStrategy
+from file_processing.office import is_encrypted_office_file
 
 class XlsxFileProcessor(FileProcessorStrategy):
     """
@@ -12,21 +12,46 @@ class XlsxFileProcessor(FileProcessorStrategy):
     Attributes:
         metadata (dict): Contains metadata fields including 'active_sheet', 'sheet_names', 'data',
                          'last_modified_by', 'creator', and 'has_password'.
+        read_only (bool): Loads the workbook with openpyxl's streaming read-only mode.
+        sheets (list): Names of the sheets whose rows are extracted into 'data'. None extracts all.
+        max_rows (int): Maximum number of rows extracted per sheet.
+        max_cols (int): Maximum number of columns extracted per row.
     """
 
-    def __init__(self, file_path: str, open_file: bool = True) -> None:
+    def __init__(self, file_path: str, open_file: bool = True, stat_result: os.stat_result = None,
+                 read_only: bool = False, sheets: list = None, max_rows: int = None,
+                 max_cols: int = None) -> None:
         """
         Initializes the XlsxFileProcessor with the specified file path.
 
         Args:
             file_path (str): Path to the .xlsx file to process.
             open_file (bool): Indicates whether to open and process the file immediately.
+            stat_result (os.stat_result): Optional precomputed `os.lstat` result or `os.DirEntry`.
+            read_only (bool): Streams rows with openpyxl's read-only mode instead of loading every cell.
+            sheets (list): Names of the sheets to extract rows from. Defaults to every sheet.
+            max_rows (int): Maximum number of rows extracted per sheet.
+            max_cols (int): Maximum number of columns extracted per row.
 
         Sets:
             metadata (dict): Populated with a message if `open_file` is False, otherwise initialized with default values.
         """
-        super().__init__(file_path, open_file)
+        super().__init__(file_path, open_file, stat_result)
         self.metadata = {'message': 'File was not opened'} if not open_file else self._default_metadata()
+        self.read_only = read_only
+        self.sheets = sheets
+        self.max_rows = max_rows
+        self.max_cols = max_cols
+
+    def cache_token(self) -> str:
+        """
+        Identifies the extraction logic, including the read-only mode, sheet selection and
+        row/column caps.
+
+        Returns:
+            str: Token for metadata cache keys.
+        """
+        return f"{super().cache_token()}:{self.read_only}:{self.sheets}:{self.max_rows}:{self.max_cols}"
 
     def _default_metadata(self) -> dict:
         """
@@ -58,30 +83,57 @@ class XlsxFileProcessor(FileProcessorStrategy):
             return
 
         with open(self.file_path, 'rb') as f:
-            file_content = BytesIO(f.read())
-
-        try:
-            office_file = msoffcrypto.OfficeFile(file_content)
-            if office_file.is_encrypted():
+            if is_encrypted_office_file(f):
                 self.metadata["has_password"] = True
                 return
-        except Exception as e:
-            raise FileCorruptionError(f"File is corrupted: {self.file_path}") from e
+            try:
+                exceldoc = load_workbook(f, read_only=self.read_only)
+                try:
+                    self.metadata.update({
+                        "active_sheet": exceldoc.active.title,
+                        "sheet_names": exceldoc.sheetnames,
+                        "data": self.read_all_data(exceldoc, self.sheets, self.max_rows, self.max_cols),
+                        "last_modified_by": exceldoc.properties.lastModifiedBy,
+                        "creator": exceldoc.properties.creator
+                    })
+                finally:
+                    exceldoc.close()
+            except Exception as e:
+                raise FileProcessingFailedError(
+                    f"Error encountered while processing {self.file_path}: {e}"
+                )
+
+    def iter_rows(self, sheet_name: str = None, max_rows: int = None, max_cols: int = None):
+        """
+        Lazily yields the cell values of a sheet, one row at a time, in read-only mode.
 
+        Only the rows consumed so far are held in memory, so arbitrarily large sheets can be scanned.
+        The workbook is closed once the generator is exhausted or closed.
+
+        Args:
+            sheet_name (str): Name of the sheet to read. Defaults to the active sheet.
+            max_rows (int): Maximum number of rows to yield.
+            max_cols (int): Maximum number of columns per row.
+
+        Yields:
+            tuple: The cell values of one row.
+
+        Raises:
+            FileProcessingFailedError: If the workbook or sheet cannot be read.
+        """
         try:
-            file_content.seek(0)  # Reset the position to the start
-            exceldoc = load_workbook(self.file_path)
-            self.metadata.update({
-                "active_sheet": exceldoc.active.title,
-                "sheet_names": exceldoc.sheetnames,
-                "data": self.read_all_data(exceldoc),
-                "last_modified_by": exceldoc.properties.lastModifiedBy,
-                "creator": exceldoc.properties.creator
-            })
+            exceldoc = load_workbook(self.file_path, read_only=True)
         except Exception as e:
             raise FileProcessingFailedError(
                 f"Error encountered while processing {self.file_path}: {e}"
             )
+        try:
+            sheet = exceldoc[sheet_name] if sheet_name else exceldoc.active
+            yield from sheet.iter_rows(max_row=max_rows, max_col=max_cols, values_only=True)
+        except KeyError as e:
+            raise FileProcessingFailedError(f"Sheet not found in {self.file_path}: {e}")
+        finally:
+            exceldoc.close()
 
     def save(self, output_path: str = None) -> None:
         """
@@ -109,12 +161,15 @@ class XlsxFileProcessor(FileProcessorStrategy):
             )
 
     @staticmethod
-    def read_all_data(exceldoc):
+    def read_all_data(exceldoc, sheets: list = None, max_rows: int = None, max_cols: int = None):
         """
         Reads all data from each sheet in the .xlsx file and returns it as a dictionary.
 
         Args:
             exceldoc (Workbook): An instance of the Excel workbook.
+            sheets (list): Names of the sheets to read. In read-only mode other sheets are never parsed.
+            max_rows (int): Maximum number of rows read per sheet.
+            max_cols (int): Maximum number of columns read per row.
 
         Returns:
             dict: Dictionary with sheet names as keys and lists of rows as values.
@@ -124,12 +179,9 @@ class XlsxFileProcessor(FileProcessorStrategy):
         """
         try:
             data = {}
-            for sheet_name in exceldoc.sheetnames:
+            for sheet_name in sheets or exceldoc.sheetnames:
                 sheet = exceldoc[sheet_name]
-                sheet_data = []
-                for row in sheet.iter_rows(values_only=True):
-                    sheet_data.append(row)
-                data[sheet_name] = sheet_data
+                data[sheet_name] = list(sheet.iter_rows(max_row=max_rows, max_col=max_cols, values_only=True))
             return data
         except Exception as e:
             raise FileProcessingFailedError(
@@ -10,6 +10,7 @@ from mutagen.oggvorbis import OggVorbis
 from mutagen.mp4 import MP4
 from file_processing.errors import FileProcessingFailedError
 from file_processing import File
+from file_processing.processors.audio_processor import AudioFileProcessor
 from file_processing_test_data import get_test_files_path
 
 test_files_path = get_test_files_path()
@@ -150,3 +151,20 @@ def test_audio_copy_integrity_failure(path, tmp_path, monkeypatch):
     with pytest.raises(FileProcessingFailedError) as excinfo:
         file_obj.copy(str(tmp_path / Path(path).name), verify_integrity=True)
     assert "Integrity check failed" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("path", [v[0] for v in values if v[0].suffix in (".mp3", ".mp4", ".flac", ".ogg")])
+def test_update_tags_many(path, tmp_path):
+    copies = [tmp_path / f"copy_{i}{path.suffix}" for i in range(3)]
+    for copy_path in copies:
+        shutil.copyfile(path, copy_path)
+    updates = {copy_path: {'artist': f"Artist {i}"} for i, copy_path in enumerate(copies)}
+    updates[tmp_path / f"missing{path.suffix}"] = {'artist': 'Nobody'}
+
+    results = {result.path: result for result in AudioFileProcessor.update_tags_many(updates, workers=2, max_pending=2)}
+    assert not results.pop(str(tmp_path / f"missing{path.suffix}")).ok
+    assert all(result.ok for result in results.values())
+    for i, copy_path in enumerate(copies):
+        metadata = File(copy_path).metadata
+        assert metadata['artist'] == f"Artist {i}"
+        assert metadata['length'] == File(path).metadata['length']
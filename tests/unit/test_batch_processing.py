@@ -0,0 +1,106 @@
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+import pytest
+from file_processing import File
+from file_processing.batch import group_duplicates
+from file_processing.processors import TextFileProcessor
+from file_processing.errors import FileProcessingFailedError
+from file_processing_test_data import get_test_files_path
+
+test_files_path = get_test_files_path()
+
+batch_paths = [
+    test_files_path / 'government_of_canada_wikipedia.txt',
+    test_files_path / 'usa_government_wikipedia.txt',
+    test_files_path / 'SampleReport.pdf',
+    test_files_path / 'sample.json',
+]
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_process_many_ordered(executor):
+    results = list(File.process_many(batch_paths, workers=2, executor=executor, ordered=True))
+
+    assert [r.path for r in results] == [str(p) for p in batch_paths]
+    for result, path in zip(results, batch_paths):
+        assert result.ok
+        assert result.file.metadata == File(path).metadata
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_process_many_captures_errors(executor):
+    paths = batch_paths + ['/non_existent_folder/missing.txt']
+    results = {r.path: r for r in File.process_many(paths, workers=2, executor=executor)}
+
+    assert set(results) == {str(p) for p in paths}
+    failed = results['/non_existent_folder/missing.txt']
+    assert not failed.ok
+    assert failed.file is None
+    assert isinstance(failed.error, FileProcessingFailedError)
+    assert all(results[str(p)].ok for p in batch_paths)
+
+
+def test_process_many_forwards_file_kwargs():
+    results = list(File.process_many(batch_paths, executor="thread", ordered=True, open_file=False))
+    assert all(r.file.metadata.get('message') == 'File was not opened' for r in results)
+
+
+def test_process_many_invalid_executor():
+    with pytest.raises(ValueError):
+        list(File.process_many(batch_paths, executor="gpu"))
+
+
+def test_group_duplicates(tmp_path):
+    source = test_files_path / 'government_of_canada_wikipedia.txt'
+    copies = [tmp_path / f'copy_{i}.txt' for i in range(3)]
+    for copy_path in copies:
+        shutil.copy(source, copy_path)
+    renamed = tmp_path / 'copy.md'
+    shutil.copy(source, renamed)
+
+    groups = group_duplicates([source, *copies, renamed, batch_paths[1]])
+    assert [str(source), *map(str, copies)] in groups
+    assert [str(renamed)] in groups  # Same bytes, different processor
+    assert [str(batch_paths[1])] in groups
+
+
+
+def test_group_duplicates_on_pool(tmp_path):
+    block = 4096
+    content = bytes(range(256)) * 64
+    paths = []
+    for name, data in [('a.bin', content), ('b.bin', content), ('c.bin', content[:-1] + b'x'),
+                       ('d.bin', content[:8000] + b'x' + content[8001:]), ('e.bin', b'short')]:
+        (tmp_path / name).write_bytes(data)
+        paths.append(str(tmp_path / name))
+    paths.append(str(tmp_path / 'missing.bin'))
+
+    expected = [[paths[0], paths[1]], [paths[2]], [paths[3]], [paths[4]], [paths[5]]]
+    assert sorted(group_duplicates(paths, block)) == sorted(expected)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        with patch.object(pool, 'map', wraps=pool.map) as mock_map:
+            assert sorted(group_duplicates(paths, block, pool=pool)) == sorted(expected)
+        # One batch for the partial digests and one for the full hashes of a, b and d
+        assert mock_map.call_count == 2
+
+def test_process_many_dedup(tmp_path):
+    source = test_files_path / 'government_of_canada_wikipedia.txt'
+    copies = [tmp_path / f'copy_{i}.txt' for i in range(3)]
+    for copy_path in copies:
+        shutil.copy(source, copy_path)
+    paths = [source, *copies, batch_paths[1]]
+
+    original_process = TextFileProcessor.process
+    with patch.object(TextFileProcessor, 'process', autospec=True, side_effect=original_process) as mock_process:
+        results = list(File.process_many(paths, executor="thread", ordered=True, dedup=True))
+        assert mock_process.call_count == 2
+
+    assert sorted(r.path for r in results) == sorted(str(p) for p in paths)
+    expected = File(source).metadata
+    for result in results:
+        assert result.ok
+        assert result.file.file_name == Path(result.path).name
+        if result.path != str(batch_paths[1]):
+            assert result.file.metadata == expected
@@ -0,0 +1,111 @@
+import time
+import pytest
+from file_processing import File
+from file_processing.code_scanner import scan, CPP, H, JS, JAVA, GO, RUBY
+
+CPP_SOURCE = r'''
+#include <vector>
+// class Commented
+int main(int argc, char** argv)
+{
+    const char* filter = "*Test/*";  // not the start of a block comment
+    const char* code = "int fake(int x) {";
+    if (argc) { run(); } else if (argv) { }
+    return 0;
+}
+class Widget { public: int get() const { return 1; } };
+void declared_only(int);
+/* block
+   comment */
+'''
+
+H_SOURCE = '''#ifndef WIDGET_H
+#  include "widget_base.h"
+#include <stdint.h>
+#define WIDGET_SIZE(x) ((x) * 2)  // trailing comment
+typedef struct widget { int a; } widget_t;
+/* struct Commented */
+#endif
+'''
+
+JS_SOURCE = r'''
+function add(a, b) { return a / b; }
+export function run() {}
+const pattern = /\/\/ "not a comment/g;  // real comment
+class Widget extends Base {}
+const template = `function fake() { class Fake`;
+'''
+
+JAVA_SOURCE = '''
+public class Widget implements Runnable {
+    @Override
+    public void run() throws IOException, Foo.BarException {
+        String s = "class Fake";
+        if (ready) { start(); }
+    }
+    private static Widget create(int size) { return new Widget(size); }
+    interface Listener {}
+    enum State { ON, OFF }
+}
+'''
+
+GO_SOURCE = '''
+func main() {}
+func (w *Widget) Method() {}
+type Widget struct { size int }
+type Listener interface { Notify() }
+var source = `func fake() {`
+'''
+
+RUBY_SOURCE = '''
+module Widgets
+  class Widget
+    def size; end
+    def self.create; end
+  end
+end
+# def commented
+=begin
+def documented
+=end
+label = "def quoted"
+'''
+
+
+@pytest.mark.parametrize("source, language, expected", [
+    (CPP_SOURCE, CPP, {'num_functions': 2, 'num_classes': 1, 'num_comments': 3}),
+    (H_SOURCE, H, {'num_includes': 2, 'num_macros': 1, 'num_structs': 1, 'num_classes': 0,
+                   'num_comments': 2}),
+    (JS_SOURCE, JS, {'num_functions': 2, 'num_classes': 1, 'num_comments': 1}),
+    (JAVA_SOURCE, JAVA, {'num_methods': 2, 'num_classes': 3}),
+    (GO_SOURCE, GO, {'num_functions': 1, 'num_structs': 1, 'num_interfaces': 1}),
+    (RUBY_SOURCE, RUBY, {'num_methods': 2, 'num_classes': 1, 'num_modules': 1}),
+])
+def test_scan_skips_strings_and_comments(source, language, expected):
+    assert scan(source, language) == expected
+
+
+@pytest.mark.parametrize("source, language", [
+    ('int f(' * 20000, CPP),
+    ('a(' * 100000 + ')' * 100000, CPP),
+    ('function f(' * 20000, JS),
+    ('public int m(' * 20000, JAVA),
+    ('int x;' + '\n' * 1000000, CPP),
+    ('func f() {}' + ' ' * 1000000, GO),
+    ('def f; end' + '\n' * 1000000, RUBY),
+    ('x=(/[' * 100000, JS),
+    ('x=(/[' * 20000 + '\n', JS),
+])
+def test_scan_is_linear_on_generated_sources(source, language):
+    start = time.perf_counter()
+    scan(source, language)
+    assert time.perf_counter() - start < 5
+
+
+def test_processor_uses_scanner(tmp_path):
+    path = tmp_path / 'widget.cpp'
+    path.write_text(CPP_SOURCE)
+    metadata = File(path).metadata
+
+    assert metadata['num_lines'] == len(CPP_SOURCE.splitlines())
+    assert (metadata['num_functions'], metadata['num_classes'], metadata['num_comments']) == (2, 1, 3)
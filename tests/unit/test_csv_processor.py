@@ -81,3 +81,51 @@ def test_csv_copy_integrity_failure(path, tmp_path, monkeypatch):
     with pytest.raises(FileProcessingFailedError) as excinfo:
         file_obj.copy(str(tmp_path / Path(path).name), verify_integrity=True)
     assert 'Integrity check failed' in str(excinfo.value)
+
+@pytest.mark.parametrize(variable_names, values)
+def test_csv_streaming_metadata(path, text_length, encoding, num_rows, num_cols, num_cells, empty_cells):
+    file_obj = File(path, processor_options={'streaming': True, 'head_rows': 5})
+    assert file_obj.metadata['num_rows'] == num_rows
+    assert file_obj.metadata['num_cols'] == num_cols
+    assert file_obj.metadata['num_cells'] == num_cells
+    assert file_obj.metadata['empty_cells'] == empty_cells
+    assert file_obj.metadata['text'].count('\n') == 4
+
+@pytest.mark.parametrize(variable_names, values)
+def test_csv_chunked_metadata(path, text_length, encoding, num_rows, num_cols, num_cells, empty_cells):
+    options = {'streaming': True, 'chunk_size': 256 * 1024, 'workers': 2}
+    file_obj = File(path, processor_options=options)
+    assert 'text' not in file_obj.metadata
+    assert file_obj.metadata['num_rows'] == num_rows
+    assert file_obj.metadata['num_cols'] == num_cols
+    assert file_obj.metadata['num_cells'] == num_cells
+    assert file_obj.metadata['empty_cells'] == empty_cells
+
+def test_csv_row_boundaries_skip_quoted_newlines(tmp_path):
+    from file_processing.processors.csv_processor import find_row_boundaries
+    path = tmp_path / 'quoted.csv'
+    path.write_bytes(b'id,note\r\n' + b'1,"multi\nline ""quoted"" note"\r\n' * 500)
+
+    boundaries = find_row_boundaries(path, chunk_size=100)
+    assert boundaries[0] == 0 and boundaries[-1] == path.stat().st_size
+    assert len(boundaries) > 2
+    content = path.read_bytes()
+    for offset in boundaries[1:-1]:
+        assert content[offset:].startswith(b'1,"multi\n')
+
+    streamed = File(path, processor_options={'streaming': True, 'chunk_size': 100, 'workers': 2})
+    assert streamed.metadata['num_rows'] == 501
+    assert streamed.metadata['num_cells'] == 1002
+
+@pytest.mark.parametrize("options", [
+    {'streaming': True},
+    {'streaming': True, 'chunk_size': 256 * 1024, 'workers': 2},
+])
+def test_csv_streaming_late_non_ascii_byte(tmp_path, options):
+    path = tmp_path / 'late.csv'
+    path.write_bytes(b'a,b\n' * 300000 + b'caf\xe9,x\n')
+
+    file_obj = File(path, processor_options=options)
+    assert file_obj.metadata['encoding'] == 'Windows-1252'
+    assert file_obj.metadata['num_rows'] == 300001
+    assert file_obj.metadata['num_cells'] == 600002
@@ -89,3 +89,61 @@ def test_save_directory_metadata(temp_directory_with_files):
     with pytest.raises(FileProcessingFailedError):
         # Trying to save to an invalid location
         dir_processor.processor.save("/non_existent_folder/save_file.txt")
+
+# Test the recursive scandir walk and per-subtree aggregates
+def test_summarize_tree(temp_directory_with_files):
+    files_to_copy = [
+        test_files_path / "2021_Census_English.csv",
+        test_files_path / "SampleReport.pdf"
+    ]
+
+    temp_dir = temp_directory_with_files(files_to_copy)
+    nested = temp_dir / "subdir" / "nested"
+    nested.mkdir()
+    (nested / "notes.txt").write_text("nested notes")
+
+    dir_processor = File(str(temp_dir))
+    summary = dir_processor.processor.summarize_tree()
+
+    assert set(summary) == {".", "subdir", "subdir/nested"}
+    assert summary["."]["num_files"] == 3
+    assert summary["."]["extensions"] == {".csv": 1, ".pdf": 1, ".txt": 1}
+    assert summary["subdir"]["num_files"] == 1
+    assert summary["subdir"]["total_size"] == len("nested notes")
+    assert summary["."]["total_size"] == sum(f.stat().st_size for f in temp_dir.rglob("*") if f.is_file())
+    assert summary["."]["newest_mtime"] >= summary["subdir/nested"]["newest_mtime"]
+
+    # Depth-limited summaries stop descending below the top level
+    shallow = dir_processor.processor.summarize_tree(max_depth=0)
+    assert set(shallow) == {"."}
+    assert shallow["."]["num_files"] == 2
+
+# Test that the walk streams entries with their depth
+def test_walk_entries(temp_directory_with_files):
+    temp_dir = temp_directory_with_files([test_files_path / "sample.json"])
+    (temp_dir / "subdir" / "inner.txt").write_text("inner")
+
+    dir_processor = File(str(temp_dir))
+    entries = {entry.name: depth for entry, depth in dir_processor.processor.walk()}
+
+    assert entries == {"sample.json": 0, "subdir": 0, "inner.txt": 1}
+    top_level = {entry.name for entry, _ in dir_processor.processor.walk(max_depth=0)}
+    assert top_level == {"sample.json", "subdir"}
+
+# Test that following symlinks does not loop on a link to an ancestor
+def test_walk_follows_symlinks_without_cycles(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.txt").write_text("b")
+    try:
+        (tmp_path / "sub" / "loop").symlink_to(tmp_path, target_is_directory=True)
+    except OSError:
+        pytest.skip("Symbolic links are not supported")
+
+    processor = File(str(tmp_path)).processor
+    entries = sorted((entry.name, depth) for entry, depth in processor.walk(follow_symlinks=True))
+    assert entries == [("a.txt", 0), ("b.txt", 1), ("loop", 1), ("sub", 0)]
+
+    summary = processor.summarize_tree(follow_symlinks=True)
+    assert set(summary) == {".", "sub"}
+    assert summary["."]["num_files"] == 2
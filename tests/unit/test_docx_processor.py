@@ -98,3 +98,27 @@ def test_docx_copy_integrity_failure(path, tmp_path, monkeypatch):
     with pytest.raises(FileProcessingFailedError) as excinfo:
         file_obj.copy(str(tmp_path / Path(path).name), verify_integrity=True)
     assert "Integrity check failed" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("path", map(lambda x: x[0], values))
+def test_docx_text_matches_python_docx(path):
+    file_obj = File(path)
+    expected = '\n'.join(paragraph.text for paragraph in Document(path).paragraphs)
+    assert file_obj.metadata['text'] == expected
+    assert '\n'.join(file_obj.processor.iter_paragraphs()) == expected
+
+
+@pytest.mark.parametrize("path", map(lambda x: x[0], values))
+def test_docx_tables_headers_footers(path):
+    metadata = File(path).metadata
+    doc = Document(path)
+    assert [len(rows) for rows in metadata['tables']] == [len(table.rows) for table in doc.tables]
+    for key in ('headers', 'footers', 'footnotes'):
+        assert isinstance(metadata[key], str)
+
+
+@pytest.mark.parametrize("path", map(lambda x: x[0], values))
+def test_docx_unencrypted_skips_ole_parse(path):
+    with patch('file_processing.office.msoffcrypto.OfficeFile') as mock_office_file:
+        assert File(path).metadata["has_password"] is False
+        mock_office_file.assert_not_called()
@@ -0,0 +1,69 @@
+import codecs
+from unittest.mock import patch
+import pytest
+from file_processing import File
+from file_processing.encoding import decode_bytes, detect_encoding, read_text
+from file_processing_test_data import get_test_files_path
+
+test_files_path = get_test_files_path()
+
+
+@pytest.mark.parametrize("raw, expected_encoding", [
+    (b"plain ascii text", 'ascii'),
+    ("café crème".encode('utf-8'), 'utf-8'),
+    (codecs.BOM_UTF8 + "café".encode('utf-8'), 'UTF-8-SIG'),
+    ("café".encode('utf-16'), 'UTF-16'),
+    ("café".encode('utf-32'), 'UTF-32'),
+])
+def test_detect_encoding_fast_paths(raw, expected_encoding):
+    with patch('file_processing.encoding.UniversalDetector') as mock_detector:
+        assert detect_encoding(raw) == expected_encoding
+        mock_detector.assert_not_called()
+
+
+def test_decode_bytes_roundtrip():
+    text = "café\r\nligne deux\rligne trois"
+    decoded, encoding = decode_bytes(text.encode('utf-16'), translate_newlines=True)
+    assert encoding == 'UTF-16'
+    assert decoded == "café\nligne deux\nligne trois"
+
+
+def test_detector_sample_is_bounded():
+    raw = ("déjà vu " * 50000).encode('latin-1')
+    with patch('file_processing.encoding.UniversalDetector') as mock_detector:
+        mock_detector.return_value.done = False
+        mock_detector.return_value.result = {'encoding': 'ISO-8859-1'}
+        text, encoding = decode_bytes(raw, sample_size=4096)
+    fed = sum(len(call.args[0]) for call in mock_detector.return_value.feed.call_args_list)
+    assert fed == 4096
+    assert encoding == 'ISO-8859-1'
+    assert text.startswith("déjà vu")
+
+
+def test_late_non_ascii_byte_is_detected():
+    raw = b"a,b\n" * 400000 + b"caf\xe9,x\n"
+    text, encoding = decode_bytes(raw)
+    assert encoding.lower() != 'ascii'
+    assert text.endswith("café,x\n")
+
+
+def test_undecodable_bytes_fall_back():
+    with patch('file_processing.encoding.UniversalDetector') as mock_detector:
+        mock_detector.return_value.done = False
+        mock_detector.return_value.result = {'encoding': 'utf-8'}
+        text, encoding = decode_bytes(b"caf\xe9 \xff")
+    assert (text, encoding) == ("café ÿ", 'Windows-1252')
+
+
+@pytest.mark.parametrize("path", [
+    test_files_path / 'government_of_canada_wikipedia.txt',
+    test_files_path / 'Health - Canada.ca.html',
+])
+def test_processors_read_file_once(path):
+    expected_text, expected_encoding = read_text(path)
+
+    with patch('builtins.open', wraps=open) as mock_open:
+        file_obj = File(path)
+    assert mock_open.call_count == 1
+    assert file_obj.metadata['encoding'] == expected_encoding
+    assert file_obj.metadata['text'] == expected_text
@@ -6,6 +6,7 @@ from pathlib import Path
 import pytest
 from file_processing import File
 from file_processing.errors import FileProcessingFailedError
+from file_processing.processors.exe_processor import byte_counts, byte_entropy
 from file_processing_test_data import get_test_files_path
 
 test_files_path = get_test_files_path()
@@ -83,3 +84,34 @@ def test_exe_copy_integrity_failure(path, tmp_path, monkeypatch):
     with pytest.raises(FileProcessingFailedError) as excinfo:
         file_obj.copy(str(tmp_path / Path(path).name), verify_integrity=True)
     assert "Integrity check failed" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("path", [v[0] for v in values])
+def test_exe_optional_directories(path):
+    default = File(path).metadata
+    assert len(default['imphash']) == 32
+    assert 'exports' not in default and 'resources' not in default
+
+    metadata = File(path, processor_options={'imports': False, 'exports': True, 'resources': True}).metadata
+    assert 'imports' not in metadata and 'imphash' not in metadata
+    assert isinstance(metadata['exports'], list)
+    assert isinstance(metadata['resources'], dict)
+    assert metadata['sections'] == default['sections']
+
+
+@pytest.mark.parametrize("data, expected", [
+    (b'', 0.0),
+    (b'\x00' * 64, 0.0),
+    (bytes(range(256)) * 4, 8.0),
+    (b'ab' * 10, 1.0),
+])
+def test_byte_entropy(data, expected):
+    assert byte_entropy(memoryview(data)) == pytest.approx(expected)
+
+
+def test_byte_counts_without_numpy():
+    data = bytes(range(256)) * 3 + b'\x00' * 100 + b'\xff'
+    counts = byte_counts(memoryview(data))
+    assert counts == [data.count(value) for value in range(256)]
+    with patch('file_processing.processors.exe_processor.numpy', None):
+        assert byte_entropy(b'ab' * 10) == pytest.approx(1.0)
@@ -1,9 +1,13 @@
 import pytest
 import os
+import json
+import pickle
 import shutil
+import struct
+from collections.abc import Sequence
 from pathlib import Path
-from file_processing import File
-from file_processing.processors.gguf_processor import GgufFileProcessor
+from file_processing import File, SqliteMetadataCache
+from file_processing.processors.gguf_processor import GgufFileProcessor, GgufNumericArray, GgufStringArray
 from file_processing.errors import FileProcessingFailedError
 from file_processing_test_data import get_test_files_path
 
@@ -82,7 +86,7 @@ def test_gguf_metadata(file_path, expected_metadata):
         actual_value = file_obj.metadata[key]
         
         if isinstance(expected_value, int):  # Check length for large lists
-            if isinstance(actual_value, list):
+            if isinstance(actual_value, Sequence) and not isinstance(actual_value, str):
                 assert len(actual_value) == expected_value, f"Length mismatch for key: {key}"
             else:
                 assert actual_value == expected_value, f"Value mismatch for key: {key}"
@@ -116,3 +120,113 @@ def test_gguf_copy_integrity_failure(file_path, tmp_path, monkeypatch):
     with pytest.raises(FileProcessingFailedError) as excinfo:
         file_obj.copy(str(tmp_path / Path(file_path).name), verify_integrity=True)
     assert "Integrity check failed" in str(excinfo.value)
+
+
+def _gguf_string(value):
+    encoded = value.encode('utf-8')
+    return struct.pack('<Q', len(encoded)) + encoded
+
+
+def _write_gguf(path, tokens, scores):
+    header = struct.pack('<4sIQQ', b'GGUF', 3, 2, 3)
+    header += _gguf_string('general.name') + struct.pack('<I', 8) + _gguf_string('tiny')
+    header += _gguf_string('tokenizer.ggml.tokens') + struct.pack('<IIQ', 9, 8, len(tokens))
+    header += b''.join(_gguf_string(token) for token in tokens)
+    header += _gguf_string('tokenizer.ggml.scores') + struct.pack('<IIQ', 9, 6, len(scores))
+    header += struct.pack(f'<{len(scores)}f', *scores)
+    header += _gguf_string('weight') + struct.pack('<IQQIQ', 2, 4, 2, 0, 0)
+    header += _gguf_string('bias') + struct.pack('<IQIQ', 1, 2, 1, 32)
+    weight = struct.pack('<8f', *range(8))
+    bias = struct.pack('<2e', 0.5, -0.5)
+    path.write_bytes(header + bytes(-len(header) % 32) + weight + bias)
+    return weight, bias
+
+
+def test_gguf_arrays_decoded_in_bulk(tmp_path):
+    tokens = ['<s>', 'héllo', '', 'wörld']
+    scores = [0.0, -1.5, 2.25, 3.0]
+    path = tmp_path / 'tiny.gguf'
+    _write_gguf(path, tokens, scores)
+
+    processor = GgufFileProcessor(path)
+    processor.process()
+    assert processor.metadata['general.name'] == 'tiny'
+    assert processor.metadata['tokenizer.ggml.scores'] == scores
+    assert processor.metadata['tokenizer.ggml.tokens'] == tokens
+    assert processor.metadata['tokenizer.ggml.tokens'][-1] == 'wörld'
+    assert processor.metadata['tokenizer.ggml.tokens'][1:3] == tokens[1:3]
+    assert processor.metadata['tensors_info'][0]['dimensions'] == (4, 2)
+
+
+def test_gguf_large_arrays_are_lazy(tmp_path):
+    tokens = [f'token{i}' for i in range(2000)]
+    scores = [float(i) for i in range(2000)]
+    path = tmp_path / 'tiny.gguf'
+    _write_gguf(path, tokens, scores)
+
+    processor = GgufFileProcessor(path)
+    processor.process()
+    lazy_tokens = processor.metadata['tokenizer.ggml.tokens']
+    lazy_scores = processor.metadata['tokenizer.ggml.scores']
+    assert isinstance(lazy_tokens, GgufStringArray) and isinstance(lazy_scores, GgufNumericArray)
+    assert lazy_tokens == tokens and lazy_scores == scores
+    assert lazy_scores[-1] == 1999.0 and lazy_scores[10:12] == [10.0, 11.0]
+    assert list(lazy_scores) == lazy_scores.tolist() == scores
+    assert pickle.loads(pickle.dumps(lazy_scores)) == lazy_scores
+
+
+def test_gguf_skip_large_arrays(tmp_path):
+    path = tmp_path / 'tiny.gguf'
+    _write_gguf(path, ['a', 'b', 'c'], [1.0, 2.0, 3.0])
+
+    processor = GgufFileProcessor(path, skip_arrays_larger_than=2)
+    processor.process()
+    assert processor.metadata['tokenizer.ggml.tokens'] == {'array_type': 8, 'array_length': 3}
+    assert processor.metadata['tokenizer.ggml.scores'] == {'array_type': 6, 'array_length': 3}
+    assert processor.metadata['tensors_info'][0]['name'] == 'weight'
+
+
+def test_gguf_tensor_index_and_data(tmp_path):
+    path = tmp_path / 'tiny.gguf'
+    weight, bias = _write_gguf(path, ['a'], [1.0])
+
+    processor = GgufFileProcessor(path)
+    processor.process()
+    try:
+        assert processor.metadata['parameter_count'] == 10
+        assert processor.metadata['tensor_bytes_by_type'] == {'GGML_TYPE_F32': 32, 'GGML_TYPE_F16': 4}
+        assert processor.get_tensor_info('bias').dimensions == (2,)
+        assert processor.tensor_data('weight') == weight
+        assert processor.tensor_data(1).tobytes() == bias
+        with pytest.raises(FileProcessingFailedError):
+            processor.tensor_data('missing')
+    finally:
+        processor.close()
+
+
+def test_gguf_metadata_is_json_serialisable(tmp_path):
+    path = tmp_path / 'tiny.gguf'
+    _write_gguf(path, ['a', 'b'], [1.0, 2.0])
+
+    processor = GgufFileProcessor(path)
+    processor.process()
+    metadata = json.loads(json.dumps(processor.metadata))
+    assert metadata['tensors_info'][0] == {
+        'name': 'weight', 'n_dimensions': 2, 'dimensions': [4, 2], 'type': 'GGML_TYPE_F32',
+        'type_id': 0, 'offset': 0, 'n_elements': 8, 'n_bytes': 32,
+    }
+    assert metadata['tokenizer.ggml.tokens'] == ['a', 'b']
+
+
+def test_gguf_tensor_index_after_cache_hit(tmp_path):
+    path = tmp_path / 'tiny.gguf'
+    weight, bias = _write_gguf(path, ['a'], [1.0])
+    cache = SqliteMetadataCache(tmp_path / 'metadata.db')
+    try:
+        File(path, cache=cache)
+        cached = File(path, cache=cache)
+        assert cached.processor.get_tensor_info('bias').dimensions == (2,)
+        assert cached.processor.tensor_data('weight') == weight
+        cached.processor.close()
+    finally:
+        cache.close()
@@ -73,3 +73,17 @@ def test_gif_copy_integrity_failure(path, tmp_path, monkeypatch):
     with pytest.raises(FileProcessingFailedError) as excinfo:
         file_obj.copy(str(tmp_path / Path(path).name), verify_integrity=True)
     assert "Integrity check failed" in str(excinfo.value)
+
+
+def test_gif_frame_durations(tmp_path):
+    from PIL import Image
+    path = tmp_path / 'animation.gif'
+    frames = [Image.new('RGB', (30, 20), (i * 60, 0, 255 - i * 60)) for i in range(4)]
+    frames[0].save(path, save_all=True, append_images=frames[1:], duration=[10, 20, 30, 40])
+    gif_file = File(path, open_file=False)
+
+    info = gif_file.processor.frame_info()
+    assert [frame['duration'] for frame in info] == [10, 20, 30, 40]
+    assert [frame['index'] for frame in info] == [0, 1, 2, 3]
+    assert [frame.convert('RGB').getpixel((0, 0))[0] for frame in gif_file.processor.iter_frames()] \
+        == [0, 60, 120, 180]
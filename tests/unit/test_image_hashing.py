@@ -0,0 +1,76 @@
+import random
+import pytest
+from PIL import Image, ImageFilter
+from file_processing import File
+from file_processing.image import BKTree, dhash, find_near_duplicates, hamming_distance, phash
+
+
+def _scan(seed, size=(256, 192)):
+    rng = random.Random(seed)
+    noise = Image.frombytes('L', (16, 12), bytes(rng.randrange(256) for _ in range(16 * 12)))
+    image = noise.resize(size, Image.Resampling.BICUBIC).filter(ImageFilter.GaussianBlur(4))
+    return Image.merge('RGB', (image, image.transpose(Image.Transpose.FLIP_LEFT_RIGHT), image))
+
+
+@pytest.fixture
+def scans(tmp_path):
+    paths = {
+        'original': tmp_path / 'original.png',
+        'recompressed': tmp_path / 'recompressed.jpg',
+        'resized': tmp_path / 'resized.jpg',
+        'other': tmp_path / 'other.png',
+        'text': tmp_path / 'notes.txt',
+    }
+    _scan(1).save(paths['original'])
+    _scan(1).save(paths['recompressed'], quality=40)
+    _scan(1, (1024, 768)).save(paths['resized'], quality=85)
+    _scan(2).save(paths['other'])
+    paths['text'].write_text('not an image')
+    return paths
+
+
+def test_perceptual_hash_metadata(scans):
+    file = File(scans['resized'], processor_options={'perceptual_hash': True, 'header_only': True})
+
+    assert file.metadata['width'] == 1024
+    assert len(file.metadata['phash']) == 16
+    assert len(file.metadata['dhash']) == 16
+    assert 'phash' not in File(scans['resized']).metadata
+
+
+def test_hashes_survive_resizing_and_recompression():
+    original = _scan(1)
+    resized = _scan(1, (1024, 768))
+
+    assert hamming_distance(phash(original), phash(resized)) <= 4
+    assert hamming_distance(dhash(original), dhash(resized)) <= 4
+    assert hamming_distance(phash(original), phash(_scan(2))) > 16
+
+
+@pytest.mark.parametrize("hash_type", ["phash", "dhash"])
+def test_find_near_duplicates(scans, hash_type):
+    paths = list(scans.values())
+    groups = find_near_duplicates(paths, max_distance=6, hash_type=hash_type, executor='thread')
+
+    assert groups == [[str(scans['original']), str(scans['recompressed']), str(scans['resized'])]]
+
+
+def test_find_near_duplicates_rejects_unknown_hash_type(scans):
+    with pytest.raises(ValueError):
+        find_near_duplicates(list(scans.values()), hash_type='ahash')
+
+
+def test_bk_tree_matches_brute_force():
+    rng = random.Random(0)
+    hashes = [rng.getrandbits(64) for _ in range(500)]
+    hashes += [h ^ (1 << rng.randrange(64)) for h in hashes[:50]]
+    tree = BKTree()
+    for index, value in enumerate(hashes):
+        tree.add(value, index)
+
+    assert len(tree) == len(hashes)
+    for query in hashes[:20] + [rng.getrandbits(64) for _ in range(20)]:
+        expected = sorted((hamming_distance(query, value), index)
+                          for index, value in enumerate(hashes)
+                          if hamming_distance(query, value) <= 20)
+        assert sorted(tree.search(query, 20)) == expected
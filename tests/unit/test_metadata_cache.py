@@ -0,0 +1,91 @@
+import os
+import shutil
+from unittest.mock import patch
+import pytest
+from file_processing import File, SqliteMetadataCache
+from file_processing.processors import PdfFileProcessor, TextFileProcessor
+from file_processing_test_data import get_test_files_path
+
+test_files_path = get_test_files_path()
+
+txt_paths = [
+    test_files_path / 'government_of_canada_wikipedia.txt',
+    test_files_path / 'usa_government_wikipedia.txt'
+]
+
+
+@pytest.fixture()
+def cache(tmp_path):
+    cache = SqliteMetadataCache(tmp_path / "metadata.db")
+    yield cache
+    cache.close()
+
+
+@pytest.mark.parametrize("path", txt_paths)
+def test_cache_hit_skips_processing(path, cache):
+    expected = File(path, cache=cache).metadata
+    assert len(cache) == 1
+
+    with patch.object(TextFileProcessor, 'process', autospec=True) as mock_process:
+        cached = File(path, cache=cache)
+        mock_process.assert_not_called()
+    assert cached.metadata == expected
+
+
+@pytest.mark.parametrize("path", txt_paths)
+def test_cache_miss_after_modification(path, cache, tmp_path):
+    copy_path = tmp_path / os.path.basename(path)
+    shutil.copy(path, copy_path)
+    File(copy_path, cache=cache)
+
+    with open(copy_path, 'a', encoding='utf-8') as f:
+        f.write("\nappended line")
+
+    updated = File(copy_path, cache=cache)
+    assert updated.metadata['text'].endswith("appended line")
+    assert len(cache) == 1  # The stale signature is replaced, not kept alongside
+
+
+def test_cache_invalidate_and_clear(cache):
+    for path in txt_paths:
+        File(path, cache=cache)
+    assert len(cache) == 2
+
+    assert cache.invalidate(txt_paths[0]) == 1
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_cache_eviction(tmp_path):
+    cache = SqliteMetadataCache(tmp_path / "metadata.db", max_entries=1)
+    for path in txt_paths:
+        File(path, cache=cache)
+    assert len(cache) == 1
+
+    with patch.object(TextFileProcessor, 'process', autospec=True) as mock_process:
+        File(txt_paths[1], cache=cache)
+        mock_process.assert_not_called()
+    cache.close()
+
+
+def test_cache_not_used_when_not_opened(cache):
+    File(txt_paths[0], open_file=False, cache=cache)
+    assert len(cache) == 0
+
+
+def test_save_after_cache_hit_keeps_edits(cache, tmp_path):
+    from pypdf import PdfReader, PdfWriter
+    path = tmp_path / 'report.pdf'
+    writer = PdfWriter()
+    writer.add_blank_page(100, 100)
+    writer.add_metadata({'/Author': 'Original Author'})
+    writer.write(path)
+    File(path, cache=cache)
+
+    with patch.object(PdfFileProcessor, 'process', autospec=True) as mock_process:
+        cached = File(path, cache=cache)
+        mock_process.assert_not_called()
+    cached.metadata['author'] = 'Edited Author'
+    cached.save(tmp_path / 'edited.pdf')
+    assert PdfReader(tmp_path / 'edited.pdf').metadata['/Author'] == 'Edited Author'
@@ -130,3 +130,93 @@ def test_pdf_copy_integrity_failure(path, tmp_path, monkeypatch):
     with pytest.raises(FileProcessingFailedError) as excinfo:
         file_obj.copy(tmp_path / Path(path).name, verify_integrity=True)
     assert "Integrity check failed" in str(excinfo.value)
+
+
+text_paths = [path for path, text_present, *_ in values if text_present]
+
+
+@pytest.mark.parametrize("path", text_paths)
+def test_pdf_iter_pages(path):
+    file_obj = File(str(path))
+    assert file_obj.processor._reader is None
+    page_texts = list(file_obj.processor.iter_pages())
+    assert ''.join(page_texts) == file_obj.metadata['text']
+    assert file_obj.processor.page_text(0) == page_texts[0]
+    assert list(file_obj.processor.iter_pages(max_pages=1)) == page_texts[:1]
+
+
+@pytest.mark.parametrize("path", text_paths)
+def test_pdf_page_selection(path):
+    full = File(str(path))
+    page_texts = list(full.processor.iter_pages())
+    selected = File(str(path), processor_options={'pages': range(1, len(page_texts) + 5), 'max_pages': 2})
+    assert selected.metadata['text'] == ''.join(page_texts[1:3])
+
+
+@pytest.mark.parametrize("path", text_paths)
+def test_pdf_parallel_text_matches_serial(path):
+    serial = File(str(path)).metadata['text']
+    parallel = File(str(path), processor_options={'workers': 2}).metadata['text']
+    assert parallel == serial
+
+
+def test_pdf_page_text_out_of_range():
+    file_obj = File(str(text_paths[0]))
+    with pytest.raises(FileProcessingFailedError):
+        file_obj.processor.page_text(10 ** 6)
+
+
+@pytest.mark.parametrize(variable_names, values)
+def test_pdf_metadata_level(
+    path,
+    text_present,
+    has_password,
+    author,
+    producer,
+    expect_exception_on_process,
+    expect_exception_on_save,
+):
+    options = {'level': 'metadata'}
+    if expect_exception_on_process:
+        with pytest.raises(FileProcessingFailedError):
+            File(str(path), processor_options=options)
+        return
+
+    with patch('pypdf._page.PageObject.extract_text') as mock_extract:
+        metadata = File(str(path), processor_options=options).metadata
+        mock_extract.assert_not_called()
+    assert metadata['has_password'] == has_password
+    assert metadata['text'] is None
+    if not has_password:
+        full = File(str(path), processor_options={'level': 'full'}).metadata
+        assert metadata['num_pages'] == full['num_pages']
+        assert metadata['author'] == full['author']
+        assert metadata['producer'] == full['producer']
+        assert 'info' in full and 'pdf_version' in full
+
+
+def test_pdf_invalid_level():
+    with pytest.raises(ValueError):
+        File(str(text_paths[0]), processor_options={'level': 'everything'})
+
+
+@pytest.mark.parametrize("path", text_paths)
+def test_pdf_save_unmodified_is_byte_copy(path, tmp_path):
+    save_path = tmp_path / Path(path).name
+    File(str(path)).save(str(save_path))
+    assert save_path.read_bytes() == Path(path).read_bytes()
+
+
+@pytest.mark.parametrize("path", text_paths)
+def test_pdf_save_info_change_is_incremental(path, tmp_path):
+    file_obj = File(str(path))
+    file_obj.metadata['author'] = 'New Author'
+    save_path = tmp_path / Path(path).name
+    file_obj.save(str(save_path))
+
+    original_bytes = Path(path).read_bytes()
+    assert save_path.read_bytes().startswith(original_bytes)
+    saved = File(str(save_path)).metadata
+    assert saved['author'] == 'New Author'
+    assert saved['producer'] == file_obj.metadata['producer']
+    assert saved['num_pages'] == file_obj.metadata['num_pages']
@@ -75,3 +75,23 @@ def test_png_copy_integrity_failure(path, tmp_path, monkeypatch):
     with pytest.raises(FileProcessingFailedError) as excinfo:
         file_obj.copy(tmp_path / Path(path).name, verify_integrity=True)
     assert "Integrity check failed" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("path", map(lambda x: x[0], values))
+def test_png_header_only_metadata(path):
+    with patch('PIL.Image.Image.load') as mock_load:
+        header_metadata = File(path, processor_options={'header_only': True}).metadata
+        mock_load.assert_not_called()
+    assert header_metadata == File(path).metadata
+
+
+def test_png_save_without_reencoding(tmp_path):
+    path = test_files_path / 'MapCanada.png'
+    with patch('PIL.Image.Image.save') as mock_save:
+        File(path).save(tmp_path / 'copy.png')
+        mock_save.assert_not_called()
+    assert (tmp_path / 'copy.png').read_bytes() == path.read_bytes()
+
+    File(path).save(tmp_path / 'rotated.png', transform=lambda image: image.rotate(90, expand=True))
+    rotated = File(tmp_path / 'rotated.png').metadata
+    assert (rotated['width'], rotated['height']) == (2408, 3000)
@@ -96,3 +96,29 @@ def test_pptx_copy_integrity_failure(path, tmp_path, monkeypatch):
     with pytest.raises(FileProcessingFailedError) as excinfo:
         file_obj.copy(tmp_path / Path(path).name, verify_integrity=True)
     assert "Integrity check failed" in str(excinfo.value)
+
+
+def python_pptx_text(path):
+    full_text = []
+    for slide in Presentation(path).slides:
+        for shape in slide.shapes:
+            if hasattr(shape, "text"):
+                full_text.append(shape.text)
+            if shape.has_table:
+                for r in shape.table.rows:
+                    full_text.append("".join(c.text_frame.text + " | " for c in r.cells))
+    return '\n'.join(full_text)
+
+
+@pytest.mark.parametrize("path", map(lambda x: x[0], values))
+def test_pptx_text_matches_python_pptx(path):
+    expected = python_pptx_text(path)
+    assert File(path).metadata['text'] == expected
+    assert File(path, processor_options={'workers': 2}).metadata['text'] == expected
+
+
+@pytest.mark.parametrize("path, text_length, num_slides", map(lambda x: x[:3], values))
+def test_pptx_iter_slides(path, text_length, num_slides):
+    slides = list(File(path, open_file=False).processor.iter_slides())
+    assert len(slides) == num_slides
+    assert '\n'.join(text for text in slides if text) == File(path).metadata['text']
@@ -1,3 +1,4 @@
+import os
 from unittest.mock import patch
 import shutil
 import pytest
@@ -70,3 +71,53 @@ def test_py_copy_integrity_failure(path, tmp_path, monkeypatch):
     with pytest.raises(FileProcessingFailedError) as excinfo:
         file_obj.copy(tmp_path / Path(path).name, verify_integrity=True)
     assert "Integrity check failed" in str(excinfo.value)
+
+PY_SOURCE = '''"""Module docstring."""
+import os
+from typing import List
+
+LIMIT, (WIDTH, HEIGHT) = 10, (1, 2)
+names: List[str] = []
+
+@app.route("/")
+async def index():
+    """The index page."""
+    import json
+
+class Widget:
+    """A widget."""
+    @property
+    def size(self):
+        """The size."""
+        return lambda: [x for x in range(3)]
+
+def helper():
+    pass
+'''
+
+def test_python_summary_fields(tmp_path):
+    path = tmp_path / 'widgets.py'
+    path.write_text(PY_SOURCE)
+    metadata = File(path).metadata
+
+    assert metadata['num_functions'] == 2
+    assert metadata['num_async_functions'] == 1
+    assert metadata['num_classes'] == 1
+    assert metadata['imports'] == ['import os', 'from typing import List', 'import json']
+    assert metadata['docstrings'] == ['The index page.', 'A widget.', 'The size.']
+    assert metadata['decorators'] == ['app.route', 'property']
+    assert metadata['top_level_symbols'] == ['LIMIT', 'WIDTH', 'HEIGHT', 'names', 'index', 'Widget', 'helper']
+
+def test_python_summary_cache(tmp_path):
+    path = tmp_path / 'widgets.py'
+    path.write_text(PY_SOURCE)
+    options = {'summary_cache': str(tmp_path / 'cache')}
+    expected = File(path, processor_options=options).metadata
+
+    # Touching the file keeps its content hash, so the summary is served without parsing
+    os.utime(path, ns=(0, 0))
+    with patch('ast.parse', side_effect=AssertionError('parsed')):
+        assert File(path, processor_options=options).metadata == expected
+
+    path.write_text(PY_SOURCE + '\nclass Extra:\n    pass\n')
+    assert File(path, processor_options=options).metadata['num_classes'] == 2
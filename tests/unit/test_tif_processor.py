@@ -70,3 +70,22 @@ def test_tif_copy_integrity_failure(path, tmp_path, monkeypatch):
     with pytest.raises(FileProcessingFailedError) as excinfo:
         file_obj.copy(tmp_path / os.path.basename(path), verify_integrity=True)
     assert "Integrity check failed" in str(excinfo.value)
+
+
+def test_tif_iter_frames(tmp_path):
+    from PIL import Image
+    path = tmp_path / 'fax.tif'
+    pages = [Image.new('L', (100 + i, 50), i * 20) for i in range(5)]
+    pages[0].save(path, save_all=True, append_images=pages[1:])
+    tif_file = File(path, processor_options={'header_only': True})
+
+    assert tif_file.metadata['frames'] == 5
+    info = tif_file.processor.frame_info()
+    assert [page['width'] for page in info] == [100, 101, 102, 103, 104]
+    assert all(page['duration'] is None for page in info)
+
+    frames = tif_file.processor.iter_frames(mode='RGB')
+    first, second = next(frames), next(frames)
+    frames.close()
+    assert (first.mode, first.size, first.getpixel((0, 0))) == ('RGB', (100, 50), (0, 0, 0))
+    assert (second.size, second.getpixel((0, 0))) == ((101, 50), (20, 20, 20))
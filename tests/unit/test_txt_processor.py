@@ -1,9 +1,11 @@
 import os
 import shutil
+import hashlib
 from unittest.mock import patch
 import pytest
 from file_processing import File
 from file_processing.errors import FileProcessingFailedError
+from file_processing.hashing import compute_digests
 from file_processing_test_data import get_test_files_path
 
 test_files_path = get_test_files_path()
@@ -30,6 +32,53 @@ def test_not_opening_file(path, text_length, num_lines, num_words):
         mock_open.assert_not_called()
 
 
+@pytest.mark.parametrize(variable_names, values)
+def test_lazy_processing(path, text_length, num_lines, num_words):
+    file_obj = File(path, lazy=True)
+    assert not file_obj.is_processed
+    assert file_obj.size > 0
+    assert 'text' not in file_obj.processor.metadata
+
+    assert len(file_obj.metadata['text']) == text_length
+    assert file_obj.is_processed
+    assert set(file_obj.processor.CHEAP_FIELDS).isdisjoint(file_obj.processor.EXPENSIVE_FIELDS)
+
+
+@pytest.mark.parametrize("name, content", [
+    ('notes.txt', 'café\nligne deux\n'),
+    ('table.csv', 'id,nom\n1,café\n'),
+])
+def test_lazy_save(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_text(content, encoding='utf-8')
+    file_obj = File(path, lazy=True)
+
+    file_obj.save(tmp_path / f'saved_{name}')
+    assert file_obj.is_processed
+    assert (tmp_path / f'saved_{name}').read_text(encoding='utf-8') == content
+
+
+def test_lazy_save_keeps_edits(tmp_path):
+    path = tmp_path / 'notes.txt'
+    path.write_text('original', encoding='utf-8')
+    file_obj = File(path, lazy=True)
+
+    file_obj.processor.metadata['text'] = 'edited'
+    file_obj.save(tmp_path / 'saved.txt')
+    assert (tmp_path / 'saved.txt').read_text(encoding='utf-8') == 'edited'
+
+
+@pytest.mark.parametrize("path", map(lambda x: x[0], values))
+def test_precomputed_stat_result(path):
+    entry = next(e for e in os.scandir(os.path.dirname(path)) if e.name == os.path.basename(path))
+    with patch('os.lstat', autospec=True) as mock_lstat, patch('os.stat', autospec=True) as mock_stat:
+        file_obj = File(path, open_file=False, stat_result=entry)
+        mock_lstat.assert_not_called()
+        mock_stat.assert_not_called()
+    assert file_obj.size == os.path.getsize(path)
+    assert file_obj.is_file
+
+
 @pytest.mark.parametrize(variable_names, values)
 def test_save_txt_metadata(copy_file, text_length, num_lines, num_words):
     test_txt_metadata(copy_file, text_length, num_lines, num_words)
@@ -69,3 +118,19 @@ def test_txt_copy_integrity_failure(path, tmp_path, monkeypatch):
     with pytest.raises(FileProcessingFailedError) as excinfo:
         file_obj.copy(tmp_path / os.path.basename(path), verify_integrity=True)
     assert "Integrity check failed" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("path", map(lambda x: x[0], values))
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_txt_compute_hashes_single_pass(path, use_mmap):
+    with open(path, 'rb') as f:
+        content = f.read()
+    algorithms = ["md5", "sha1", "sha256", "blake2b"]
+    expected = {a: hashlib.new(a, content).hexdigest() for a in algorithms}
+
+    file_obj = File(path, open_file=False)
+    with patch('file_processing.file_processor_strategy.compute_digests', wraps=compute_digests) as mock_digests:
+        assert file_obj.processor.compute_hashes(algorithms, buffer_size=4096, use_mmap=use_mmap) == expected
+        assert file_obj.processor.compute_hash("md5") == expected["md5"]
+        assert file_obj.hash == expected["sha256"]
+        mock_digests.assert_called_once()
@@ -89,3 +89,44 @@ def test_xlsx_copy_integrity_failure(path, tmp_path, monkeypatch):
     with pytest.raises(FileProcessingFailedError) as excinfo:
         file_obj.copy(tmp_path / os.path.basename(path), verify_integrity=True)
     assert "Integrity check failed" in str(excinfo.value)
+
+
+@pytest.mark.parametrize(variable_names, values)
+def test_xlsx_read_only_metadata(path, sheet_names, active_sheet, data, last_modified_by, creator):
+    file_obj = File(path, processor_options={'read_only': True})
+    assert file_obj.metadata['sheet_names'] == sheet_names
+    assert file_obj.metadata['active_sheet'] == active_sheet
+    assert sum(len(rows) for rows in file_obj.metadata["data"].values()) == data
+    assert file_obj.metadata['last_modified_by'] == last_modified_by
+    assert file_obj.metadata['creator'] == creator
+
+
+@pytest.mark.parametrize("path, sheet_names", map(lambda x: x[:2], values))
+def test_xlsx_sheet_selection_and_caps(path, sheet_names):
+    options = {'read_only': True, 'sheets': sheet_names[:1], 'max_rows': 2, 'max_cols': 1}
+    file_obj = File(path, processor_options=options)
+    assert file_obj.metadata['sheet_names'] == sheet_names
+    assert list(file_obj.metadata['data']) == sheet_names[:1]
+    rows = file_obj.metadata['data'][sheet_names[0]]
+    assert len(rows) <= 2
+    assert all(len(row) <= 1 for row in rows)
+
+
+@pytest.mark.parametrize("path, sheet_names", map(lambda x: x[:2], values))
+def test_xlsx_iter_rows(path, sheet_names):
+    file_obj = File(path)
+    expected = file_obj.metadata['data'][sheet_names[0]]
+    rows = file_obj.processor.iter_rows(sheet_names[0], max_rows=3)
+    assert [row[:len(expected[0])] for row in rows] == expected[:3]
+
+    with pytest.raises(FileProcessingFailedError):
+        list(file_obj.processor.iter_rows('Missing sheet'))
+
+
+def test_xlsx_cache_token_covers_read_only(tmp_path):
+    from openpyxl import Workbook
+    path = tmp_path / 'book.xlsx'
+    Workbook().save(path)
+    tokens = {File(path, open_file=False, processor_options={'read_only': read_only}).processor.cache_token()
+              for read_only in (False, True)}
+    assert len(tokens) == 2